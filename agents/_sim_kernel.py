@@ -0,0 +1,81 @@
+"""
+Similarity kernel for the ResearchAgent semantic query cache.
+
+Finds the cached embedding most similar to a query among the rows of one
+cache namespace. Rows and query are unit-norm float32, so the dot product
+is the cosine similarity. Uses a NumPy matrix-vector product, which
+takes microseconds at the default cache size; a numba-compiled loop is
+used only for caches of at least NUMBA_MIN_ROWS rows when numba (an
+optional extra, not in requirements.txt) is installed.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+# Optional JIT compiler for the scan
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Score given to rows outside the namespace (below any cosine similarity)
+NO_MATCH = -2.0
+
+# Row count from which the JIT loop beats NumPy enough to pay for its
+# one-off compilation (caches default to 512 rows)
+NUMBA_MIN_ROWS = 8192
+
+
+def _best_match_numpy(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    namespaces: np.ndarray,
+    namespace: int
+) -> Tuple[int, float]:
+    similarities = np.where(namespaces == namespace, matrix @ query, NO_MATCH)
+    best = int(similarities.argmax())
+    return best, float(similarities[best])
+
+
+if NUMBA_AVAILABLE:
+    @njit(fastmath=True, cache=True)
+    def _best_match_numba(query, matrix, namespaces, namespace):
+        n, d = matrix.shape
+        best = 0
+        best_score = np.float32(NO_MATCH)
+        for i in range(n):
+            if namespaces[i] == namespace:
+                s = np.float32(0.0)
+                for j in range(d):
+                    s += query[j] * matrix[i, j]
+                if s > best_score:
+                    best = i
+                    best_score = s
+        return best, best_score
+
+
+def best_match(
+    query: np.ndarray,
+    matrix: np.ndarray,
+    namespaces: np.ndarray,
+    namespace: int
+) -> Tuple[int, float]:
+    """
+    Find the most similar row of matrix within a namespace.
+
+    Args:
+        query: Unit-norm query embedding, shape (d,), float32
+        matrix: Unit-norm cached embeddings, shape (n, d), float32, n >= 1
+        namespaces: Namespace id of each row, shape (n,)
+        namespace: Namespace id to search
+
+    Returns:
+        Tuple of (row index, cosine similarity); the similarity is NO_MATCH
+        if no row belongs to the namespace
+    """
+    if NUMBA_AVAILABLE and len(matrix) >= NUMBA_MIN_ROWS:
+        best, score = _best_match_numba(query, matrix, namespaces, namespace)
+        return int(best), float(score)
+    return _best_match_numpy(query, matrix, namespaces, namespace)
@@ -28,6 +28,7 @@ import json  # ← NEW: For parsing LLM JSON responses
 import os    # ← NEW: For environment variables
 
 from rag.retrieval import DocumentRetriever
+from agents.prompts import build_prefix_cached_content
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +37,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared response contract for the LLM compliance checks. It sits in the
+# cached prompt prefix, ahead of the document, so it must not vary per call.
+LLM_CHECK_JSON_RULES = """Evaluate compliance of the document that follows and return findings in STRICTLY VALID JSON format.
+
+CRITICAL JSON RULES:
+1. Use double quotes for all strings
+2. Escape any quotes inside strings with backslash: \\"
+3. Return ONLY the JSON object, no other text
+4. Do not use apostrophes or contractions in strings
+5. Keep issue descriptions under 100 characters
+
+Required JSON schema:
+{
+  "compliant": true or false,
+  "issues": ["Issue 1 without apostrophes", "Issue 2 without quotes"],
+  "severity": "CRITICAL" or "HIGH" or "MEDIUM" or "LOW",
+  "recommendations": ["Fix 1", "Fix 2"]
+}
+
+If compliant, return: {"compliant": true, "issues": [], "severity": "LOW", "recommendations": []}
+"""
+
 
 class ComplianceSeverity(Enum):
     """Severity levels for compliance findings."""
@@ -365,42 +388,28 @@ class ComplianceAgent:
                 return []
             
             # Build evaluation prompt with stricter JSON requirements
-            prompt = f"""You are an expert actuarial compliance reviewer. Evaluate this document for ASOP {asop_num} compliance.
+            requirements_prompt = f"""You are an expert actuarial compliance reviewer. Evaluate this document for ASOP {asop_num} compliance.
 
 ASOP {asop_num} Requirements (from regulatory knowledge base):
 {asop_context}
-
-Document to Evaluate (first 8000 chars):
+"""
+            document_prompt = f"""Document to Evaluate (first 8000 chars):
 {document_content[:8000]}
 
-Evaluate compliance and return findings in STRICTLY VALID JSON format.
-
-CRITICAL JSON RULES:
-1. Use double quotes for all strings
-2. Escape any quotes inside strings with backslash: \\"
-3. Return ONLY the JSON object, no other text
-4. Do not use apostrophes or contractions in strings
-5. Keep issue descriptions under 100 characters
-
-Required JSON schema:
-{{
-  "compliant": true or false,
-  "issues": ["Issue 1 without apostrophes", "Issue 2 without quotes"],
-  "severity": "CRITICAL" or "HIGH" or "MEDIUM" or "LOW",
-  "recommendations": ["Fix 1", "Fix 2"]
-}}
-
-If compliant, return: {{"compliant": true, "issues": [], "severity": "LOW", "recommendations": []}}
-
 Return ONLY valid JSON, no markdown, no explanation.
 """
+            # Static instructions + requirements first, document last, so
+            # re-checks of a revised document reuse the cached prefix
+            content = build_prefix_cached_content(
+                [requirements_prompt, LLM_CHECK_JSON_RULES], document_prompt
+            )
             
             # Call Claude Haiku (cheap, sufficient for compliance checking)
             response = self.client.messages.create(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=1000,
                 temperature=0.1,  # Very low for consistency
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": content}]
             )
             
             # Track cost
@@ -409,7 +418,9 @@ Return ONLY valid JSON, no markdown, no explanation.
                     agent="Compliance Agent",
                     operation=f"ASOP {asop_num} LLM check",
                     input_tokens=response.usage.input_tokens,
-                    output_tokens=response.usage.output_tokens
+                    output_tokens=response.usage.output_tokens,
+                    cache_creation_input_tokens=getattr(response.usage, "cache_creation_input_tokens", 0) or 0,
+                    cache_read_input_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0
                 )
             
             # Parse JSON response using robust parser
@@ -475,42 +486,28 @@ Return ONLY valid JSON, no markdown, no explanation.
                 return []
             
             # Build evaluation prompt with stricter JSON requirements
-            prompt = f"""You are an expert actuarial compliance reviewer. Evaluate this document for NAIC Model Audit Rule (MAR) compliance.
+            requirements_prompt = f"""You are an expert actuarial compliance reviewer. Evaluate this document for NAIC Model Audit Rule (MAR) compliance.
 
 NAIC Model Audit Rule Requirements (from regulatory knowledge base):
 {naic_context}
-
-Document to Evaluate (first 8000 chars):
+"""
+            document_prompt = f"""Document to Evaluate (first 8000 chars):
 {document_content[:8000]}
 
-Evaluate compliance and return findings in STRICTLY VALID JSON format.
-
-CRITICAL JSON RULES:
-1. Use double quotes for all strings
-2. Escape any quotes inside strings with backslash: \\"
-3. Return ONLY the JSON object, no other text
-4. Do not use apostrophes or contractions in strings
-5. Keep issue descriptions under 100 characters
-
-Required JSON schema:
-{{
-  "compliant": true or false,
-  "issues": ["Issue 1 without apostrophes", "Issue 2 without quotes"],
-  "severity": "CRITICAL" or "HIGH" or "MEDIUM" or "LOW",
-  "recommendations": ["Fix 1", "Fix 2"]
-}}
-
-If compliant, return: {{"compliant": true, "issues": [], "severity": "LOW", "recommendations": []}}
-
 Return ONLY valid JSON, no markdown, no explanation.
 """
+            # Static instructions + requirements first, document last, so
+            # re-checks of a revised document reuse the cached prefix
+            content = build_prefix_cached_content(
+                [requirements_prompt, LLM_CHECK_JSON_RULES], document_prompt
+            )
             
             # Call Claude Haiku
             response = self.client.messages.create(
                 model="claude-haiku-4-5-20251001",
                 max_tokens=1000,
                 temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": content}]
             )
             
             # Track cost
@@ -519,7 +516,9 @@ Return ONLY valid JSON, no markdown, no explanation.
                     agent="Compliance Agent",
                     operation="NAIC MAR LLM check",
                     input_tokens=response.usage.input_tokens,
-                    output_tokens=response.usage.output_tokens
+                    output_tokens=response.usage.output_tokens,
+                    cache_creation_input_tokens=getattr(response.usage, "cache_creation_input_tokens", 0) or 0,
+                    cache_read_input_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0
                 )
             
             # Parse JSON response using robust parser
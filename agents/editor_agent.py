@@ -18,7 +18,7 @@ Usage:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Any, List, Dict, Optional, Set
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
@@ -26,6 +26,8 @@ import re
 import json  # ← NEW: For parsing LLM JSON responses
 import os    # ← NEW: For environment variables
 
+from agents.prompts import build_prefix_cached_content
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -358,7 +360,7 @@ class EditorAgent:
             # ============================================================
             # BUILD EVALUATION PROMPT
             # ============================================================
-            prompt = self._build_evaluation_prompt(
+            content = self._build_evaluation_prompt(
                 document=document,
                 document_title=document_title,
                 model_type=model_type,
@@ -377,7 +379,7 @@ class EditorAgent:
                 temperature=0.1,                     # Low temp for consistency
                 messages=[{
                     "role": "user",
-                    "content": prompt
+                    "content": content
                 }]
             )
             
@@ -396,6 +398,8 @@ class EditorAgent:
                     operation=f"Quality evaluation: {document_title}",
                     input_tokens=response.usage.input_tokens,
                     output_tokens=response.usage.output_tokens,
+                    cache_creation_input_tokens=getattr(response.usage, "cache_creation_input_tokens", 0) or 0,
+                    cache_read_input_tokens=getattr(response.usage, "cache_read_input_tokens", 0) or 0,
                     model="sonnet"  # FIXED: LLM-as-judge uses Sonnet 4
                 )
                 logger.info(f"    [COST] Recorded in tracker")
@@ -427,7 +431,7 @@ class EditorAgent:
         exemplar_context: str = "",
         audit_context: str = "",
         source_content: str = ""  # ← NEW: Source PPT for fidelity checking
-    ) -> str:
+    ) -> List[Dict[str, Any]]:
         """
         Build the evaluation prompt for LLM-as-judge.
         
@@ -435,9 +439,13 @@ class EditorAgent:
         - Role definition (expert actuarial reviewer)
         - Context from RAG (exemplars + audit findings)
         - Source content (for fidelity checking)
-        - The document to evaluate
         - Structured 6-dimension rubric (added SOURCE FIDELITY)
         - Output format requirements (JSON)
+        - The document to evaluate
+        
+        Everything except the document is identical across revision
+        iterations, so it is sent as a cached prefix and the document
+        goes last.
         """
         prompt_parts = [
             f"""You are an expert actuarial documentation reviewer.
@@ -472,15 +480,10 @@ SOURCE DOCUMENT (PowerPoint/Original):
 CRITICAL: The generated documentation below should contain the SAME metrics, numbers, dates, sample sizes, and statistics as this source document. Verify fidelity carefully.
 """)
         
-        # Add document to evaluate
-        prompt_parts.append(f"""
-DOCUMENT TO EVALUATE:
-Title: {document_title}
-Content:
-{document}
-
+        # Add rubric (document to evaluate follows at the end)
+        prompt_parts.append("""
 EVALUATION RUBRIC:
-Evaluate on these 6 dimensions (score 1-10 each):
+Evaluate the document at the end of this message on these 6 dimensions (score 1-10 each):
 
 1. SOURCE FIDELITY (1-10) - MOST IMPORTANT
    - Do ALL metrics, numbers, and statistics match the source document above?
@@ -527,25 +530,35 @@ OVERALL ASSESSMENT:
 - Sections Needing Revision: [list section names that need improvement or "None"]
 
 IMPORTANT: Return ONLY valid JSON in this exact format (no markdown, no code blocks):
-{{
-  "scores": {{
+{
+  "scores": {
     "source_fidelity": X.X,
     "technical_accuracy": X.X,
     "completeness": X.X,
     "clarity": X.X,
     "compliance": X.X,
     "professional_tone": X.X
-  }},
+  },
   "overall_score": X.X,
   "ready_for_submission": true/false,
   "critical_issues": ["issue1", "issue2"] or [],
   "recommended_improvements": ["rec1", "rec2", "rec3"],
   "sections_to_revise": ["section1", "section2"] or [],
   "evaluation_details": "Brief explanation of assessment..."
-}}
+}
 """)
         
-        return "\n".join(prompt_parts)
+        # Add document to evaluate (the only part that changes between iterations)
+        document_part = f"""
+DOCUMENT TO EVALUATE:
+Title: {document_title}
+Content:
+{document}
+
+Return ONLY the JSON evaluation described above.
+"""
+        
+        return build_prefix_cached_content(["\n".join(prompt_parts)], document_part)
     
     def _build_context_from_results(
         self,
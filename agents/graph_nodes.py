@@ -10,7 +10,10 @@ LangGraph merges the returned dict into the existing state.
 """
 
 import logging
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from langgraph.types import Send
 
 from config.portfolio_configs import PortfolioRegistry
 
@@ -19,6 +22,10 @@ logger = logging.getLogger(__name__)
 # Initialize shared components (lazy loading)
 _retriever = None
 _registry = None
+_research_agent = None
+_writer_agent = None
+_compliance_agent = None
+_editor_agent = None
 
 
 def get_retriever():
@@ -38,6 +45,89 @@ def get_registry():
     return _registry
 
 
+def get_research_agent():
+    """Lazily initialize the research agent (shared across iterations)."""
+    global _research_agent
+    if _research_agent is None:
+        from agents.research_agent import ResearchAgent
+        _research_agent = ResearchAgent(retriever=get_retriever())
+    return _research_agent
+
+
+def get_writer_agent():
+    """Lazily initialize the writer agent (stateless per call, safe to share)."""
+    global _writer_agent
+    if _writer_agent is None:
+        from agents.writer_agent import WriterAgent
+        _writer_agent = WriterAgent()
+    return _writer_agent
+
+
+def get_compliance_agent():
+    """Lazily initialize the compliance agent (shared across iterations)."""
+    global _compliance_agent
+    if _compliance_agent is None:
+        from agents.compliance_agent import ComplianceAgent
+        _compliance_agent = ComplianceAgent(retriever=get_retriever())
+    return _compliance_agent
+
+
+def get_editor_agent():
+    """Lazily initialize the editor agent (shared across iterations)."""
+    global _editor_agent
+    if _editor_agent is None:
+        from agents.editor_agent import EditorAgent
+        _editor_agent = EditorAgent(retriever=get_retriever(), enable_llm_judge=True)
+    return _editor_agent
+
+
+@dataclass(frozen=True, slots=True)
+class _PhaseInputs:
+    """
+    Read-only view over the state fields used by the review/revision loop.
+
+    Extracted once per node so the hot phases read attributes instead of
+    repeating state.get(key, default) lookups. Each phase requests only
+    the fields it uses; the others stay None.
+    """
+    current_document: Optional[str] = None
+    document_title: Optional[str] = None
+    document_type: Optional[str] = None
+    source_content: Optional[str] = None
+    quality_threshold: Optional[float] = None
+    current_iteration: Optional[int] = None
+    sections_written: Optional[List[Dict[str, Any]]] = None
+    research_contexts: Optional[Dict[str, str]] = None
+    compliance_issues: Optional[List[Dict[str, Any]]] = None
+    editorial_issues: Optional[List[Dict[str, Any]]] = None
+    revision_history: Optional[List[Dict[str, Any]]] = None
+
+
+# Default for each _PhaseInputs field missing from the state (factories, so
+# mutable defaults are never shared between nodes)
+_PHASE_DEFAULTS: Dict[str, Callable[[], Any]] = {
+    "current_document": str,
+    "document_title": str,
+    "document_type": lambda: "model_doc",
+    "source_content": str,
+    "quality_threshold": lambda: 7.0,
+    "current_iteration": int,
+    "sections_written": list,
+    "research_contexts": dict,
+    "compliance_issues": list,
+    "editorial_issues": list,
+    "revision_history": list,
+}
+
+
+def _from_state(state: Dict[str, Any], *fields: str) -> _PhaseInputs:
+    """Build a _PhaseInputs view holding only the given state fields."""
+    return _PhaseInputs(**{
+        name: state[name] if name in state else _PHASE_DEFAULTS[name]()
+        for name in fields
+    })
+
+
 # ============================================================
 # NODE: detect_portfolio
 # ============================================================
@@ -223,9 +313,7 @@ def research_phase(state: Dict[str, Any]) -> Dict[str, Any]:
     sections = state.get("required_sections", [])
     model_type = state.get("detected_model_type", "frequency")
 
-    from agents.research_agent import ResearchAgent
-    retriever = get_retriever()
-    research_agent = ResearchAgent(retriever=retriever)
+    research_agent = get_research_agent()
 
     research_results = {}
     research_contexts = {}
@@ -286,8 +374,7 @@ def writing_phase(state: Dict[str, Any]) -> Dict[str, Any]:
     custom_instructions = state.get("custom_instructions", "")
     document_title = state.get("document_title", "Model Documentation")
 
-    from agents.writer_agent import WriterAgent
-    writer_agent = WriterAgent()
+    writer_agent = get_writer_agent()
 
     sections_written = []
     sections_content = {}
@@ -342,7 +429,7 @@ def writing_phase(state: Dict[str, Any]) -> Dict[str, Any]:
         "current_document": current_document,
         "current_iteration": state.get("current_iteration", 0) + 1,
         "phase": "writing",
-        "next_action": "compliance"
+        "next_action": "review"
     }
 
 
@@ -352,22 +439,22 @@ def writing_phase(state: Dict[str, Any]) -> Dict[str, Any]:
 def compliance_phase(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Check document for regulatory compliance.
+
+    Runs in the same super-step as editorial_phase, so it only writes
+    compliance-specific keys (errors are merged by the state reducer).
     """
     logger.info("[Node: compliance_phase] Checking compliance")
 
-    document = state.get("current_document", "")
-    document_title = state.get("document_title", "")
-    document_type = state.get("document_type", "model_doc")
+    ins = _from_state(state, "current_document", "document_title", "document_type")
 
-    from agents.compliance_agent import ComplianceAgent, ComplianceSeverity
-    retriever = get_retriever()
-    compliance_agent = ComplianceAgent(retriever=retriever)
+    from agents.compliance_agent import ComplianceSeverity
+    compliance_agent = get_compliance_agent()
 
     try:
         report = compliance_agent.check_compliance(
-            document_content=document,
-            document_title=document_title,
-            document_type=document_type
+            document_content=ins.current_document,
+            document_title=ins.document_title,
+            document_type=ins.document_type
         )
 
         # Count issues by severity
@@ -396,9 +483,7 @@ def compliance_phase(state: Dict[str, Any]) -> Dict[str, Any]:
             "compliance_passed": compliance_passed,
             "compliance_issues": compliance_issues,
             "critical_compliance_count": critical_count,
-            "high_compliance_count": high_count,
-            "phase": "compliance",
-            "next_action": "editorial" if compliance_passed else "check_iteration"
+            "high_compliance_count": high_count
         }
 
     except Exception as e:
@@ -409,9 +494,7 @@ def compliance_phase(state: Dict[str, Any]) -> Dict[str, Any]:
             "compliance_issues": [{"description": str(e), "severity": "CRITICAL"}],
             "critical_compliance_count": 1,
             "high_compliance_count": 0,
-            "phase": "compliance",
-            "next_action": "check_iteration",
-            "errors": state.get("errors", []) + [f"Compliance error: {e}"]
+            "errors": [f"Compliance error: {e}"]
         }
 
 
@@ -421,25 +504,26 @@ def compliance_phase(state: Dict[str, Any]) -> Dict[str, Any]:
 def editorial_phase(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     Perform editorial review with LLM-as-judge quality scoring.
+
+    Runs in parallel with compliance_phase on the same draft.
     """
     logger.info("[Node: editorial_phase] Starting editorial review")
 
-    document = state.get("current_document", "")
-    document_title = state.get("document_title", "")
-    document_type = state.get("document_type", "model_doc")
-    source_content = state.get("source_content", "")
-    quality_threshold = state.get("quality_threshold", 7.0)
+    ins = _from_state(
+        state,
+        "current_document", "document_title", "document_type",
+        "source_content", "quality_threshold"
+    )
+    quality_threshold = ins.quality_threshold
 
-    from agents.editor_agent import EditorAgent
-    retriever = get_retriever()
-    editor_agent = EditorAgent(retriever=retriever, enable_llm_judge=True)
+    editor_agent = get_editor_agent()
 
     try:
         review = editor_agent.review_document(
-            document_content=document,
-            document_title=document_title,
-            document_type=document_type,
-            source_content=source_content,
+            document_content=ins.current_document,
+            document_title=ins.document_title,
+            document_type=ins.document_type,
+            source_content=ins.source_content,
             use_llm_judge=True
         )
 
@@ -467,12 +551,6 @@ def editorial_phase(state: Dict[str, Any]) -> Dict[str, Any]:
         logger.info(f"[Node: editorial_phase] Source Fidelity: {source_fidelity:.1f}")
         logger.info(f"[Node: editorial_phase] Passed: {editorial_passed}")
 
-        # Determine next action
-        if editorial_passed:
-            next_action = "complete"
-        else:
-            next_action = "check_iteration"
-
         return {
             "editorial_review": {
                 "quality": review.overall_quality,
@@ -482,9 +560,7 @@ def editorial_phase(state: Dict[str, Any]) -> Dict[str, Any]:
             "quality_score": quality_score,
             "editorial_passed": editorial_passed,
             "editorial_issues": editorial_issues,
-            "source_fidelity_score": source_fidelity,
-            "phase": "editorial",
-            "next_action": next_action
+            "source_fidelity_score": source_fidelity
         }
 
     except Exception as e:
@@ -495,12 +571,33 @@ def editorial_phase(state: Dict[str, Any]) -> Dict[str, Any]:
             "editorial_passed": False,
             "editorial_issues": [{"description": str(e), "priority": "CRITICAL"}],
             "source_fidelity_score": 0.0,
-            "phase": "editorial",
-            "next_action": "check_iteration",
-            "errors": state.get("errors", []) + [f"Editorial error: {e}"]
+            "errors": [f"Editorial error: {e}"]
         }
 
 
+# ============================================================
+# NODE: merge_reviews
+# ============================================================
+def merge_reviews(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Join point for the parallel compliance and editorial checks.
+
+    Both branches have written their results into the state by the time
+    this node runs; it only records the combined outcome.
+    """
+    compliance_passed = state.get("compliance_passed", False)
+    editorial_passed = state.get("editorial_passed", False)
+
+    logger.info(
+        f"[Node: merge_reviews] Compliance: {compliance_passed}, Editorial: {editorial_passed}"
+    )
+
+    return {
+        "phase": "editorial",
+        "next_action": "complete" if (compliance_passed and editorial_passed) else "check_iteration"
+    }
+
+
 # ============================================================
 # NODE: revision_phase
 # ============================================================
@@ -510,15 +607,20 @@ def revision_phase(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     logger.info("[Node: revision_phase] Starting revision")
 
-    sections_written = state.get("sections_written", [])
-    compliance_issues = state.get("compliance_issues", [])
-    editorial_issues = state.get("editorial_issues", [])
-    source_content = state.get("source_content", "")
-    research_contexts = state.get("research_contexts", {})
-    document_title = state.get("document_title", "Model Documentation")
-
-    from agents.writer_agent import WriterAgent, SectionContent
-    writer_agent = WriterAgent()
+    ins = _from_state(
+        state,
+        "document_title", "source_content", "current_iteration", "sections_written",
+        "research_contexts", "compliance_issues", "editorial_issues", "revision_history"
+    )
+    sections_written = ins.sections_written
+    compliance_issues = ins.compliance_issues
+    editorial_issues = ins.editorial_issues
+    source_content = ins.source_content
+    research_contexts = ins.research_contexts
+    document_title = ins.document_title or "Model Documentation"
+
+    from agents.writer_agent import SectionContent
+    writer_agent = get_writer_agent()
 
     # Build revision instructions from issues
     revision_instructions = []
@@ -594,7 +696,7 @@ def revision_phase(state: Dict[str, Any]) -> Dict[str, Any]:
 
     # Record revision
     revision_entry = {
-        "iteration": state.get("current_iteration", 0),
+        "iteration": ins.current_iteration,
         "issues_addressed": len(revision_instructions),
         "sections_revised": len([s for s in revised_sections if s.get("metadata", {}).get("revised")])
     }
@@ -605,11 +707,11 @@ def revision_phase(state: Dict[str, Any]) -> Dict[str, Any]:
         "sections_written": revised_sections,
         "sections_content": sections_content,
         "current_document": current_document,
-        "current_iteration": state.get("current_iteration", 0) + 1,  # Increment to prevent infinite loop
-        "revision_history": state.get("revision_history", []) + [revision_entry],
+        "current_iteration": ins.current_iteration + 1,  # Increment to prevent infinite loop
+        "revision_history": ins.revision_history + [revision_entry],
         "issues_addressed": [i.get("description", "") for i in compliance_issues[:3]],
         "phase": "revision",
-        "next_action": "compliance"  # Loop back to check again
+        "next_action": "review"  # Loop back to check again
     }
 
 
@@ -657,52 +759,35 @@ def handle_failure(state: Dict[str, Any]) -> Dict[str, Any]:
 # ROUTER FUNCTIONS (for conditional edges)
 # ============================================================
 
-def route_after_compliance(state: Dict[str, Any]) -> str:
+def dispatch_reviews(state: Dict[str, Any]) -> List[Send]:
     """
-    Decide next step after compliance check.
+    Fan out the current draft to compliance and editorial in parallel.
 
-    Returns:
-        "editorial" if compliance passed
-        "revision" if failed but iterations remain
-        "complete" if max iterations exceeded
+    Both checks are independent LLM calls on the same document, so
+    running them in one super-step costs max(compliance, editorial)
+    instead of their sum.
     """
-    compliance_passed = state.get("compliance_passed", False)
-    current_iteration = state.get("current_iteration", 0)
-    max_iterations = state.get("max_iterations", 3)
-
-    if compliance_passed:
-        return "editorial"
-    elif current_iteration < max_iterations:
-        return "revision"
-    else:
-        logger.warning(f"Max iterations ({max_iterations}) reached at compliance")
-        return "complete"  # Accept what we have
+    return [Send("compliance", state), Send("editorial", state)]
 
 
-def route_after_editorial(state: Dict[str, Any]) -> str:
+def route_after_reviews(state: Dict[str, Any]) -> str:
     """
-    Decide next step after editorial review.
+    Decide next step once both reviews have been merged.
 
     Returns:
-        "complete" if quality passed
-        "revision" if failed but iterations remain
+        "complete" if compliance and editorial both passed
+        "revision" if either failed but iterations remain
         "complete" if max iterations exceeded (accept anyway)
     """
+    compliance_passed = state.get("compliance_passed", False)
     editorial_passed = state.get("editorial_passed", False)
     current_iteration = state.get("current_iteration", 0)
     max_iterations = state.get("max_iterations", 3)
 
-    if editorial_passed:
+    if compliance_passed and editorial_passed:
         return "complete"
     elif current_iteration < max_iterations:
         return "revision"
     else:
-        logger.warning(f"Max iterations ({max_iterations}) reached at editorial")
+        logger.warning(f"Max iterations ({max_iterations}) reached at review")
         return "complete"  # Accept what we have
-
-
-def route_after_revision(state: Dict[str, Any]) -> str:
-    """
-    After revision, always go back to compliance to re-check.
-    """
-    return "compliance"
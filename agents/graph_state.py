@@ -5,8 +5,9 @@ The state is a TypedDict that carries all information needed
 across nodes in the documentation generation graph.
 """
 
-from typing import TypedDict, List, Dict, Optional, Any
+from typing import TypedDict, List, Dict, Optional, Any, Annotated
 from enum import Enum
+import operator
 
 
 class WorkflowPhase(str, Enum):
@@ -90,7 +91,7 @@ class DocumentState(TypedDict, total=False):
     # === Output ===
     final_document: Optional[str]
     generation_successful: bool
-    errors: List[str]
+    errors: Annotated[List[str], operator.add]  # Appended by parallel nodes
 
     # === Memory Integration ===
     session_id: str
@@ -10,36 +10,149 @@ Usage:
 
     app = create_workflow()
     result = run_workflow(app, document_title="...", source_content="...")
+
+    # Or, from async code:
+    result = await arun_workflow(app, document_title="...", source_content="...")
 """
 
+from __future__ import annotations
+
+import atexit
+import itertools
+import json
 import logging
-from typing import Dict, Any, Optional, Tuple, List
+import queue
+import secrets
+import sys
+import threading
+import time
+import uuid
+import warnings
+from collections import defaultdict
+from enum import IntEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, List, Callable, Iterator, Literal, Union
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import InitVar, dataclass, field
 
-from langgraph.graph import StateGraph, END
+# The checkpoint saver is light and needed for DeferredMemorySaver; the
+# graph builder (and the agent-backed nodes) are loaded on first compile.
 from langgraph.checkpoint.memory import MemorySaver
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+# Optional fast serializers for audit export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 from agents.graph_state import DocumentState, create_initial_state
-from agents.graph_nodes import (
-    detect_portfolio,
-    configure_for_portfolio,
-    research_phase,
-    writing_phase,
-    compliance_phase,
-    editorial_phase,
-    revision_phase,
-    complete_workflow,
-    handle_failure,
-    route_after_compliance,
-    route_after_editorial,
-    route_after_revision
-)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _lazy_langgraph():
+    """Import the LangGraph graph builder on first use."""
+    from langgraph.graph import StateGraph
+    return StateGraph
+
+
+class DeferredMemorySaver(MemorySaver):
+    """
+    MemorySaver that buffers checkpoint writes until the run completes.
+
+    The orchestrator only reads history after the workflow finishes (to
+    build the audit log), so committing and serializing a checkpoint after
+    every node is wasted work on the hot path. Writes are queued per
+    thread and replayed into the underlying MemorySaver by flush().
+
+    Note: buffered checkpoints are not visible to get_tuple()/list() until
+    flush() is called, so this saver cannot resume an interrupted run.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending: Dict[str, List[Tuple[str, tuple, dict]]] = defaultdict(list)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        """Queue a checkpoint and return the config LangGraph expects."""
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        self._pending[thread_id].append(
+            ("put", (config, checkpoint, metadata, new_versions), {})
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": configurable.get("checkpoint_ns", ""),
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(self, config, writes, task_id, *args, **kwargs):
+        """Queue intermediate writes for a task."""
+        thread_id = config["configurable"]["thread_id"]
+        self._pending[thread_id].append(
+            ("put_writes", (config, writes, task_id, *args), kwargs)
+        )
+
+    def flush(self, thread_id: str) -> None:
+        """Commit all buffered writes for a thread in one pass."""
+        pending = self._pending.pop(thread_id, None)
+        if not pending:
+            return
+        for method, args, kwargs in pending:
+            if method == "put":
+                super().put(*args, **kwargs)
+            else:
+                super().put_writes(*args, **kwargs)
+        logger.info(f"[DeferredMemorySaver] Flushed {len(pending)} writes for {thread_id}")
+
+
+class NodeId(IntEnum):
+    """
+    Compact identifiers for workflow nodes stored in state history.
+    
+    History rows hold these small ints instead of per-entry name strings,
+    so node comparisons are int compares. Formats as the node name.
+    """
+    DETECT_PORTFOLIO = 0
+    CONFIGURE = 1
+    RESEARCH = 2
+    WRITE = 3
+    COMPLIANCE = 4
+    EDITORIAL = 5
+    MERGE_REVIEWS = 6
+    REVISION = 7
+    COMPLETE = 8
+    FAIL = 9
+    UNKNOWN = 10
+    
+    @property
+    def node_name(self) -> str:
+        return _NODE_NAMES[self]
+    
+    def __str__(self) -> str:
+        return _NODE_NAMES[self]
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(_NODE_NAMES[self], format_spec)
+
+
+_NODE_NAMES = {node_id: node_id.name.lower() for node_id in NodeId}
+_NODE_BY_NAME = {name: node_id for node_id, name in _NODE_NAMES.items()}
+
+
+@dataclass(slots=True)
 class StateHistoryEntry:
     """
     A single entry in the execution history.
@@ -47,7 +160,7 @@ class StateHistoryEntry:
     Captures the state at each node transition for audit purposes.
     """
     step: int
-    node: str
+    node: NodeId
     timestamp: str
     portfolio: Optional[str]
     iteration: Optional[int]
@@ -56,17 +169,130 @@ class StateHistoryEntry:
     quality_score: Optional[float]
     phase: Optional[str]
     
+    @property
+    def node_name(self) -> str:
+        """Node name for display."""
+        return _NODE_NAMES[self.node]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "step": self.step,
+            "node": _NODE_NAMES[self.node],
+            "timestamp": self.timestamp,
+            "portfolio": self.portfolio,
+            "iteration": self.iteration,
+            "compliance_passed": self.compliance_passed,
+            "editorial_passed": self.editorial_passed,
+            "quality_score": self.quality_score,
+            "phase": self.phase
+        }
+
+
+class StateHistoryColumns:
+    """
+    Columnar storage for state history: one parallel list per field.
+    
+    Per-field scans (only node names, only quality scores) walk a single
+    list rather than touching every entry object. Indexing and iteration
+    yield StateHistoryEntry views, so callers written against
+    List[StateHistoryEntry] keep working.
+    """
+    __slots__ = (
+        "step", "node", "timestamp", "portfolio", "iteration",
+        "compliance_passed", "editorial_passed", "quality_score", "phase"
+    )
+    
+    def __init__(self):
+        self.step: List[int] = []
+        self.node: List[NodeId] = []
+        self.timestamp: List[str] = []
+        self.portfolio: List[Optional[str]] = []
+        self.iteration: List[Optional[int]] = []
+        self.compliance_passed: List[Optional[bool]] = []
+        self.editorial_passed: List[Optional[bool]] = []
+        self.quality_score: List[Optional[float]] = []
+        self.phase: List[Optional[str]] = []
+    
+    @classmethod
+    def from_entries(cls, entries: List[StateHistoryEntry]) -> "StateHistoryColumns":
+        """Build columns from a list of entries."""
+        columns = cls()
+        for entry in entries:
+            columns.append(
+                entry.step, entry.node, entry.timestamp, entry.portfolio,
+                entry.iteration, entry.compliance_passed, entry.editorial_passed,
+                entry.quality_score, entry.phase
+            )
+        return columns
+    
+    def append(
+        self,
+        step: int,
+        node: NodeId,
+        timestamp: str,
+        portfolio: Optional[str],
+        iteration: Optional[int],
+        compliance_passed: Optional[bool],
+        editorial_passed: Optional[bool],
+        quality_score: Optional[float],
+        phase: Optional[str]
+    ) -> None:
+        """Append one row."""
+        self.step.append(step)
+        self.node.append(node)
+        self.timestamp.append(timestamp)
+        self.portfolio.append(portfolio)
+        self.iteration.append(iteration)
+        self.compliance_passed.append(compliance_passed)
+        self.editorial_passed.append(editorial_passed)
+        self.quality_score.append(quality_score)
+        self.phase.append(phase)
+    
+    def _rows(self) -> Iterator[Tuple]:
+        return zip(
+            self.step, self.node, self.timestamp, self.portfolio, self.iteration,
+            self.compliance_passed, self.editorial_passed, self.quality_score, self.phase
+        )
+    
+    def __len__(self) -> int:
+        return len(self.step)
+    
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[StateHistoryEntry, List[StateHistoryEntry]]:
+        if isinstance(index, slice):
+            columns = [getattr(self, name)[index] for name in self.__slots__]
+            return [StateHistoryEntry(*row) for row in zip(*columns)]
+        return StateHistoryEntry(
+            self.step[index], self.node[index], self.timestamp[index],
+            self.portfolio[index], self.iteration[index],
+            self.compliance_passed[index], self.editorial_passed[index],
+            self.quality_score[index], self.phase[index]
+        )
+    
+    def __iter__(self) -> Iterator[StateHistoryEntry]:
+        for row in self._rows():
+            yield StateHistoryEntry(*row)
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert all rows to dictionaries for JSON serialization."""
+        fields = self.__slots__
+        rows = [dict(zip(fields, row)) for row in self._rows()]
+        for row in rows:
+            row["node"] = _NODE_NAMES[row["node"]]
+        return rows
 
 
-@dataclass 
+@dataclass(slots=True)
 class ExecutionAuditLog:
     """
     Complete audit log for a document generation run.
     
     Provides full traceability for regulatory compliance.
+    
+    history accepts a list of entries or StateHistoryColumns; pass None
+    with a history_loader to load state_history on first access.
     """
     thread_id: str
     document_title: str
@@ -77,7 +303,33 @@ class ExecutionAuditLog:
     total_iterations: int
     generation_successful: bool
     execution_path: List[str]  # Ordered list of nodes visited
-    state_history: List[StateHistoryEntry]
+    history: InitVar[Union[StateHistoryColumns, List[StateHistoryEntry], None]]
+    history_loader: Optional[Callable[[], List[StateHistoryEntry]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _state_history: Optional[StateHistoryColumns] = field(default=None, init=False, repr=False)
+    _json_cache: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _path_summary_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _decision_points_cache: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(
+        self,
+        history: Union[StateHistoryColumns, List[StateHistoryEntry], None]
+    ) -> None:
+        if history is not None and not isinstance(history, StateHistoryColumns):
+            history = StateHistoryColumns.from_entries(history)
+        self._state_history = history
+    
+    @property
+    def state_history(self) -> StateHistoryColumns:
+        """State transitions, loaded from the checkpointer on first access."""
+        if self._state_history is None:
+            self._state_history = StateHistoryColumns.from_entries(
+                self.history_loader() if self.history_loader else []
+            )
+        return self._state_history
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -91,76 +343,273 @@ class ExecutionAuditLog:
             "total_iterations": self.total_iterations,
             "generation_successful": self.generation_successful,
             "execution_path": self.execution_path,
-            "state_history": [entry.to_dict() for entry in self.state_history]
+            "state_history": self.state_history.to_dicts()
         }
     
+    def to_json(self) -> bytes:
+        """
+        Serialize to UTF-8 JSON bytes.
+        
+        Uses orjson when installed. The result is cached because audit logs
+        are not modified after _build_audit_log().
+        """
+        if self._json_cache is None:
+            data = self.to_dict()
+            if ORJSON_AVAILABLE:
+                self._json_cache = orjson.dumps(data, default=str)
+            else:
+                self._json_cache = json.dumps(data, default=str).encode("utf-8")
+        return self._json_cache
+    
+    def to_msgpack(self) -> bytes:
+        """Serialize to compact msgpack bytes for on-disk audit storage."""
+        if not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack not installed. Run: pip install msgpack")
+        return msgpack.packb(self.to_dict(), default=str)
+    
     def get_path_summary(self) -> str:
-        """Get human-readable execution path summary."""
-        return " → ".join(self.execution_path)
+        """Get human-readable execution path summary (computed once)."""
+        if self._path_summary_cache is None:
+            self._path_summary_cache = " → ".join(self.execution_path)
+        return self._path_summary_cache
     
     def get_decision_points(self) -> List[Dict[str, Any]]:
-        """Extract key decision points for audit review."""
+        """
+        Extract key decision points for audit review.
+        
+        Compliance and editorial run in the same super-step and routing is
+        decided once both are merged, so each decision is the merge_reviews
+        visit: both review outcomes and the node routed to next.
+        
+        Computed once and cached; treat the returned list as read-only.
+        """
+        if self._decision_points_cache is not None:
+            return self._decision_points_cache
+        
+        # Scan the node column only; other columns are read for matches
+        history = self.state_history
+        path = self.execution_path
+        path_len = len(path)
         decisions = []
-        for i, entry in enumerate(self.state_history):
-            if entry.node in ["compliance", "editorial"]:
-                passed = entry.compliance_passed if entry.node == "compliance" else entry.editorial_passed
-                next_node = self.execution_path[i + 1] if i + 1 < len(self.execution_path) else "END"
-                decisions.append({
-                    "step": entry.step,
-                    "node": entry.node,
-                    "passed": passed,
-                    "routed_to": next_node,
-                    "iteration": entry.iteration,
-                    "quality_score": entry.quality_score
-                })
+        for i, node in enumerate(history.node):
+            if node is not NodeId.MERGE_REVIEWS:
+                continue
+            compliance_passed = history.compliance_passed[i]
+            editorial_passed = history.editorial_passed[i]
+            decisions.append({
+                "step": history.step[i],
+                "node": _NODE_NAMES[node],
+                "passed": bool(compliance_passed and editorial_passed),
+                "compliance_passed": compliance_passed,
+                "editorial_passed": editorial_passed,
+                "routed_to": path[i + 1] if i + 1 < path_len else "END",
+                "iteration": history.iteration[i],
+                "quality_score": history.quality_score[i]
+            })
+        
+        self._decision_points_cache = decisions
         return decisions
 
 
-def create_workflow(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
+class _RunRecorder:
+    """
+    on_node callback that records one run's execution path and, in
+    inline audit mode, a state history row per node visit.
+
+    Tracked values are carried forward from each node's partial update,
+    so no checkpointer round-trips are needed to rebuild the history.
+    Timestamps are stored as raw time.time_ns() readings and formatted
+    once per run by LangGraphOrchestrator._finish_run.
+    A lock keeps entries consistent when review branches run in parallel.
     """
-    Create the documentation generation workflow graph.
 
-    The graph structure:
+    def __init__(self, record_history: bool):
+        self.path: List[str] = []
+        self.history: Optional[StateHistoryColumns] = (
+            StateHistoryColumns() if record_history else None
+        )
+        self._values: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, node: str, update: Dict[str, Any]) -> None:
+        with self._lock:
+            self.path.append(node)
+            if self.history is None:
+                return
+
+            values = self._values
+            values.update(update or {})
+            self.history.append(
+                len(self.history),
+                _NODE_BY_NAME.get(node, NodeId.UNKNOWN),
+                time.time_ns(),
+                values.get("detected_portfolio"),
+                values.get("current_iteration"),
+                values.get("compliance_passed"),
+                values.get("editorial_passed"),
+                values.get("quality_score"),
+                values.get("phase")
+            )
 
-    detect_portfolio -> configure -> research -> write -> compliance
-                                                          |
-                                             +------------+------------+
-                                             |                        |
-                                        (passed)                  (failed)
-                                             |                        |
-                                        editorial              revision <--+
-                                             |                    |       |
-                                   +---------+---------+         |       |
-                                   |                   |         +-------+
-                              (passed)             (failed)           ^
-                                   |                   |              |
-                              complete            revision -----------+
 
-    Args:
-        checkpointer: Optional MemorySaver for state persistence
+# Final-state fields an audit log is built from
+_AUDIT_SUMMARY_KEYS = (
+    "end_time", "detected_portfolio", "quality_score",
+    "current_iteration", "generation_successful"
+)
 
-    Returns:
-        Compiled StateGraph application
+
+# Configurable key for the per-run node callback. The "__" prefix keeps
+# LangGraph from copying it into checkpoint metadata.
+_ON_NODE_KEY = "__autodoc_on_node"
+
+
+class AuditLogWriter:
+    """
+    Background writer that persists audit logs as NDJSON in batches.
+
+    Records are pre-serialized JSON bytes (see ExecutionAuditLog.to_json).
+
+    generate_documentation() only enqueues the serialized log; a daemon
+    thread drains up to BATCH_SIZE entries (or whatever arrived within
+    FLUSH_INTERVAL seconds) and appends them to the file in one write.
+    The queue is bounded so a stalled disk applies backpressure instead
+    of growing memory without limit. Queued records are flushed by close(),
+    which also runs at interpreter exit (the daemon thread would otherwise
+    be killed with them still queued).
+    """
+
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.05  # seconds
+    MAX_QUEUE_SIZE = 1000
+
+    _STOP = object()
+
+    def __init__(self, path: str):
+        """
+        Initialize the writer and start its background thread.
+
+        Args:
+            path: File to append NDJSON audit records to
+        """
+        self.path = path
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._run, name="audit-log-writer", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        atexit.register(self.close)
+
+    def enqueue(self, record: bytes) -> None:
+        """Queue a record for writing (blocks only when the queue is full)."""
+        self._queue.put(record)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush pending records and stop the background thread (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """Drain the queue in batches until close() is called."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get(timeout=self.FLUSH_INTERVAL))
+                except queue.Empty:
+                    break
+
+            records = []
+            for item in batch:
+                if item is self._STOP:
+                    stopping = True
+                else:
+                    records.append(item)
+
+            if records:
+                self._write_batch(records)
+
+    def _write_batch(self, records: List[bytes]) -> None:
+        """Join a batch into one NDJSON blob and append it in one write."""
+        blob = b"\n".join(records) + b"\n"
+        try:
+            with open(self.path, "ab") as f:
+                f.write(blob)
+        except OSError as e:
+            logger.error(f"[AuditLogWriter] Failed to write {len(records)} records: {e}")
+
+
+def _instrument_node(name: str, fn: Callable) -> Callable:
+    """
+    Wrap a node so each visit is reported to the run's on_node callback.
+
+    The callback is read from the run config at call time, so the
+    compiled graph itself holds no per-run state.
     """
+    # config stays unannotated: LangGraph only injects it into parameters
+    # that are untyped or typed RunnableConfig
+    def node(state: Dict[str, Any], config) -> Dict[str, Any]:
+        update = fn(state)
+        on_node = config.get("configurable", {}).get(_ON_NODE_KEY)
+        if on_node is not None:
+            on_node(name, update)
+        return update
+
+    node.__name__ = fn.__name__
+    return node
+
+
+@lru_cache(maxsize=1)
+def _build_workflow_graph() -> StateGraph:
+    """
+    Build the uncompiled workflow graph (once per process).
+
+    The topology is static and nodes hold no per-run state, so one
+    builder serves every orchestrator; see create_workflow.
+    """
+    from agents.graph_nodes import (
+        detect_portfolio,
+        configure_for_portfolio,
+        research_phase,
+        writing_phase,
+        compliance_phase,
+        editorial_phase,
+        merge_reviews,
+        revision_phase,
+        complete_workflow,
+        handle_failure,
+        dispatch_reviews,
+        route_after_reviews
+    )
+
     logger.info("[LangGraph] Creating workflow graph")
 
     # Create the graph with DocumentState schema
+    from langgraph.graph import END
+    StateGraph = _lazy_langgraph()
     workflow = StateGraph(DocumentState)
 
     # ============================================================
     # ADD NODES
     # ============================================================
-    workflow.add_node("detect_portfolio", detect_portfolio)
-    workflow.add_node("configure", configure_for_portfolio)
-    workflow.add_node("research", research_phase)
-    workflow.add_node("write", writing_phase)
-    workflow.add_node("compliance", compliance_phase)
-    workflow.add_node("editorial", editorial_phase)
-    workflow.add_node("revision", revision_phase)
-    workflow.add_node("complete", complete_workflow)
-    workflow.add_node("fail", handle_failure)
-
-    logger.info("[LangGraph] Added 9 nodes")
+    workflow.add_node("detect_portfolio", _instrument_node("detect_portfolio", detect_portfolio))
+    workflow.add_node("configure", _instrument_node("configure", configure_for_portfolio))
+    workflow.add_node("research", _instrument_node("research", research_phase))
+    workflow.add_node("write", _instrument_node("write", writing_phase))
+    workflow.add_node("compliance", _instrument_node("compliance", compliance_phase))
+    workflow.add_node("editorial", _instrument_node("editorial", editorial_phase))
+    workflow.add_node("merge_reviews", _instrument_node("merge_reviews", merge_reviews))
+    workflow.add_node("revision", _instrument_node("revision", revision_phase))
+    workflow.add_node("complete", _instrument_node("complete", complete_workflow))
+    workflow.add_node("fail", _instrument_node("fail", handle_failure))
+
+    logger.info("[LangGraph] Added 10 nodes")
 
     # ============================================================
     # ADD EDGES (unconditional transitions)
@@ -168,7 +617,6 @@ def create_workflow(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
     workflow.add_edge("detect_portfolio", "configure")
     workflow.add_edge("configure", "research")
     workflow.add_edge("research", "write")
-    workflow.add_edge("write", "compliance")
 
     logger.info("[LangGraph] Added linear edges")
 
@@ -176,36 +624,23 @@ def create_workflow(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
     # ADD CONDITIONAL EDGES (routing based on state)
     # ============================================================
 
-    # After compliance: route to editorial, revision, or complete
-    workflow.add_conditional_edges(
-        "compliance",
-        route_after_compliance,
-        {
-            "editorial": "editorial",
-            "revision": "revision",
-            "complete": "complete"
-        }
-    )
+    # After write and revision: fan out to compliance + editorial in parallel
+    workflow.add_conditional_edges("write", dispatch_reviews, ["compliance", "editorial"])
+    workflow.add_conditional_edges("revision", dispatch_reviews, ["compliance", "editorial"])
+
+    # Join both reviews before routing
+    workflow.add_edge(["compliance", "editorial"], "merge_reviews")
 
-    # After editorial: route to complete or revision
+    # After merge: route to complete or revision
     workflow.add_conditional_edges(
-        "editorial",
-        route_after_editorial,
+        "merge_reviews",
+        route_after_reviews,
         {
             "complete": "complete",
             "revision": "revision"
         }
     )
 
-    # After revision: always go back to compliance
-    workflow.add_conditional_edges(
-        "revision",
-        route_after_revision,
-        {
-            "compliance": "compliance"
-        }
-    )
-
     logger.info("[LangGraph] Added conditional edges (cycles)")
 
     # ============================================================
@@ -217,19 +652,103 @@ def create_workflow(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
 
     logger.info("[LangGraph] Set entry point and end nodes")
 
-    # ============================================================
-    # COMPILE
-    # ============================================================
-    if checkpointer:
-        app = workflow.compile(checkpointer=checkpointer)
-        logger.info("[LangGraph] Compiled with checkpointer")
-    else:
-        app = workflow.compile()
-        logger.info("[LangGraph] Compiled without checkpointer")
+    return workflow
+
 
+@lru_cache(maxsize=1)
+def _compile_workflow() -> StateGraph:
+    """Compile the shared workflow graph without a checkpointer (once per process)."""
+    app = _build_workflow_graph().compile()
+    logger.info("[LangGraph] Compiled workflow graph")
     return app
 
 
+def create_workflow(checkpointer: Optional[MemorySaver] = None) -> StateGraph:
+    """
+    Create the documentation generation workflow graph.
+
+    The graph structure:
+
+    detect_portfolio -> configure -> research -> write -> (fan-out)
+                                                            |
+                                             +--------------+--------------+
+                                             |                             |
+                                        compliance                    editorial
+                                             |                             |
+                                             +--------------+--------------+
+                                                            |
+                                                      merge_reviews
+                                                            |
+                                             +--------------+--------------+
+                                             |                             |
+                                        (passed)                       (failed)
+                                             |                             |
+                                         complete              revision -> (fan-out)
+
+    Compliance and editorial run in the same super-step, so review
+    latency is max(compliance, editorial) rather than their sum.
+
+    Every node is wrapped with _instrument_node so callers can observe
+    node visits by passing an on_node callback in the run config.
+
+    The graph is built once per process. Without a checkpointer the
+    shared compiled graph is returned; with one, the cached builder is
+    compiled against it, so each orchestrator keeps its own checkpoint
+    store.
+
+    Args:
+        checkpointer: Optional MemorySaver for state persistence
+
+    Returns:
+        Compiled StateGraph application
+    """
+    if checkpointer:
+        app = _build_workflow_graph().compile(checkpointer=checkpointer)
+        logger.info("[LangGraph] Compiled workflow graph with checkpointer")
+        return app
+
+    return _compile_workflow()
+
+
+def _prepare_run(
+    document_title: str,
+    document_type: str,
+    source_content: str,
+    model_type: Optional[str],
+    year: Optional[int],
+    user_id: str,
+    thread_id: Optional[str],
+    on_node: Optional[Callable[[str, Dict[str, Any]], None]]
+) -> Tuple[DocumentState, Dict[str, Any]]:
+    """Build the initial state and run config shared by sync and async runs."""
+    initial_state = create_initial_state(
+        document_title=document_title,
+        document_type=document_type,
+        source_content=source_content,
+        model_type=model_type,
+        year=year,
+        user_id=user_id
+    )
+
+    configurable = {}
+    if thread_id:
+        configurable["thread_id"] = thread_id
+    if on_node:
+        configurable[_ON_NODE_KEY] = on_node
+    config = {"configurable": configurable} if configurable else {}
+
+    return initial_state, config
+
+
+def _log_final_state(final_state: Dict[str, Any]) -> None:
+    """Log the headline results of a completed run."""
+    logger.info(f"[LangGraph] Workflow complete")
+    logger.info(f"[LangGraph] Portfolio: {final_state.get('detected_portfolio')}")
+    logger.info(f"[LangGraph] Iterations: {final_state.get('current_iteration')}")
+    logger.info(f"[LangGraph] Quality Score: {final_state.get('quality_score', 0):.1f}")
+    logger.info(f"[LangGraph] Success: {final_state.get('generation_successful')}")
+
+
 def run_workflow(
     app: StateGraph,
     document_title: str,
@@ -238,7 +757,8 @@ def run_workflow(
     model_type: Optional[str] = None,
     year: Optional[int] = None,
     user_id: str = "default",
-    thread_id: Optional[str] = None
+    thread_id: Optional[str] = None,
+    on_node: Optional[Callable[[str, Dict[str, Any]], None]] = None
 ) -> Tuple[Optional[str], Dict[str, Any]]:
     """
     Execute the documentation generation workflow.
@@ -252,37 +772,61 @@ def run_workflow(
         year: Optional year
         user_id: User identifier
         thread_id: Optional thread ID for checkpointing
+        on_node: Optional callback invoked as on_node(node_name, update)
+                 after each node completes
 
     Returns:
         Tuple of (final_document, final_state)
     """
     logger.info(f"[LangGraph] Starting workflow: {document_title}")
 
-    # Create initial state
-    initial_state = create_initial_state(
-        document_title=document_title,
-        document_type=document_type,
-        source_content=source_content,
-        model_type=model_type,
-        year=year,
-        user_id=user_id
+    initial_state, config = _prepare_run(
+        document_title, document_type, source_content,
+        model_type, year, user_id, thread_id, on_node
     )
 
-    # Configure execution
-    config = {}
-    if thread_id:
-        config["configurable"] = {"thread_id": thread_id}
-
     # Execute the graph
     try:
         final_state = app.invoke(initial_state, config=config)
+        _log_final_state(final_state)
+        return final_state.get("final_document"), final_state
+
+    except Exception as e:
+        logger.error(f"[LangGraph] Workflow failed: {e}")
+        return None, {"error": str(e), "generation_successful": False}
+
+
+async def arun_workflow(
+    app: StateGraph,
+    document_title: str,
+    document_type: str,
+    source_content: str,
+    model_type: Optional[str] = None,
+    year: Optional[int] = None,
+    user_id: str = "default",
+    thread_id: Optional[str] = None,
+    on_node: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Async variant of run_workflow using app.ainvoke.
 
-        logger.info(f"[LangGraph] Workflow complete")
-        logger.info(f"[LangGraph] Portfolio: {final_state.get('detected_portfolio')}")
-        logger.info(f"[LangGraph] Iterations: {final_state.get('current_iteration')}")
-        logger.info(f"[LangGraph] Quality Score: {final_state.get('quality_score', 0):.1f}")
-        logger.info(f"[LangGraph] Success: {final_state.get('generation_successful')}")
+    Lets an async server await several generations concurrently instead
+    of parking one OS thread per run. The node functions are synchronous
+    (the agents use the blocking Anthropic client), so LangGraph runs them
+    in its executor; parallel branches still overlap.
 
+    Args and return value are the same as run_workflow.
+    """
+    logger.info(f"[LangGraph] Starting async workflow: {document_title}")
+
+    initial_state, config = _prepare_run(
+        document_title, document_type, source_content,
+        model_type, year, user_id, thread_id, on_node
+    )
+
+    try:
+        final_state = await app.ainvoke(initial_state, config=config)
+        _log_final_state(final_state)
         return final_state.get("final_document"), final_state
 
     except Exception as e:
@@ -290,17 +834,65 @@ def run_workflow(
         return None, {"error": str(e), "generation_successful": False}
 
 
-def get_workflow_visualization(app: StateGraph = None) -> str:
+def stream_workflow(
+    app: StateGraph,
+    document_title: str,
+    document_type: str,
+    source_content: str,
+    model_type: Optional[str] = None,
+    year: Optional[int] = None,
+    user_id: str = "default",
+    thread_id: Optional[str] = None
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
     """
-    Get a text representation of the workflow graph.
+    Execute the workflow, yielding each node's partial update as it lands.
+
+    Uses stream_mode="updates" so only per-node deltas are produced, not
+    the full state after every super-step. The final state is assembled
+    locally and yielded last as (END, final_state).
 
     Args:
-        app: Compiled StateGraph (optional)
+        Same as run_workflow (minus on_node; the stream itself reports nodes)
 
-    Returns:
-        ASCII representation of the graph
+    Yields:
+        (node_name, update) per node, then (END, final_state)
     """
-    return """
+    from langgraph.graph import END
+    logger.info(f"[LangGraph] Starting streamed workflow: {document_title}")
+
+    initial_state, config = _prepare_run(
+        document_title, document_type, source_content,
+        model_type, year, user_id, thread_id, None
+    )
+
+    final_state: Dict[str, Any] = dict(initial_state)
+    try:
+        for chunk in app.stream(initial_state, config=config, stream_mode="updates"):
+            for node_name, update in chunk.items():
+                update = update or {}
+                _merge_update(final_state, update)
+                yield node_name, update
+
+    except Exception as e:
+        logger.error(f"[LangGraph] Workflow failed: {e}")
+        final_state = {"error": str(e), "generation_successful": False}
+    else:
+        _log_final_state(final_state)
+
+    yield END, final_state
+
+
+def _merge_update(state: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Apply a node update to a local state copy, honoring DocumentState reducers."""
+    for key, value in update.items():
+        if key == "errors":
+            state["errors"] = state.get("errors", []) + value
+        else:
+            state[key] = value
+
+
+# Static diagram (the topology never changes at runtime)
+_WORKFLOW_VIZ: str = """
     AutoDoc AI - LangGraph Workflow
     ================================
 
@@ -324,36 +916,49 @@ def get_workflow_visualization(app: StateGraph = None) -> str:
     +--------+---------+
              |
              v
-    +------------------+
-    |   compliance     |<--------------+
-    +--------+---------+               |
-             |                         |
-        +----+----+                    |
-        v         v                    |
-    (passed)  (failed)                 |
-        |         |                    |
-        v         v                    |
-    +------------------+               |
-    |   editorial      |               |
-    +--------+---------+               |
-             |                         |
-        +----+----+                    |
-        v         v                    |
-    (passed)  (failed)                 |
-        |         |                    |
-        v         v                    |
-    +------------------+   +------------------+
-    |    complete      |   |    revision      |
-    +--------+---------+   +--------+---------+
-             |                      |
-             v                      +-----------+
+        +----+---------------+
+        v                    v
+  +------------+      +------------+
+  | compliance |      | editorial  |<-------------+
+  +-----+------+      +-----+------+              |
+        |                   |                     |
+        +---------+---------+                     |
+                  v                               |
+        +------------------+                      |
+        |  merge_reviews   |                      |
+        +--------+---------+                      |
+                 |                                |
+            +----+----+                           |
+            v         v                           |
+        (passed)  (failed)                        |
+            |         |                           |
+            v         v                           |
+    +------------------+   +------------------+   |
+    |    complete      |   |    revision      |---+
+    +--------+---------+   +------------------+
+             |             (fans out to compliance
+             v              and editorial again)
            [END]
 
     Legend:
     - Solid arrows: Unconditional transitions
     - (passed)/(failed): Conditional routing based on state
-    - Revision creates a cycle back to compliance
+    - Compliance and editorial run in parallel on the same draft
+    - Revision creates a cycle back to both reviews
+    """
+
+
+def get_workflow_visualization(app: StateGraph = None) -> str:
+    """
+    Get a text representation of the workflow graph.
+
+    Args:
+        app: Compiled StateGraph (optional)
+
+    Returns:
+        ASCII representation of the graph
     """
+    return _WORKFLOW_VIZ
 
 
 class LangGraphOrchestrator:
@@ -367,25 +972,63 @@ class LangGraphOrchestrator:
     - Automatic state history tracking for audit compliance
     - Execution path logging for regulatory review
     - Full traceability of all routing decisions
+    
+    Audit modes:
+    - "inline" (default): history is recorded by a node callback during
+      the run; no checkpointer is installed
+    - "checkpoint": history is read back from a MemorySaver after the run
+    - "off": no audit trail
     """
 
+    AUDIT_MODES = ("checkpoint", "inline", "off")
+    
+    # Thread IDs only need to be unique within this process by default
+    _PROCESS_NONCE = secrets.token_hex(4)
+    _counter = itertools.count()
+
     def __init__(
         self,
         user_id: str = "default",
-        enable_checkpointing: bool = True  # Default ON for audit trail
+        enable_checkpointing: Optional[bool] = None,  # Deprecated: use audit_mode
+        audit_log_path: Optional[str] = None,
+        audit_mode: Literal["checkpoint", "inline", "off"] = "inline",
+        unique_across_machines: bool = False
     ):
         """
         Initialize the LangGraph orchestrator.
 
         Args:
             user_id: User identifier for memory
-            enable_checkpointing: Whether to enable state checkpointing (default: True for audit)
+            enable_checkpointing: Deprecated, use audit_mode. If given,
+                                  True selects audit_mode="checkpoint"
+                                  and False selects "off"
+            audit_log_path: Optional NDJSON file to persist audit logs to
+                            (written asynchronously in batches)
+            audit_mode: How the audit trail is captured (see class docstring)
+            unique_across_machines: Use uuid4 thread IDs (for multi-node
+                                    deployments) instead of a process-local
+                                    counter
         """
+        if audit_mode not in self.AUDIT_MODES:
+            raise ValueError(f"Unknown audit_mode: {audit_mode}. Expected one of {self.AUDIT_MODES}")
+        
         self.user_id = user_id
-        self.enable_checkpointing = enable_checkpointing
+        self.unique_across_machines = unique_across_machines
+        if enable_checkpointing is not None:
+            warnings.warn(
+                "enable_checkpointing is deprecated; pass audit_mode="
+                "'checkpoint' or 'off' instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            audit_mode = "checkpoint" if enable_checkpointing else "off"
         
-        # Create checkpointer (enabled by default for audit trail)
-        self.checkpointer = MemorySaver() if enable_checkpointing else None
+        self.audit_mode = audit_mode
+        self.enable_checkpointing = self.audit_mode == "checkpoint"
+        
+        # Only checkpoint mode needs a saver. Writes are buffered and
+        # flushed once the run completes.
+        self.checkpointer = DeferredMemorySaver() if self.enable_checkpointing else None
 
         # Create the workflow
         self.app = create_workflow(checkpointer=self.checkpointer)
@@ -394,11 +1037,21 @@ class LangGraphOrchestrator:
         self._last_thread_id: Optional[str] = None
         self._last_config: Optional[Dict] = None
         self._audit_logs: Dict[str, ExecutionAuditLog] = {}
+        # thread_id -> (document_title, start_time_ns, final state summary)
+        self._pending_audit: Dict[str, Tuple[str, int, Dict[str, Any]]] = {}
+        self._path_by_thread: Dict[str, List[str]] = {}
+        self._history_by_thread: Dict[str, StateHistoryColumns] = {}
+        
+        # Optional background persistence of audit logs
+        self.audit_writer = AuditLogWriter(audit_log_path) if audit_log_path else None
 
         logger.info(f"[LangGraphOrchestrator] Initialized for user: {user_id}")
-        logger.info(f"[LangGraphOrchestrator] Checkpointing: {enable_checkpointing}")
-        if enable_checkpointing:
-            logger.info(f"[LangGraphOrchestrator] Audit trail enabled")
+        logger.info(f"[LangGraphOrchestrator] Audit mode: {self.audit_mode}")
+
+    def close(self) -> None:
+        """Flush queued audit log records and stop the background writer."""
+        if self.audit_writer:
+            self.audit_writer.close()
 
     def generate_documentation(
         self,
@@ -406,7 +1059,8 @@ class LangGraphOrchestrator:
         document_type: str,
         source_content: str,
         model_type: Optional[str] = None,
-        year: Optional[int] = None
+        year: Optional[int] = None,
+        build_audit_log: bool = False
     ) -> Tuple[Optional[str], Dict[str, Any]]:
         """
         Generate documentation using the LangGraph workflow.
@@ -417,6 +1071,8 @@ class LangGraphOrchestrator:
             source_content: Source PPT content
             model_type: Optional model type hint
             year: Optional year
+            build_audit_log: Build the audit log immediately. By default it
+                             is built on the first get_audit_log() call.
 
         Returns:
             Tuple of (final_document, workflow_state)
@@ -425,13 +1081,7 @@ class LangGraphOrchestrator:
             After calling this method, use get_execution_history() or
             get_audit_log() to retrieve the full execution trace.
         """
-        import uuid
-        thread_id = str(uuid.uuid4())
-        start_time = datetime.now().isoformat()
-        
-        # Store for history retrieval
-        self._last_thread_id = thread_id
-        self._last_config = {"configurable": {"thread_id": thread_id}}
+        thread_id, start_time_ns, on_node = self._begin_run()
 
         document, final_state = run_workflow(
             app=self.app,
@@ -441,24 +1091,149 @@ class LangGraphOrchestrator:
             model_type=model_type,
             year=year,
             user_id=self.user_id,
-            thread_id=thread_id
+            thread_id=thread_id,
+            on_node=on_node
         )
         
-        # Build and store audit log if checkpointing is enabled
-        if self.enable_checkpointing and self.checkpointer:
-            audit_log = self._build_audit_log(
-                thread_id=thread_id,
-                document_title=document_title,
-                start_time=start_time,
-                final_state=final_state
-            )
-            self._audit_logs[thread_id] = audit_log
+        self._finish_run(thread_id, document_title, start_time_ns, final_state, build_audit_log)
+        return document, final_state
+
+    async def agenerate_documentation(
+        self,
+        document_title: str,
+        document_type: str,
+        source_content: str,
+        model_type: Optional[str] = None,
+        year: Optional[int] = None,
+        build_audit_log: bool = False
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Async variant of generate_documentation for async callers.
+
+        Args and return value are the same as generate_documentation.
+        """
+        thread_id, start_time_ns, on_node = self._begin_run()
+
+        document, final_state = await arun_workflow(
+            app=self.app,
+            document_title=document_title,
+            document_type=document_type,
+            source_content=source_content,
+            model_type=model_type,
+            year=year,
+            user_id=self.user_id,
+            thread_id=thread_id,
+            on_node=on_node
+        )
+        
+        self._finish_run(thread_id, document_title, start_time_ns, final_state, build_audit_log)
+        return document, final_state
+
+    def generate_documentation_streaming(
+        self,
+        document_title: str,
+        document_type: str,
+        source_content: str,
+        model_type: Optional[str] = None,
+        year: Optional[int] = None,
+        build_audit_log: bool = False
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Generate documentation while yielding per-node progress.
+
+        Yields (node_name, update) as each node finishes, then
+        (END, final_state). Node visits are recorded straight from the
+        stream, and the audit log is built exactly as in
+        generate_documentation.
+        """
+        from langgraph.graph import END
+        thread_id, start_time_ns, record_node = self._begin_run()
+
+        for node_name, update in stream_workflow(
+            app=self.app,
+            document_title=document_title,
+            document_type=document_type,
+            source_content=source_content,
+            model_type=model_type,
+            year=year,
+            user_id=self.user_id,
+            thread_id=thread_id
+        ):
+            if node_name == END:
+                self._finish_run(thread_id, document_title, start_time_ns, update, build_audit_log)
+            else:
+                record_node(node_name, update)
+            yield node_name, update
+
+    def _begin_run(self) -> Tuple[str, int, Callable[[str, Dict[str, Any]], None]]:
+        """
+        Allocate a thread ID and node recorder for a new run.
+
+        Returns:
+            Tuple of (thread_id, start_time_ns, on_node callback).
+            The start time is kept as raw epoch nanoseconds and only
+            formatted if an audit log is built.
+        """
+        if self.unique_across_machines:
+            thread_id = str(uuid.uuid4())
+        else:
+            thread_id = f"{self._PROCESS_NONCE}-{next(self._counter):08x}"
+        start_time_ns = time.time_ns()
+        
+        # Store for history retrieval
+        self._last_thread_id = thread_id
+        self._last_config = {"configurable": {"thread_id": thread_id}}
+        
+        # Record node visits (and inline history) as they happen
+        recorder = _RunRecorder(record_history=self.audit_mode == "inline")
+        self._path_by_thread[thread_id] = recorder.path
+        if recorder.history is not None:
+            self._history_by_thread[thread_id] = recorder.history
+        
+        return thread_id, start_time_ns, recorder
+
+    def _finish_run(
+        self,
+        thread_id: str,
+        document_title: str,
+        start_time_ns: int,
+        final_state: Dict[str, Any],
+        build_audit_log: bool = False
+    ) -> None:
+        """
+        Flush checkpoints and record what is needed for the run's audit log.
+        
+        The log itself is only built now if requested or if it has to be
+        persisted; otherwise get_audit_log() builds it on demand.
+        """
+        if self.audit_mode != "off":
+            if self.checkpointer:
+                self.checkpointer.flush(thread_id)
+            
+            # Inline history rows hold raw time_ns() readings; format them
+            # in one pass now that the run is over
+            history = self._history_by_thread.get(thread_id)
+            if history is not None:
+                history.timestamp = [
+                    datetime.fromtimestamp(ns / 1e9).isoformat() for ns in history.timestamp
+                ]
+            
+            # Keep only the summary fields, not the full document state
+            summary = {
+                key: final_state[key] for key in _AUDIT_SUMMARY_KEYS if key in final_state
+            }
+            if not summary.get("end_time"):
+                summary["end_time_ns"] = time.time_ns()
+            self._pending_audit[thread_id] = (document_title, start_time_ns, summary)
+            
+            if build_audit_log or self.audit_writer:
+                audit_log = self._materialize_audit_log(thread_id)
+                if self.audit_writer:
+                    self.audit_writer.enqueue(audit_log.to_json())
             
             # Add thread_id to state for reference
             final_state["thread_id"] = thread_id
             final_state["audit_log_available"] = True
-        
-        return document, final_state
 
     def get_visualization(self) -> str:
         """Get workflow visualization."""
@@ -476,43 +1251,74 @@ class LangGraphOrchestrator:
             List of StateHistoryEntry objects showing each state transition.
             
         Raises:
-            ValueError: If checkpointing is not enabled or no history available.
+            ValueError: If the audit trail is disabled or no history available.
         """
-        if not self.enable_checkpointing or not self.checkpointer:
-            raise ValueError("Checkpointing must be enabled to retrieve execution history")
+        if self.audit_mode == "off":
+            raise ValueError("Audit trail is disabled (audit_mode='off'); no execution history")
         
         thread_id = thread_id or self._last_thread_id
         if not thread_id:
             raise ValueError("No execution history available. Run generate_documentation first.")
         
-        config = {"configurable": {"thread_id": thread_id}}
+        if self.audit_mode == "inline":
+            return list(self._history_by_thread.get(thread_id, ()))
         
-        history = []
-        step = 0
+        history, _ = self._read_execution_history(thread_id)
+        return history
+    
+    def _read_execution_history(
+        self,
+        thread_id: str
+    ) -> Tuple[List[StateHistoryEntry], List[str]]:
+        """
+        Read state history and execution path from the checkpointer in one pass.
         
+        Returns:
+            Tuple of (history in chronological order, node path with
+            "unknown" nodes skipped)
+        """
+        config = {"configurable": {"thread_id": thread_id}}
+        now_iso = datetime.now().isoformat()  # Fallback timestamp, formatted once
+        
+        # Only the saver read is guarded; the loop below is exception-free,
+        # and anything other than a missing thread/saver propagates.
         try:
-            for state_snapshot in self.app.get_state_history(config):
-                values = state_snapshot.values
-                metadata = state_snapshot.metadata or {}
-                
-                entry = StateHistoryEntry(
-                    step=step,
-                    node=metadata.get("source", "unknown"),
-                    timestamp=metadata.get("created_at", datetime.now().isoformat()),
-                    portfolio=values.get("detected_portfolio"),
-                    iteration=values.get("current_iteration"),
-                    compliance_passed=values.get("compliance_passed"),
-                    editorial_passed=values.get("editorial_passed"),
-                    quality_score=values.get("quality_score"),
-                    phase=values.get("phase")
-                )
-                history.append(entry)
-                step += 1
-        except Exception as e:
+            # Read checkpoint tuples straight from the saver; this skips the
+            # StateSnapshot assembly that app.get_state_history() performs.
+            checkpoint_tuples = list(self.checkpointer.list(config))
+        except (KeyError, AttributeError) as e:
             logger.warning(f"[LangGraphOrchestrator] Error retrieving history: {e}")
+            return [], []
+        
+        # Saver yields newest first; fill pre-sized lists from the tail so
+        # steps are numbered in chronological order.
+        total = len(checkpoint_tuples)
+        history = [None] * total
+        nodes = [None] * total
+        for offset, checkpoint_tuple in enumerate(checkpoint_tuples):
+            values = checkpoint_tuple.checkpoint.get("channel_values", {})
+            metadata = checkpoint_tuple.metadata or {}
+            step = total - 1 - offset
+            node = metadata.get("source", "unknown")
+            
+            nodes[step] = node
+            history[step] = StateHistoryEntry(
+                step=step,
+                node=_NODE_BY_NAME.get(node, NodeId.UNKNOWN),
+                timestamp=metadata.get(
+                    "created_at",
+                    checkpoint_tuple.checkpoint.get("ts", now_iso)
+                ),
+                portfolio=values.get("detected_portfolio"),
+                iteration=values.get("current_iteration"),
+                compliance_passed=values.get("compliance_passed"),
+                editorial_passed=values.get("editorial_passed"),
+                quality_score=values.get("quality_score"),
+                phase=values.get("phase")
+            )
         
-        # Reverse to get chronological order (LangGraph returns newest first)
-        return list(reversed(history))
+        path = [node for node in nodes if node != "unknown"]
+        return history, path
     
     def get_audit_log(self, thread_id: Optional[str] = None) -> Optional[ExecutionAuditLog]:
         """
@@ -528,7 +1334,26 @@ class LangGraphOrchestrator:
         thread_id = thread_id or self._last_thread_id
         if not thread_id:
             return None
-        return self._audit_logs.get(thread_id)
+        audit_log = self._audit_logs.get(thread_id)
+        if audit_log is None and thread_id in self._pending_audit:
+            audit_log = self._materialize_audit_log(thread_id)
+        return audit_log
+    
+    def _materialize_audit_log(self, thread_id: str) -> ExecutionAuditLog:
+        """Build and cache the audit log from a run's pending inputs."""
+        document_title, start_time_ns, summary = self._pending_audit.pop(thread_id)
+        end_time_ns = summary.pop("end_time_ns", None)
+        if end_time_ns is not None:
+            summary["end_time"] = datetime.fromtimestamp(end_time_ns / 1e9).isoformat()
+        
+        audit_log = self._build_audit_log(
+            thread_id=thread_id,
+            document_title=document_title,
+            start_time=datetime.fromtimestamp(start_time_ns / 1e9).isoformat(),
+            final_state=summary
+        )
+        self._audit_logs[thread_id] = audit_log
+        return audit_log
     
     def _build_audit_log(
         self,
@@ -549,20 +1374,32 @@ class LangGraphOrchestrator:
         Returns:
             ExecutionAuditLog with complete execution trace
         """
-        history = self.get_execution_history(thread_id)
-        execution_path = [entry.node for entry in history if entry.node != "unknown"]
+        # Path was recorded inline during the run; the full state history
+        # is only replayed from the checkpointer if someone asks for it.
+        execution_path = self._path_by_thread.get(thread_id)
+        state_history = self._history_by_thread.get(thread_id)
+        if execution_path is None and self.checkpointer:
+            # No inline record (e.g. run not started by this instance):
+            # derive both from one checkpointer pass.
+            history, execution_path = self._read_execution_history(thread_id)
+            state_history = StateHistoryColumns.from_entries(history)
+        
+        history_loader = None
+        if state_history is None and self.checkpointer:
+            history_loader = lambda: self.get_execution_history(thread_id)
         
         return ExecutionAuditLog(
             thread_id=thread_id,
             document_title=document_title,
             start_time=start_time,
-            end_time=final_state.get("end_time", datetime.now().isoformat()),
+            end_time=final_state.get("end_time") or datetime.now().isoformat(),
             detected_portfolio=final_state.get("detected_portfolio", "unknown"),
             final_quality_score=final_state.get("quality_score", 0.0),
             total_iterations=final_state.get("current_iteration", 0),
             generation_successful=final_state.get("generation_successful", False),
-            execution_path=execution_path,
-            state_history=history
+            execution_path=execution_path or [],
+            history=state_history,
+            history_loader=history_loader
         )
     
     def get_execution_summary(self, thread_id: Optional[str] = None) -> Dict[str, Any]:
@@ -596,7 +1433,7 @@ class LangGraphOrchestrator:
             "state_transitions": [
                 {
                     "step": entry.step,
-                    "node": entry.node,
+                    "node": entry.node_name,
                     "iteration": entry.iteration,
                     "phase": entry.phase
                 }
@@ -618,37 +1455,50 @@ class LangGraphOrchestrator:
             print("No execution history available.")
             return
         
-        print("\n" + "=" * 70)
-        print("EXECUTION AUDIT LOG")
-        print("=" * 70)
-        print(f"Thread ID:    {audit_log.thread_id}")
-        print(f"Document:     {audit_log.document_title}")
-        print(f"Portfolio:    {audit_log.detected_portfolio}")
-        print(f"Start Time:   {audit_log.start_time}")
-        print(f"End Time:     {audit_log.end_time}")
-        print(f"Success:      {audit_log.generation_successful}")
-        print(f"Quality:      {audit_log.final_quality_score:.1f}/10")
-        print(f"Iterations:   {audit_log.total_iterations}")
-        print("\n" + "-" * 70)
-        print("EXECUTION PATH")
-        print("-" * 70)
-        print(audit_log.get_path_summary())
-        print("\n" + "-" * 70)
-        print("STATE TRANSITIONS")
-        print("-" * 70)
-        print(f"{'Step':<6}{'Node':<20}{'Iteration':<12}{'Phase':<15}")
-        print("-" * 70)
-        for entry in audit_log.state_history:
-            iteration_str = str(entry.iteration) if entry.iteration is not None else "-"
-            phase_str = entry.phase if entry.phase else "-"
-            print(f"{entry.step:<6}{entry.node:<20}{iteration_str:<12}{phase_str:<15}")
-        print("\n" + "-" * 70)
-        print("DECISION POINTS")
-        print("-" * 70)
-        for decision in audit_log.get_decision_points():
-            passed_str = "PASSED" if decision["passed"] else "FAILED"
-            print(f"Step {decision['step']}: {decision['node']} -> {passed_str} -> routed to {decision['routed_to']}")
-        print("=" * 70 + "\n")
+        rule = "=" * 70
+        sep = "-" * 70
+        
+        lines = [
+            "",
+            rule,
+            "EXECUTION AUDIT LOG",
+            rule,
+            f"Thread ID:    {audit_log.thread_id}",
+            f"Document:     {audit_log.document_title}",
+            f"Portfolio:    {audit_log.detected_portfolio}",
+            f"Start Time:   {audit_log.start_time}",
+            f"End Time:     {audit_log.end_time}",
+            f"Success:      {audit_log.generation_successful}",
+            f"Quality:      {audit_log.final_quality_score:.1f}/10",
+            f"Iterations:   {audit_log.total_iterations}",
+            "",
+            sep,
+            "EXECUTION PATH",
+            sep,
+            audit_log.get_path_summary(),
+            "",
+            sep,
+            "STATE TRANSITIONS",
+            sep,
+            f"{'Step':<6}{'Node':<20}{'Iteration':<12}{'Phase':<15}",
+            sep,
+        ]
+        lines.extend(
+            f"{entry.step:<6}{entry.node:<20}"
+            f"{str(entry.iteration) if entry.iteration is not None else '-':<12}"
+            f"{entry.phase or '-':<15}"
+            for entry in audit_log.state_history
+        )
+        lines += ["", sep, "DECISION POINTS", sep]
+        lines.extend(
+            f"Step {d['step']}: {d['node']} -> {'PASSED' if d['passed'] else 'FAILED'} -> routed to {d['routed_to']}"
+            for d in audit_log.get_decision_points()
+        )
+        lines += [rule, "", ""]
+        
+        # One write + flush instead of a print() (lock + flush) per line
+        sys.stdout.write("\n".join(lines))
+        sys.stdout.flush()
 
 
 # ============================================================
@@ -7,14 +7,15 @@ to automate insurance model documentation generation.
 Agent Workflow (LangGraph State Machine):
 1. Research Agent: Gather relevant context from knowledge base
 2. Writer Agent: Generate documentation sections
-3. Compliance Agent: Check regulatory compliance
-4. Editor Agent: Review and improve quality
-5. Conditional routing: If quality fails → Revise → back to Compliance
+3. Compliance Agent: Check regulatory compliance   } run in
+4. Editor Agent: Review and improve quality        } parallel
+5. Conditional routing: If quality fails → Revise → back to both reviews
 6. Iterate until quality standards met or max iterations reached
 
 Key LangGraph Features Used:
 - StateGraph: Manages shared state across all nodes
 - Conditional edges: Routes based on compliance/quality results
+- Send fan-out: Researches, writes and revises sections in parallel
 - State persistence: Maintains iteration count, sections, reports
 - Visualization: Can generate workflow diagrams
 
@@ -29,9 +30,17 @@ Usage:
     )
 """
 
+from collections import Counter, OrderedDict
+from functools import cached_property, lru_cache
+from hashlib import blake2b
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, TypedDict, Annotated
+from typing import Any, AsyncIterator, Callable, List, Dict, Optional, Tuple, TypedDict, Annotated, Union
+import json
 import logging
+import threading
+import time
+
+import numpy as np
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -40,6 +49,7 @@ import operator
 # LangGraph imports
 from langgraph.graph import StateGraph, END
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Send
 
 from rag.retrieval import DocumentRetriever
 from agents.research_agent import ResearchAgent, ResearchFindings
@@ -80,6 +90,11 @@ class GenerationRequest:
     metadata: Optional[Dict] = None  # Additional metadata for tracking
 
 
+def _merge_dict(left: Dict, right: Dict) -> Dict:
+    """Reducer: merge per-section results written by parallel Send tasks."""
+    return {**left, **right}
+
+
 # LangGraph State Definition
 class DocumentationState(TypedDict):
     """
@@ -92,11 +107,14 @@ class DocumentationState(TypedDict):
     request: GenerationRequest
     
     # Research phase
-    research_results: Dict[str, ResearchFindings]
+    research_results: Annotated[Dict[str, ResearchFindings], _merge_dict]  # Merged per section
     
     # Writing phase
-    sections: List[SectionContent]
+    section_drafts: Annotated[Dict[str, SectionContent], _merge_dict]  # Merged per section
+    sections: List[SectionContent]  # Drafts in document order (set by assemble)
     current_document: str
+    revision_plan: Dict[str, List[str]]  # Section title -> instructions for it
+    revision_fingerprint: Optional[str]  # Hash of the last plan acted on
     
     # Compliance phase
     compliance_report: Optional[ComplianceReport]
@@ -123,6 +141,99 @@ class DocumentationState(TypedDict):
 WorkflowState = DocumentationState
 
 
+class SectionTask(TypedDict, total=False):
+    """
+    Payload sent to a per-section node (research_one/write_one/revise_one).
+    
+    Each Send gets its own copy, so parallel section tasks never see each
+    other's partial results; their outputs are merged by _merge_dict.
+    """
+    request: GenerationRequest
+    section: str
+    context: str
+    instructions: Optional[str]
+    draft: SectionContent  # revise_one only: version to keep if revision fails
+
+
+# Finding levels that produce revision instructions
+_ACTIONABLE_SEVERITIES = frozenset({ComplianceSeverity.CRITICAL, ComplianceSeverity.HIGH})
+_ACTIONABLE_PRIORITIES = frozenset({ReviewPriority.CRITICAL, ReviewPriority.HIGH})
+
+# Configurable key carrying the orchestrator instance into graph callables
+_ORCHESTRATOR_KEY = "__orchestrator"
+
+
+def _bind(method_name: str) -> Callable[[Any, Dict], Any]:
+    """
+    Graph callable that dispatches to the running orchestrator's method.
+    
+    Lets one compiled graph serve every DocumentationOrchestrator: the
+    instance travels in the invocation config rather than being baked into
+    the nodes as bound methods.
+    """
+    def call(state, config):
+        orchestrator = config["configurable"][_ORCHESTRATOR_KEY]
+        return getattr(orchestrator, method_name)(state)
+    call.__name__ = method_name
+    return call
+
+
+class ResearchCache:
+    """
+    Thread-safe LRU cache with per-entry TTL for research findings.
+    
+    Keyed by (section, model_type, year, document_type), so revisions and
+    repeated requests for the same model reuse retriever results instead of
+    re-querying the vector store. Only successful lookups are cached.
+    """
+    
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 3600.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, Tuple[float, ResearchFindings]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: tuple) -> Optional[ResearchFindings]:
+        """Return cached findings for key, or None on miss/expiry."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, findings = entry
+            if now - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return findings
+    
+    def put(self, key: tuple, findings: ResearchFindings) -> None:
+        """Store findings, evicting least recently used entries over max_size."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), findings)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries)
+            }
+
+
 class DocumentationOrchestrator:
     """
     LangGraph-based orchestrator for multi-agent documentation generation.
@@ -154,7 +265,11 @@ class DocumentationOrchestrator:
         self,
         retriever: Optional[DocumentRetriever] = None,
         max_iterations: int = 3,
-        quality_threshold: str = "GOOD"
+        quality_threshold: str = "GOOD",
+        max_concurrency: int = 4,
+        research_cache_size: int = 512,
+        research_cache_ttl: float = 3600.0,
+        semantic_cache_threshold: float = 0.95
     ):
         """
         Initialize the orchestrator and build the LangGraph workflow.
@@ -163,37 +278,86 @@ class DocumentationOrchestrator:
             retriever: DocumentRetriever instance (shared across agents)
             max_iterations: Maximum revision iterations
             quality_threshold: Minimum quality threshold to accept
+            max_concurrency: Maximum per-section tasks (retriever/LLM calls)
+                             in flight at once; keeps the fan-out under
+                             API rate limits
+            research_cache_size: Maximum cached research findings
+            research_cache_ttl: Seconds a cached finding stays valid
+            semantic_cache_threshold: Cosine similarity above which a cached
+                                      query's findings are reused
         """
         self.max_iterations = max_iterations
         self.quality_threshold = quality_threshold
-        
-        # Initialize shared retriever
-        if retriever is None:
-            try:
-                logger.info("Orchestrator: Initializing DocumentRetriever")
-                self.retriever = DocumentRetriever()
-            except Exception as e:
-                logger.warning(f"Could not initialize retriever: {e}")
-                self.retriever = None
-        else:
+        self.max_concurrency = max_concurrency
+        self._research_cache = ResearchCache(research_cache_size, research_cache_ttl)
+        # Section title -> (content, rendered markdown) from the last assemble
+        self._rendered_sections: Dict[str, Tuple[str, str]] = {}
+        # Embeddings of queries _research_node left to research_one tasks
+        self._query_embeddings: Dict[str, np.ndarray] = {}
+        # Settings for the research agent's semantic cache
+        self._research_cache_ttl = research_cache_ttl
+        self._semantic_cache_threshold = semantic_cache_threshold
+        
+        # Retriever and agents are created on first use (see the cached
+        # properties below), so building the graph alone stays cheap
+        if retriever is not None:
             self.retriever = retriever
         
-        # Initialize agents (these don't change - still use the same agent classes)
-        logger.info("Orchestrator: Initializing agents")
-        self.research_agent = ResearchAgent(retriever=self.retriever)
-        self.writer_agent = WriterAgent()
-        self.compliance_agent = ComplianceAgent(retriever=self.retriever)
-        self.editor_agent = EditorAgent()
-        
-        # Build the LangGraph workflow
+        # LangGraph workflow (compiled once per process, shared)
         self.workflow = self._build_workflow()
         
         logger.info("LangGraph DocumentationOrchestrator initialized")
     
-    def _build_workflow(self) -> CompiledStateGraph:
+    # ============================================================================
+    # LAZY AGENTS
+    # Phase nodes touch the agents their section tasks need before fanning
+    # out, so parallel tasks never race to construct them
+    # ============================================================================
+    
+    @cached_property
+    def retriever(self) -> Optional[DocumentRetriever]:
+        """Shared retriever (None if the knowledge base is unavailable)."""
+        try:
+            logger.info("Orchestrator: Initializing DocumentRetriever")
+            return DocumentRetriever()
+        except Exception as e:
+            logger.warning(f"Could not initialize retriever: {e}")
+            return None
+    
+    @cached_property
+    def research_agent(self) -> ResearchAgent:
+        logger.info("Orchestrator: Initializing ResearchAgent")
+        return ResearchAgent(
+            retriever=self.retriever,
+            sem_cache_tau=self._semantic_cache_threshold,
+            sem_cache_ttl=self._research_cache_ttl
+        )
+    
+    @cached_property
+    def writer_agent(self) -> WriterAgent:
+        logger.info("Orchestrator: Initializing WriterAgent")
+        return WriterAgent()
+    
+    @cached_property
+    def compliance_agent(self) -> ComplianceAgent:
+        logger.info("Orchestrator: Initializing ComplianceAgent")
+        return ComplianceAgent(retriever=self.retriever)
+    
+    @cached_property
+    def editor_agent(self) -> EditorAgent:
+        logger.info("Orchestrator: Initializing EditorAgent")
+        return EditorAgent()
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _build_workflow() -> CompiledStateGraph:
         """
         Build the LangGraph state machine for document generation workflow.
         
+        The topology depends only on code, so the graph is compiled once per
+        process and shared by all instances; nodes resolve the orchestrator
+        from the run config (see _bind and _run_config).
+        
         This is where the magic happens - we define:
         1. All the nodes (functions that process state)
         2. Edges between nodes (workflow connections)
@@ -205,28 +369,45 @@ class DocumentationOrchestrator:
         # Create the graph
         workflow = StateGraph(DocumentationState)
         
-        # Add nodes (each is a function that takes state and returns updates)
-        workflow.add_node("research", self._research_node)
-        workflow.add_node("write", self._write_node)
-        workflow.add_node("compliance", self._compliance_node)
-        workflow.add_node("editorial", self._editorial_node)
-        workflow.add_node("revise", self._revise_node)
-        workflow.add_node("finalize", self._finalize_node)
+        # Add nodes (each is a function that takes state and returns updates).
+        # research/write/revise are phase nodes that fan out one *_one task
+        # per section via Send; LangGraph runs those tasks in parallel.
+        workflow.add_node("research", _bind("_research_node"))
+        workflow.add_node("research_one", _bind("_research_one_node"))
+        workflow.add_node("write", _bind("_write_node"))
+        workflow.add_node("write_one", _bind("_write_one_node"))
+        workflow.add_node("assemble", _bind("_assemble_node"))
+        workflow.add_node("compliance", _bind("_compliance_node"))
+        workflow.add_node("editorial", _bind("_editorial_node"))
+        workflow.add_node("review", _bind("_review_node"))
+        workflow.add_node("revise", _bind("_revise_node"))
+        workflow.add_node("revise_one", _bind("_revise_one_node"))
+        workflow.add_node("finalize", _bind("_finalize_node"))
         
         # Set entry point
         workflow.set_entry_point("research")
         
-        # Add edges (unconditional transitions)
-        workflow.add_edge("research", "write")
-        workflow.add_edge("write", "compliance")
-        workflow.add_edge("compliance", "editorial")
-        workflow.add_edge("revise", "compliance")  # After revision, check compliance again
+        # Per-section fan-out; each *_one node fans back in to a single
+        # successor once all tasks of its super-step have finished
+        workflow.add_conditional_edges("research", _bind("_dispatch_research"), ["research_one", "write"])
+        workflow.add_edge("research_one", "write")
+        workflow.add_conditional_edges("write", _bind("_dispatch_writes"), ["write_one", "assemble"])
+        workflow.add_edge("write_one", "assemble")
+        workflow.add_conditional_edges("revise", _bind("_dispatch_revisions"), ["revise_one", "assemble"])
+        workflow.add_edge("revise_one", "assemble")
+        
+        # Add edges (unconditional transitions).
+        # Compliance and editorial both only read current_document, so they
+        # run in parallel after every (re)write and join at review.
+        workflow.add_edge("assemble", "compliance")
+        workflow.add_edge("assemble", "editorial")
+        workflow.add_edge(["compliance", "editorial"], "review")
         
         # Add conditional edges (this is the key LangGraph feature!)
-        # After editorial review, decide: revise, finalize, or end
+        # After both reviews, decide: revise, finalize, or end
         workflow.add_conditional_edges(
-            "editorial",
-            self._should_revise,  # Function that returns next node name
+            "review",
+            _bind("_should_revise"),  # Function that returns next node name
             {
                 "revise": "revise",      # Quality failed, not max iterations → revise
                 "finalize": "finalize",  # Quality passed → finalize
@@ -260,12 +441,88 @@ class DocumentationOrchestrator:
         """
         logger.info(f"Starting LangGraph documentation generation: {request.document_title}")
         
-        # Initialize state
-        initial_state: DocumentationState = {
+        initial_state = self._initial_state(request)
+        try:
+            # Execute the workflow (LangGraph handles all the routing!)
+            final_state = self.workflow.invoke(initial_state, config=self._run_config())
+        except Exception as e:
+            return self._fail(initial_state, e)
+        return self._complete(request, final_state)
+    
+    async def agenerate_documentation(
+        self,
+        request: GenerationRequest
+    ) -> Tuple[str, DocumentationState]:
+        """
+        Async variant of generate_documentation.
+        
+        Drains generate_documentation_stream and returns its final result.
+        
+        Args:
+            request: GenerationRequest specifying what to generate
+        
+        Returns:
+            Tuple of (final_document_text, final_state)
+        """
+        final_state = None
+        async for node_name, update in self.generate_documentation_stream(request):
+            if node_name == END:
+                final_state = update
+        return final_state.get("final_document"), final_state
+    
+    async def generate_documentation_stream(
+        self,
+        request: GenerationRequest
+    ) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Generate documentation, yielding each node's update as it finishes.
+        
+        Lets a UI show progress (research done, writing in progress, ...)
+        instead of waiting for the whole pipeline. Per-section tasks are
+        reported under their node name (research_one, write_one, ...).
+        
+        Args:
+            request: GenerationRequest specifying what to generate
+        
+        Yields:
+            (node_name, update) per node, then (END, final_state) where
+            final_state is what generate_documentation would return
+        """
+        logger.info(f"Starting LangGraph documentation generation: {request.document_title}")
+        
+        initial_state = self._initial_state(request)
+        final_state = None
+        try:
+            # "updates" drives progress; "values" carries the full state
+            # after each step so the last one is the final state
+            async for mode, chunk in self.workflow.astream(
+                initial_state,
+                config=self._run_config(),
+                stream_mode=["updates", "values"]
+            ):
+                if mode == "values":
+                    final_state = chunk
+                    continue
+                for node_name, update in chunk.items():
+                    yield node_name, update or {}
+        except Exception as e:
+            _, failed_state = self._fail(initial_state, e)
+            yield END, failed_state
+            return
+        
+        _, final_state = self._complete(request, final_state)
+        yield END, final_state
+    
+    def _initial_state(self, request: GenerationRequest) -> DocumentationState:
+        """Build the initial workflow state for a request."""
+        return {
             "request": request,
             "research_results": {},
+            "section_drafts": {},
             "sections": [],
             "current_document": "",
+            "revision_plan": {},
+            "revision_fingerprint": None,
             "compliance_report": None,
             "editorial_review": None,
             "current_iteration": 0,
@@ -275,26 +532,50 @@ class DocumentationOrchestrator:
             "errors": [],
             "final_document": None
         }
-        
-        try:
-            # Execute the workflow (LangGraph handles all the routing!)
-            final_state = self.workflow.invoke(initial_state)
-            
-            # Add backward compatibility attributes for test files
-            final_state["sections_generated"] = final_state["sections"]
-            final_state["research_complete"] = len(final_state["research_results"]) > 0
-            final_state["writing_complete"] = len(final_state["sections"]) > 0
-            final_state["compliance_passed"] = final_state["quality_passed"]
-            final_state["editorial_approved"] = final_state["quality_passed"]
-            
-            logger.info(f"[OK] LangGraph workflow complete: {request.document_title}")
-            return final_state["final_document"], final_state
-            
-        except Exception as e:
-            logger.error(f"Error in LangGraph workflow: {e}")
-            initial_state["status"] = WorkflowStatus.FAILED
-            initial_state["errors"].append(str(e))
-            return None, initial_state
+    
+    def _run_config(self) -> Dict:
+        """
+        Invocation config: binds this instance to the shared graph, and
+        max_concurrency bounds the per-section fan-out.
+        """
+        return {
+            "max_concurrency": self.max_concurrency,
+            "configurable": {_ORCHESTRATOR_KEY: self}
+        }
+    
+    def _complete(
+        self,
+        request: GenerationRequest,
+        final_state: DocumentationState
+    ) -> Tuple[str, DocumentationState]:
+        """Add backward compatibility attributes and return the result."""
+        # Add backward compatibility attributes for test files
+        final_state["sections_generated"] = final_state["sections"]
+        final_state["research_complete"] = len(final_state["research_results"]) > 0
+        final_state["writing_complete"] = len(final_state["sections"]) > 0
+        final_state["compliance_passed"] = final_state["quality_passed"]
+        final_state["editorial_approved"] = final_state["quality_passed"]
+        
+        logger.info(f"[OK] LangGraph workflow complete: {request.document_title}")
+        return final_state["final_document"], final_state
+    
+    def _fail(
+        self,
+        initial_state: DocumentationState,
+        error: Exception
+    ) -> Tuple[None, DocumentationState]:
+        """Mark the initial state as failed and return it."""
+        logger.error(f"Error in LangGraph workflow: {error}")
+        initial_state["status"] = WorkflowStatus.FAILED
+        initial_state["errors"].append(str(error))
+        return None, initial_state
+    
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Research cache counters for the exact and semantic caches."""
+        return {
+            "exact": self._research_cache.stats(),
+            "semantic": self.research_agent.semantic_cache.stats()
+        }
     
     def generate_status_report(self, state: DocumentationState) -> str:
         """
@@ -327,7 +608,7 @@ class DocumentationOrchestrator:
         # Compliance phase
         if state.get('compliance_report'):
             report = state['compliance_report']
-            lines.append(f"Compliance Check: {len(report.issues)} issues found")
+            lines.append(f"Compliance Check: {len(report.findings)} findings")
         else:
             lines.append("Compliance Check: Not performed")
         
@@ -354,103 +635,238 @@ class DocumentationOrchestrator:
     
     def _research_node(self, state: DocumentationState) -> Dict:
         """
-        Research node: Gather relevant context for each section.
+        Research node: Resolve section research in one batch where possible.
         
-        This is the same logic as before, just formatted as a LangGraph node.
+        Cached sections are served from the research caches; the rest are
+        retrieved with a single batched vector search. Sections the batch
+        can't answer (no results under the request's filters) are left to
+        research_one tasks, which apply the retriever's filter fallback
+        (see _dispatch_research).
         """
         logger.info("Node: Research")
-        state["status"] = WorkflowStatus.RESEARCHING
+        research_agent = self.research_agent  # Create before fan-out
         
         request = state["request"]
         sections = request.sections_required or self.STANDARD_MODEL_SECTIONS
-        research_results = {}
         
-        for section in sections:
-            logger.info(f"  Researching: {section}")
-            
-            query = f"{section} {request.model_type or ''} model {request.document_type or ''}"
+        queries, filters = self._research_queries(request, sections)
+        
+        research_results = {}
+        pending = []
+        for section, query in zip(sections, queries):
+            cache_key = self._research_key(request, section)
+            cached = self._research_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("  Research cache hit: %s", section)
+                research_results[section] = cached
+            else:
+                pending.append((section, query, cache_key))
+        
+        if pending and self.retriever is not None:
+            # Each pending query is embedded once; the vectors serve the
+            # semantic cache, the batched search and any research_one task
+            embeddings = research_agent.embed_topics([query for _, query, _ in pending])
+            misses = []
+            for i, (section, query, cache_key) in enumerate(pending):
+                query_embedding = None if embeddings is None else embeddings[i]
+                similar = research_agent.cached_findings(query, query_embedding, 5, filters)
+                if similar is not None:
+                    logger.debug("  Semantic cache hit: %s", section)
+                    self._research_cache.put(cache_key, similar)
+                    research_results[section] = similar
+                else:
+                    misses.append((section, query, cache_key, query_embedding))
             
-            filters = {}
-            if request.model_type:
-                filters["model_type"] = request.model_type
-            if request.year:
-                filters["year"] = request.year
+            batch_results = []
+            if misses:
+                try:
+                    batch_results = self.retriever.retrieve_batch(
+                        [query for _, query, _, _ in misses],
+                        n_results=5,
+                        filters=filters,
+                        min_similarity=research_agent.min_similarity,
+                        query_embeddings=None if embeddings is None else [
+                            query_embedding.tolist() for _, _, _, query_embedding in misses
+                        ]
+                    )
+                except Exception as e:
+                    logger.warning("  Batch retrieval failed, researching per section: %s", e)
             
-            try:
-                findings = self.research_agent.research_topic(
-                    topic=query,
-                    n_results=5,
-                    filters=filters if filters else None
-                )
+            for (section, query, cache_key, query_embedding), results in zip(misses, batch_results):
+                if not results:
+                    continue
+                findings = research_agent.findings_from_results(query, results)
+                research_agent.cache_findings(findings, query_embedding, 5, filters)
+                self._research_cache.put(cache_key, findings)
                 research_results[section] = findings
-                logger.info(f"    [OK] Found {len(findings.findings)} relevant sources")
-            except Exception as e:
-                logger.warning(f"    [X] Research failed for {section}: {e}")
-                research_results[section] = ResearchFindings(
-                    query=query,
-                    findings=[],
-                    context="",
-                    sources=[]
-                )
-        
-        return {"research_results": research_results}
+            
+            # Sections the batch left unresolved go to research_one tasks,
+            # which reuse the embedding instead of encoding the query again
+            self._query_embeddings.clear()
+            self._query_embeddings.update(
+                (query, query_embedding)
+                for section, query, _, query_embedding in misses
+                if section not in research_results and query_embedding is not None
+            )
+        
+        logger.info("  Resolved %d/%d sections without per-section search", len(research_results), len(sections))
+        
+        return {
+            "status": WorkflowStatus.RESEARCHING,
+            "research_results": research_results
+        }
+    
+    def _research_one_node(self, task: SectionTask) -> Dict:
+        """
+        Research one section: Gather relevant context for it.
+        
+        Runs only for sections the batched search in _research_node could
+        not resolve; research_topic retries with relaxed filters.
+        """
+        request = task["request"]
+        section = task["section"]
+        logger.debug("  Researching: %s", section)
+        
+        cache_key = self._research_key(request, section)
+        cached = self._research_cache.get(cache_key)
+        if cached is not None:
+            return {"research_results": {section: cached}}
+        
+        (query,), filters = self._research_queries(request, [section])
+        try:
+            # research_topic checks and fills the semantic cache itself
+            findings = self.research_agent.research_topic(
+                topic=query,
+                n_results=5,
+                filters=filters,
+                embedding=self._query_embeddings.pop(query, None)
+            )
+            logger.debug("    [OK] %s: found %d relevant sources", section, len(findings.findings))
+            self._research_cache.put(cache_key, findings)
+        except Exception as e:
+            logger.warning("    [X] Research failed for %s: %s", section, e)
+            findings = ResearchFindings(
+                query=query,
+                findings=[],
+                context="",
+                sources=[]
+            )
+        
+        return {"research_results": {section: findings}}
+    
+    def _research_queries(
+        self,
+        request: GenerationRequest,
+        sections: List[str]
+    ) -> Tuple[List[str], Optional[Dict]]:
+        """
+        Build retriever queries for sections, plus the shared metadata filters.
+        
+        Filters and the query suffix depend only on the request, so they
+        are built once rather than per section.
+        """
+        filters = {
+            key: value
+            for key, value in (("model_type", request.model_type), ("year", request.year))
+            if value
+        }
+        suffix = f" {request.model_type or ''} model {request.document_type or ''}"
+        return [section + suffix for section in sections], filters or None
+    
+    @staticmethod
+    def _research_key(request: GenerationRequest, section: str) -> tuple:
+        """Exact research cache key for a section of a request."""
+        return (section, request.model_type, request.year, request.document_type)
     
     def _write_node(self, state: DocumentationState) -> Dict:
         """
-        Write node: Generate documentation sections using research context.
+        Write node: Start the writing phase.
         
-        CRITICAL: Now passes source_content from request to writer agent.
+        Sections are written in parallel by write_one tasks
+        (see _dispatch_writes) and joined by the assemble node.
         """
         logger.info("Node: Write")
-        state["status"] = WorkflowStatus.WRITING
+        if logger.isEnabledFor(logging.INFO):
+            # One event for the whole research phase: a section=hits summary
+            # in the message, per-section detail in extra for structured handlers
+            hits = [
+                (name, len(findings.findings))
+                for name, findings in state["research_results"].items()
+            ]
+            logger.info(
+                "Research done: %s",
+                ", ".join(f"{name}={count}" for name, count in hits),
+                extra={"sections": [{"name": name, "hits": count} for name, count in hits]}
+            )
+        self.writer_agent  # Create before fan-out
+        return {"status": WorkflowStatus.WRITING}
+    
+    def _write_one_node(self, task: SectionTask) -> Dict:
+        """
+        Write one section using its research context.
         
-        request = state["request"]
-        research_results = state["research_results"]
-        sections = request.sections_required or self.STANDARD_MODEL_SECTIONS
+        CRITICAL: Passes source_content from request to writer agent.
+        """
+        request = task["request"]
+        section_name = task["section"]
+        logger.debug("  Writing: %s", section_name)
         
         # Get source content from request (THE FIX for 0% → 100% accuracy)
         source_content = request.additional_context or ""
         
-        generated_sections = []
+        try:
+            # THE CRITICAL FIX: Pass source_content to writer
+            section = self.writer_agent.write_section(
+                section_title=section_name,
+                context=task["context"],
+                source_content=source_content,  # THIS IS THE KEY
+                template=request.document_type,
+                custom_instructions=task.get("instructions")
+            )
+            logger.debug("    [OK] %s: generated %d words", section_name, section.word_count)
+        except Exception as e:
+            logger.error("    [X] Writing failed for %s: %s", section_name, e)
+            # Create placeholder
+            section = SectionContent(
+                title=section_name,
+                content=f"[Error generating {section_name}: {e}]",
+                metadata={}
+            )
         
-        for section_name in sections:
-            logger.info(f"  Writing: {section_name}")
-            
-            findings = research_results.get(section_name)
-            context = findings.context if findings else ""
-            
-            try:
-                # THE CRITICAL FIX: Pass source_content to writer
-                section = self.writer_agent.write_section(
-                    section_title=section_name,
-                    context=context,
-                    source_content=source_content,  # THIS IS THE KEY
-                    template=request.document_type,
-                    custom_instructions=request.custom_instructions
-                )
-                generated_sections.append(section)
-                logger.info(f"    [OK] Generated {len(section.content.split())} words")
-            except Exception as e:
-                logger.error(f"    [X] Writing failed for {section_name}: {e}")
-                # Create placeholder
-                generated_sections.append(
-                    SectionContent(
-                        title=section_name,
-                        content=f"[Error generating {section_name}: {e}]",
-                        metadata={}
-                    )
-                )
+        return {"section_drafts": {section_name: section}}
+    
+    def _assemble_node(self, state: DocumentationState) -> Dict:
+        """
+        Assemble node: Put section drafts in order and render the document.
+        """
+        request = state["request"]
+        drafts = state["section_drafts"]
+        section_names = request.sections_required or self.STANDARD_MODEL_SECTIONS
+        sections = [drafts[name] for name in section_names if name in drafts]
         
-        # Combine into document
+        # Combine into document. Sections a revision left untouched keep
+        # the same content object, so their rendered chunk is reused.
+        rendered = self._rendered_sections
         document_parts = [f"# {request.document_title}\n"]
-        for section in generated_sections:
-            document_parts.append(f"\n## {section.title}\n")
-            document_parts.append(section.content)
-        
-        current_document = "\n".join(document_parts)
+        for section in sections:
+            cached = rendered.get(section.title)
+            if cached is None or cached[0] is not section.content:
+                cached = (section.content, f"\n\n## {section.title}\n\n{section.content}")
+                rendered[section.title] = cached
+            document_parts.append(cached[1])
+        
+        current_document = "".join(document_parts)
+        
+        if logger.isEnabledFor(logging.INFO):
+            words = [(section.title, section.word_count) for section in sections]
+            logger.info(
+                "Sections assembled: %s",
+                ", ".join(f"{name}={count}" for name, count in words),
+                extra={"sections": [{"name": name, "words": count} for name, count in words]}
+            )
         
         return {
-            "sections": generated_sections,
+            "sections": sections,
             "current_document": current_document
         }
     
@@ -459,34 +875,35 @@ class DocumentationOrchestrator:
         Compliance node: Check regulatory requirements.
         """
         logger.info("Node: Compliance Check")
-        state["status"] = WorkflowStatus.COMPLIANCE_CHECK
         
-        # Increment iteration counter (happens automatically with Annotated[int, operator.add])
-        # But we need to do it explicitly here since we're returning updates
-        current_iteration = state.get("current_iteration", 0) + 1
+        # current_iteration has an operator.add reducer, so return the increment
+        # rather than the new total. Compliance and editorial run in the same
+        # step, so only this node reports status (two writers would conflict).
+        update = {
+            "status": WorkflowStatus.COMPLIANCE_CHECK,
+            "current_iteration": 1
+        }
         
         request = state["request"]
         document = state["current_document"]
         
         try:
             report = self.compliance_agent.check_compliance(
-                document_text=document,
-                document_type=request.document_type,
-                model_type=request.model_type
+                document_content=document,
+                document_title=request.document_title,
+                document_type=request.document_type
             )
+            severity_counts = Counter(f.severity for f in report.findings)
             logger.info(f"    [OK] Compliance check complete")
-            logger.info(f"        Critical: {len([i for i in report.issues if i.severity == ComplianceSeverity.CRITICAL])}")
-            logger.info(f"        High: {len([i for i in report.issues if i.severity == ComplianceSeverity.HIGH])}")
+            logger.info(f"        Critical: {severity_counts[ComplianceSeverity.CRITICAL]}")
+            logger.info(f"        High: {severity_counts[ComplianceSeverity.HIGH]}")
             
-            return {
-                "compliance_report": report,
-                "current_iteration": current_iteration
-            }
+            return {**update, "compliance_report": report}
         except Exception as e:
             logger.error(f"    [X] Compliance check failed: {e}")
             return {
+                **update,
                 "compliance_report": None,
-                "current_iteration": current_iteration,
                 "errors": [f"Compliance check failed: {e}"]
             }
     
@@ -495,20 +912,20 @@ class DocumentationOrchestrator:
         Editorial node: Review quality and consistency.
         """
         logger.info("Node: Editorial Review")
-        state["status"] = WorkflowStatus.EDITING
         
         request = state["request"]
         document = state["current_document"]
         
         try:
             review = self.editor_agent.review_document(
-                document_text=document,
+                document_content=document,
+                document_title=request.document_title,
                 document_type=request.document_type,
-                model_type=request.model_type
+                source_content=request.additional_context or ""
             )
             logger.info(f"    [OK] Editorial review complete")
             logger.info(f"        Overall quality: {review.overall_quality}")
-            logger.info(f"        Critical issues: {len([i for i in review.issues if i.priority == ReviewPriority.CRITICAL])}")
+            logger.info(f"        Critical issues: {sum(1 for f in review.findings if f.priority == ReviewPriority.CRITICAL)}")
             
             return {"editorial_review": review}
         except Exception as e:
@@ -518,78 +935,135 @@ class DocumentationOrchestrator:
                 "errors": [f"Editorial review failed: {e}"]
             }
     
+    def _review_node(self, state: DocumentationState) -> Dict:
+        """
+        Review node: Join point once compliance and editorial have both run.
+        
+        Routing happens on the outgoing edge (_should_revise).
+        """
+        return {}
+    
     def _revise_node(self, state: DocumentationState) -> Dict:
         """
-        Revise node: Apply fixes based on compliance and editorial feedback.
+        Revise node: Build fixes from compliance and editorial feedback.
+        
+        Only sections that feedback points at are rewritten (in parallel, by
+        revise_one tasks - see _dispatch_revisions); the rest are kept
+        verbatim and rejoined by the assemble node.
         """
         logger.info("Node: Revise")
-        state["status"] = WorkflowStatus.REVISION
-        
-        request = state["request"]
-        sections = state["sections"]
-        research_results = state["research_results"]
-        compliance_report = state["compliance_report"]
-        editorial_review = state["editorial_review"]
-        
-        # Get source content
-        source_content = request.additional_context or ""
         
-        # Build revision instructions from feedback
-        revision_instructions = self._build_revision_instructions(
-            compliance_report,
-            editorial_review
+        # Group revision instructions by the section they target
+        revision_plan = self._plan_revisions(
+            state["compliance_report"],
+            state["editorial_review"],
+            [section.title for section in state["sections"]]
         )
         
-        logger.info(f"  Revising sections with feedback:")
-        for instruction in revision_instructions[:3]:  # Show first 3
-            logger.info(f"    - {instruction}")
-        
-        revised_sections = []
-        for section in sections:
-            findings = research_results.get(section.title)
-            context = findings.context if findings else ""
-            
-            try:
-                revised = self.writer_agent.write_section(
-                    section_title=section.title,
-                    context=context,
-                    source_content=source_content,
-                    template=request.document_type,
-                    custom_instructions="\n".join(revision_instructions)
-                )
-                revised_sections.append(revised)
-            except Exception as e:
-                logger.warning(f"    [X] Revision failed for {section.title}: {e}")
-                revised_sections.append(section)  # Keep original
-        
-        # Rebuild document
-        document_parts = [f"# {request.document_title}\n"]
-        for section in revised_sections:
-            document_parts.append(f"\n## {section.title}\n")
-            document_parts.append(section.content)
-        
-        current_document = "\n".join(document_parts)
+        logger.info(f"  Revising {len(revision_plan)}/{len(state['sections'])} sections with feedback:")
+        for title, instructions in list(revision_plan.items())[:3]:  # Show first 3
+            logger.info(f"    - {title}: {instructions[0]}")
         
         return {
-            "sections": revised_sections,
-            "current_document": current_document
+            "status": WorkflowStatus.REVISION,
+            "revision_plan": revision_plan,
+            "revision_fingerprint": self._plan_fingerprint(revision_plan)
         }
     
+    def _revise_one_node(self, task: SectionTask) -> Dict:
+        """
+        Revise one section, keeping the current draft if revision fails.
+        """
+        request = task["request"]
+        section = task["draft"]
+        
+        # Get source content
+        source_content = request.additional_context or ""
+        
+        try:
+            revised = self.writer_agent.write_section(
+                section_title=section.title,
+                context=task["context"],
+                source_content=source_content,
+                template=request.document_type,
+                custom_instructions=task.get("instructions")
+            )
+        except Exception as e:
+            logger.warning("    [X] Revision failed for %s: %s", section.title, e)
+            revised = section  # Keep original
+        
+        return {"section_drafts": {section.title: revised}}
+    
     def _finalize_node(self, state: DocumentationState) -> Dict:
         """
         Finalize node: Mark document as complete and ready.
         """
         logger.info("Node: Finalize")
-        state["status"] = WorkflowStatus.COMPLETED
         
         return {
+            "status": WorkflowStatus.COMPLETED,
             "final_document": state["current_document"],
             "quality_passed": True
         }
     
+    # ============================================================================
+    # SECTION FAN-OUT
+    # Each dispatcher returns one Send per section; the payload is the task's
+    # private input, so parallel tasks never share intermediate state
+    # ============================================================================
+    
+    def _section_context(self, state: DocumentationState, section_name: str) -> str:
+        """Research context gathered for a section (empty if none)."""
+        findings = state["research_results"].get(section_name)
+        return findings.context if findings else ""
+    
+    def _dispatch_research(self, state: DocumentationState) -> Union[List[Send], str]:
+        """Fan out one research_one task per section the batch left unresolved."""
+        request = state["request"]
+        sections = request.sections_required or self.STANDARD_MODEL_SECTIONS
+        research_results = state["research_results"]
+        sends = [
+            Send("research_one", {"request": request, "section": section})
+            for section in sections
+            if section not in research_results
+        ]
+        return sends or "write"
+    
+    def _dispatch_writes(self, state: DocumentationState) -> Union[List[Send], str]:
+        """Fan out one write_one task per required section."""
+        request = state["request"]
+        sections = request.sections_required or self.STANDARD_MODEL_SECTIONS
+        sends = [
+            Send("write_one", {
+                "request": request,
+                "section": section_name,
+                "context": self._section_context(state, section_name),
+                "instructions": request.custom_instructions
+            })
+            for section_name in sections
+        ]
+        return sends or "assemble"
+    
+    def _dispatch_revisions(self, state: DocumentationState) -> Union[List[Send], str]:
+        """Fan out one revise_one task per section that has feedback."""
+        request = state["request"]
+        revision_plan = state["revision_plan"]
+        sends = [
+            Send("revise_one", {
+                "request": request,
+                "section": section.title,
+                "context": self._section_context(state, section.title),
+                "instructions": "\n".join(revision_plan[section.title]),
+                "draft": section
+            })
+            for section in state["sections"]
+            if section.title in revision_plan
+        ]
+        return sends or "assemble"
+    
     # ============================================================================
     # CONDITIONAL ROUTING LOGIC
-    # This function determines which path to take after editorial review
+    # This function determines which path to take after both reviews
     # ============================================================================
     
     def _should_revise(self, state: DocumentationState) -> str:
@@ -599,9 +1073,12 @@ class DocumentationOrchestrator:
         This is THE key LangGraph feature - conditional routing based on state.
         
         Decision logic:
-        1. If quality passed → "finalize"
-        2. If max iterations reached → "end" (accept current version)
-        3. Otherwise → "revise" (try again)
+        1. If a review crashed (no report to act on) → "end"
+        2. If quality passed → "finalize"
+        3. If max iterations reached → "end" (accept current version)
+        4. If feedback gives nothing to act on, or the same feedback as the
+           last revision (the writer is not converging) → "end"
+        5. Otherwise → "revise" (try again)
         
         Returns:
             One of: "revise", "finalize", "end"
@@ -611,6 +1088,11 @@ class DocumentationOrchestrator:
         current_iteration = state["current_iteration"]
         max_iterations = state["max_iterations"]
         
+        # A failed review yields no feedback, so a revision could not fix anything
+        if compliance_report is None or editorial_review is None:
+            logger.warning("[!] Review failed (see errors). Accepting current version.")
+            return "end"
+        
         # Check quality
         quality_passed = self._check_quality(compliance_report, editorial_review)
         
@@ -620,9 +1102,27 @@ class DocumentationOrchestrator:
         elif current_iteration >= max_iterations:
             logger.warning(f"[!] Max iterations ({max_iterations}) reached. Accepting current version.")
             return "end"
-        else:
-            logger.info(f"[!] Quality not met. Routing to revision ({current_iteration}/{max_iterations})")
-            return "revise"
+        
+        revision_plan = self._plan_revisions(
+            compliance_report,
+            editorial_review,
+            [section.title for section in state["sections"]]
+        )
+        if not revision_plan:
+            logger.warning("[!] Quality not met but no actionable feedback. Accepting current version.")
+            return "end"
+        if self._plan_fingerprint(revision_plan) == state.get("revision_fingerprint"):
+            logger.warning("[!] Feedback unchanged since last revision. Accepting current version.")
+            return "end"
+        
+        logger.info(f"[!] Quality not met. Routing to revision ({current_iteration}/{max_iterations})")
+        return "revise"
+    
+    @staticmethod
+    def _plan_fingerprint(revision_plan: Dict[str, List[str]]) -> str:
+        """Order-independent hash of a revision plan."""
+        canonical = json.dumps(sorted((title, sorted(instructions)) for title, instructions in revision_plan.items()))
+        return blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
     
     # ============================================================================
     # HELPER METHODS (same as before)
@@ -637,50 +1137,91 @@ class DocumentationOrchestrator:
         if not compliance_report or not editorial_review:
             return False
         
-        # Check compliance
-        critical_issues = [
-            i for i in compliance_report.issues
-            if i.severity == ComplianceSeverity.CRITICAL
-        ]
-        if critical_issues:
-            return False
-        
-        high_priority_issues = [
-            i for i in compliance_report.issues
-            if i.severity == ComplianceSeverity.HIGH
-        ]
-        if len(high_priority_issues) > 2:
+        # Check compliance (one pass to bucket by severity)
+        severity_counts = Counter(f.severity for f in compliance_report.findings)
+        if severity_counts[ComplianceSeverity.CRITICAL] or severity_counts[ComplianceSeverity.HIGH] > 2:
             return False
         
         # Check editorial
-        critical_editorial = [
-            i for i in editorial_review.issues
-            if i.priority == ReviewPriority.CRITICAL
-        ]
-        if len(critical_editorial) > 3:
-            return False
-        
-        return True
+        priority_counts = Counter(f.priority for f in editorial_review.findings)
+        return priority_counts[ReviewPriority.CRITICAL] <= 3
     
-    def _build_revision_instructions(
+    def _actionable_findings(
         self,
         compliance_report: Optional[ComplianceReport],
         editorial_review: Optional[EditorialReview]
-    ) -> List[str]:
-        """Build revision instructions from feedback."""
-        instructions = []
+    ) -> List[Tuple[str, str]]:
+        """
+        CRITICAL/HIGH findings as (instruction, location text) pairs.
+        
+        The location text is whatever a finding says about where it
+        applies, used by _plan_revisions to match it to a section.
+        """
+        actionable = []
         
         if compliance_report:
-            for issue in compliance_report.issues:
-                if issue.severity in [ComplianceSeverity.CRITICAL, ComplianceSeverity.HIGH]:
-                    instructions.append(f"COMPLIANCE: {issue.description} - {issue.recommendation}")
+            for finding in compliance_report.findings:
+                if finding.severity in _ACTIONABLE_SEVERITIES:
+                    actionable.append((
+                        f"COMPLIANCE: {finding.description} - {finding.recommendation}",
+                        f"{finding.category} {finding.requirement} {finding.description}"
+                    ))
         
         if editorial_review:
-            for issue in editorial_review.issues:
-                if issue.priority in [ReviewPriority.CRITICAL, ReviewPriority.HIGH]:
-                    instructions.append(f"EDITORIAL: {issue.description} - {issue.suggestion}")
+            for finding in editorial_review.findings:
+                if finding.priority in _ACTIONABLE_PRIORITIES:
+                    actionable.append((
+                        f"EDITORIAL: {finding.description} - {finding.suggestion}",
+                        f"{finding.location or ''} {finding.description}"
+                    ))
+        
+        return actionable
+    
+    def _plan_revisions(
+        self,
+        compliance_report: Optional[ComplianceReport],
+        editorial_review: Optional[EditorialReview],
+        section_titles: List[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Group revision instructions by the section they apply to.
+        
+        Findings don't carry a section field, so a finding targets every
+        section whose title appears in its location/description text.
+        Findings that match no section can't be localized and go to all
+        sections. Sections the LLM judge lists in sections_to_revise are
+        included even without a matching finding.
+        
+        Returns:
+            Section title -> instructions; sections not in the dict are
+            left unchanged
+        """
+        lowered_titles = [(title, title.lower()) for title in section_titles]
+        plan: Dict[str, List[str]] = {}
+        unlocalized = []
+        
+        for instruction, location in self._actionable_findings(compliance_report, editorial_review):
+            location = location.lower()
+            targets = [title for title, lowered in lowered_titles if lowered in location]
+            if not targets:
+                unlocalized.append(instruction)
+            for title in targets:
+                plan.setdefault(title, []).append(instruction)
+        
+        if unlocalized:
+            for title in section_titles:
+                plan.setdefault(title, []).extend(unlocalized)
+        
+        quality_report = editorial_review.quality_report if editorial_review else None
+        if quality_report:
+            flagged = " ".join(quality_report.sections_to_revise).lower()
+            for title, lowered in lowered_titles:
+                if lowered in flagged:
+                    plan.setdefault(title, []).append(
+                        "EDITORIAL: Reviewer flagged this section for revision"
+                    )
         
-        return instructions
+        return plan
 
 
 # For visualization (optional but cool!)
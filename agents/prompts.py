@@ -2,60 +2,260 @@
 Prompt templates for document generation
 """
 
-def build_section_prompt(section_title: str, context: str, template: str, length_target: str) -> str:
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+def build_prefix_cached_content(prefix_blocks: List[str], suffix: str) -> List[Dict[str, Any]]:
+    """
+    Build Anthropic message content whose shared prefix can be cached.
+
+    Calls that repeat the same long prefix (system instructions, a
+    regulatory checklist, the source PPT content) followed by a short
+    call-specific part should pass the shared text as prefix_blocks and the
+    rest as suffix. The last prefix block carries cache_control, so the
+    provider caches everything up to it and later calls only prefill the
+    suffix. Prefix blocks must be byte-identical across calls to hit.
+
+    Args:
+        prefix_blocks: Text shared across calls, in a fixed order
+        suffix: Call-specific text (section instructions, document body)
+
+    Returns:
+        List of content blocks for a user message
+    """
+    content = [{"type": "text", "text": block} for block in prefix_blocks if block]
+    if content:
+        content[-1]["cache_control"] = {"type": "ephemeral"}
+    content.append({"type": "text", "text": suffix})
+    return content
+
+
+def _blocks(prefix: str, suffix: str) -> List[Dict[str, Any]]:
+    """Content blocks for a prompt whose static prefix Anthropic should cache."""
+    return build_prefix_cached_content([prefix], suffix)
+
+
+def _clip(text: str, max_tokens: Optional[int]) -> str:
+    """
+    Trim text to roughly max_tokens (1 token ≈ 4 characters), cutting at the
+    last line break inside the budget when there is one in its second half.
+    """
+    if not max_tokens or not text:
+        return text
+    max_chars = max_tokens * 4
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", max_chars // 2, max_chars)
+    return text[:cut if cut != -1 else max_chars]
+
+
+def _render(values: Tuple[str, ...], parts: Tuple[str, ...]) -> str:
+    """
+    Interleave call values with template fragments: values[0] + parts[0] + ...
+    
+    Not memoized: values carry whole research contexts and source decks,
+    and hashing them for a cache lookup costs as much as the join itself.
+    """
+    return "".join(chain.from_iterable(zip(values, parts)))
+
+
+# Static prompt text lives in module-level fragment tuples; each builder joins
+# the fragments around its arguments instead of re-formatting the full template.
+# Fragment [0] of every template holds all of the static instructions and the
+# call arguments follow it, so repeated calls share one long identical prefix
+# (what provider-side prompt caching matches on).
+
+def _compact_text(text: str) -> str:
+    """
+    Drop whitespace that costs input tokens without changing the prompt:
+    trailing spaces, runs of blank lines, and half of each bullet indent.
+    """
+    text = re.sub(r"[ \t]+\n", "\n", text)
+    text = re.sub(r"\n{3,}", "\n\n", text)
+    return re.sub(r"(?<=\n)( {2,})", lambda m: " " * (len(m.group(1)) // 2), text)
+
+
+def _compact(parts: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Apply _compact_text to every fragment of a template (once, at import)."""
+    return tuple(_compact_text(part) for part in parts)
+
+
+# Word count targets for build_section_prompt
+_DEFAULT_WORD_COUNT = "800-1200 words"
+_WORD_COUNTS = {
+    "short": "400-600 words",
+    "medium": _DEFAULT_WORD_COUNT,
+    "long": "1500-2000 words"
+}
+
+# Every prompt opens with _PREAMBLE and closes its static instructions with
+# _FOOTER, verbatim, so all builders share the same leading bytes
+_PREAMBLE = """You are an expert insurance actuary with 15 years of experience writing regulatory model documentation. Your documentation is known for clarity, technical accuracy, and compliance with NAIC and ASOP standards."""
+
+_FOOTER = """IMPORTANT: Write only the section content. Do not include the section heading, as it will be added separately. Do not add any meta-commentary or notes about the content."""
+
+# Shared by build_section_prompt and build_sections_batch
+_SECTION_REQUIREMENTS = """REQUIREMENTS:
+- Professional actuarial tone suitable for regulatory review
+- Include specific numbers and technical details from the context
+- Reference industry standards (NAIC, ASOPs) where appropriate
+- Use clear, precise language
+- Structure content logically with smooth transitions
+- Write in present tense for current state, past tense for development history"""
+
+_SECTION_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+TASK: Write one section of an insurance model documentation package. The section title, target length, and context are given at the end of this prompt.
+
+""" + _SECTION_REQUIREMENTS + """
+
+""" + _FOOTER + """
+
+TARGET LENGTH: """,
+    """
+SECTION: """,
+    """
+
+CONTEXT AND EXAMPLES:
+""",
+    """
+
+Write the """,
+    """ section now:""",
+))
+
+# Static prefix per length target, with the word count already filled in
+_SECTION_PROMPT_PREFIXES = {
+    length_target: _SECTION_PROMPT_PARTS[0] + word_count + _SECTION_PROMPT_PARTS[1]
+    for length_target, word_count in _WORD_COUNTS.items()
+}
+_DEFAULT_SECTION_PROMPT_PREFIX = _SECTION_PROMPT_PREFIXES["medium"]
+# Unset length targets resolve in the same lookup as the named ones
+_SECTION_PROMPT_PREFIXES[None] = _SECTION_PROMPT_PREFIXES[""] = _DEFAULT_SECTION_PROMPT_PREFIX
+
+
+def build_section_prompt(section_title: str, context: str, template: str, length_target: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Build a prompt for generating a documentation section.
     
     Args:
         section_title: The section being generated (e.g., "Executive Summary")
         context: Context from RAG and input data
+        max_context_tokens: If set, trim context to about this many tokens
         template: Template type (e.g., "executive_summary")
         length_target: "short" (400-600 words), "medium" (800-1200), "long" (1500-2000)
     
     Returns:
-        Complete prompt for Claude API
+        Content blocks for the Claude API user message (static prefix cached)
     """
     
-    # Define word count targets
-    word_counts = {
-        "short": "400-600 words",
-        "medium": "800-1200 words",
-        "long": "1500-2000 words"
-    }
-    target_length = word_counts.get(length_target, "800-1200 words")
+    prefix = _SECTION_PROMPT_PREFIXES.get(length_target, _DEFAULT_SECTION_PROMPT_PREFIX)
     
     # Build the prompt
-    prompt = f"""You are an expert insurance actuary with 15 years of experience writing regulatory model documentation. Your documentation is known for clarity, technical accuracy, and compliance with NAIC and ASOP standards.
+    return _blocks(prefix, _render((
+        section_title,
+        _clip(context, max_context_tokens),
+        section_title,
+    ), _SECTION_PROMPT_PARTS[2:]))
 
-TASK: Write the "{section_title}" section for an insurance model documentation package.
 
-CONTEXT AND EXAMPLES:
-{context}
+def iter_section_prompt(section_title: str, context_chunks: Iterable[str], length_target: str) -> Iterator[str]:
+    """
+    Yield the build_section_prompt text piece by piece, static prefix first.
+    
+    The prefix is available before any context exists, so a streaming client
+    can start sending it (and the provider can start matching its cache)
+    while context_chunks is still being produced, e.g. by a retriever.
+    
+    Args:
+        section_title: The section being generated
+        context_chunks: Context text, yielded in order as it becomes available
+        length_target: "short", "medium", or "long"
+    
+    Yields:
+        Prompt text; "".join of all pieces equals the build_section_prompt text
+    """
+    yield _SECTION_PROMPT_PREFIXES.get(length_target, _DEFAULT_SECTION_PROMPT_PREFIX)
+    yield section_title
+    yield _SECTION_PROMPT_PARTS[2]
+    yield from context_chunks
+    yield _SECTION_PROMPT_PARTS[3]
+    yield section_title
+    yield _SECTION_PROMPT_PARTS[4]
 
-REQUIREMENTS:
-- Professional actuarial tone suitable for regulatory review
-- Target length: {target_length}
-- Include specific numbers and technical details from the context
-- Reference industry standards (NAIC, ASOPs) where appropriate
-- Use clear, precise language
-- Structure content logically with smooth transitions
-- Write in present tense for current state, past tense for development history
 
-IMPORTANT: Write only the section content. Do not include the section heading, as it will be added separately. Do not add any meta-commentary or notes about the content.
+_SECTIONS_BATCH_PROMPT_PREFIX = _compact_text(_PREAMBLE + """
+
+TASK: Write several sections of an insurance model documentation package in one response. Each section request at the end of this prompt sits between ===SECTION_i_START=== and ===SECTION_i_END=== markers and gives the section title, target length, and context.
+
+""" + _SECTION_REQUIREMENTS + """
+
+""" + _FOOTER + """
 
-Write the {section_title} section now:"""
+OUTPUT FORMAT: Answer every request in order. Put the content of section i between a <<<SECTION_i>>> line and a <<</SECTION_i>>> line, using the same i as its request. Write nothing outside these markers.
 
-    return prompt
+SECTION REQUESTS:""")
 
-def build_executive_summary_prompt(slide_content: str, rag_results: str) -> str:
+_SECTIONS_BATCH_OUTPUT = re.compile(r"<<<SECTION_(\d+)>>>\s*(.*?)\s*<<</SECTION_\1>>>", re.DOTALL)
+
+
+def build_sections_batch(requests: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
     """
-    Build specialized prompt for Executive Summary section.
+    Build one prompt that generates several sections in a single call.
     
-    Focus: High-level business narrative, concise, executive-focused.
-    Style: Clear, confident, suitable for leadership and regulators.
+    The shared instructions are sent (and cached) once instead of once per
+    section. Parse the response with parse_sections_batch.
+    
+    Args:
+        requests: (section_title, context, length_target) per section
+    
+    Returns:
+        Content blocks for the Claude API user message (static prefix cached)
     """
+    parts = []
+    for i, (section_title, context, length_target) in enumerate(requests):
+        parts.append(
+            f"\n\n===SECTION_{i}_START===\n"
+            f"Title: {section_title}\n"
+            f"Target length: {_WORD_COUNTS.get(length_target, _DEFAULT_WORD_COUNT)}\n"
+            f"Context:\n{context}\n"
+            f"===SECTION_{i}_END==="
+        )
+    parts.append(f"\n\nWrite all {len(requests)} sections now:")
     
-    prompt = f"""You are an expert insurance actuary with 15 years of experience writing executive summaries for regulatory model documentation. Your summaries are known for clarity, conciseness, and strategic insight.
+    return _blocks(_SECTIONS_BATCH_PROMPT_PREFIX, "".join(parts))
+
+
+def parse_sections_batch(response_text: str, count: int) -> List[Optional[str]]:
+    """
+    Split a build_sections_batch response into per-section content.
+    
+    Args:
+        response_text: Model output with <<<SECTION_i>>> markers
+        count: Number of sections requested
+    
+    Returns:
+        Content for each request in order; None where the section is missing,
+        so the caller can fall back to a single-section call for it
+    """
+    sections: List[Optional[str]] = [None] * count
+    for match in _SECTIONS_BATCH_OUTPUT.finditer(response_text):
+        index = int(match.group(1))
+        if index < count:
+            sections[index] = match.group(2)
+    return sections
+
+
+_EXECUTIVE_SUMMARY_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+ROLE FOR THIS SECTION: You are writing the executive summary. Your executive summaries are known for clarity, conciseness, and strategic insight.
 
 AUDIENCE: Senior actuaries, regulators, and executives who need to quickly understand the model's purpose, approach, and key findings.
 
@@ -91,47 +291,47 @@ TONE REQUIREMENTS:
 - Focus on "what" and "why" not technical "how"
 - Write for busy executives who may only read this section
 
-DO NOT:
-- Include excessive technical details
-- Use jargon without explanation
-- Make the summary longer than 600 words
-- Include information not supported by the slide content
+DO NOT: include excessive technical details; use jargon without explanation; make the summary longer than 600 words; include information not supported by the slide content.
+
+""" + _FOOTER + """
 
 SLIDE CONTENT TO ANALYZE:
-{slide_content}
+""",
+    """
 
 REFERENCE EXAMPLES FROM PAST DOCUMENTATION:
-{rag_results if rag_results else "No reference examples available - use your expertise in actuarial documentation standards."}
+""",
+    """
 
-Write the Executive Summary now. Focus on clarity, conciseness, and strategic insight."""
+Write the Executive Summary now. Focus on clarity, conciseness, and strategic insight.""",
+))
+_EXECUTIVE_SUMMARY_NO_EXAMPLES = "No reference examples available - use your expertise in actuarial documentation standards."
 
-    return prompt
 
-def build_methodology_prompt(model_type: str, key_findings: str, context: str) -> str:
+def build_executive_summary_prompt(slide_content: str, rag_results: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    Build a specialized prompt for Methodology section.
-    
-    Methodology sections need more technical depth than executive summaries,
-    including mathematical formulation, variable descriptions, and assumptions.
+    Build specialized prompt for Executive Summary section.
     
-    Args:
-        model_type: Type of model (e.g., "frequency", "severity")
-        key_findings: Key model details from PowerPoint
-        context: RAG-retrieved examples from past methodology sections
+    Focus: High-level business narrative, concise, executive-focused.
+    Style: Clear, confident, suitable for leadership and regulators.
     
-    Returns:
-        Complete prompt for methodology generation
+    If max_context_tokens is set, rag_results is trimmed to about that many tokens.
     """
     
-    prompt = f"""You are a senior quantitative analyst with deep expertise in statistical modeling and actuarial science. You are documenting the technical methodology for an insurance model that will be reviewed by actuaries and regulatory bodies.
+    return build_prompt(
+        "executive_summary",
+        max_context_tokens,
+        slide_content=slide_content,
+        rag_results=rag_results,
+    )
 
-TASK: Write the "Methodology" section for a {model_type} model documentation package.
 
-EXAMPLES FROM PAST MODEL DOCUMENTATION:
-{context}
+_METHODOLOGY_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
 
-CURRENT MODEL DETAILS:
-{key_findings}
+ROLE FOR THIS SECTION: You are a senior quantitative analyst with deep expertise in statistical modeling and actuarial science. You are documenting the technical methodology for an insurance model that will be reviewed by actuaries and regulatory bodies.
+
+TASK: Write the "Methodology" section for an insurance model documentation package. The model type, current model details, and examples from past documentation are given at the end of this prompt.
 
 REQUIRED STRUCTURE AND CONTENT:
 
@@ -169,37 +369,55 @@ REQUIREMENTS:
 - Present tense for methodology description
 - Cite relevant actuarial standards (ASOP) where appropriate
 
-IMPORTANT: Write only the section content. Do not include the section heading "Methodology" as it will be added separately. Do not add meta-commentary about the content.
+""" + _FOOTER + """
 
-Write the Methodology section now:"""
+MODEL TYPE: """,
+    """
 
-    return prompt
+EXAMPLES FROM PAST MODEL DOCUMENTATION:
+""",
+    """
 
-def build_data_sources_prompt(model_type: str, data_details: str, context: str) -> str:
+CURRENT MODEL DETAILS:
+""",
     """
-    Build specialized prompt for Data Sources section.
+
+Write the Methodology section now:""",
+))
+
+
+def build_methodology_prompt(model_type: str, key_findings: str, context: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build a specialized prompt for Methodology section.
     
-    This section requires structured presentation with clear categorization
-    of data by type, source, and quality attributes.
+    Methodology sections need more technical depth than executive summaries,
+    including mathematical formulation, variable descriptions, and assumptions.
     
     Args:
         model_type: Type of model (e.g., "frequency", "severity")
-        data_details: Details about data sources used
-        context: RAG-retrieved examples from past data sources sections
+        key_findings: Key model details from PowerPoint
+        context: RAG-retrieved examples from past methodology sections
+        max_context_tokens: If set, trim context to about this many tokens
     
     Returns:
-        Complete prompt for data sources generation
+        Content blocks for methodology generation (static prefix cached)
     """
     
-    prompt = f"""You are a data governance specialist and senior actuary documenting data sources for an insurance model. You excel at clearly organizing complex data lineage information for regulatory review.
+    return build_prompt(
+        "methodology",
+        max_context_tokens,
+        model_type=model_type,
+        context=context,
+        key_findings=key_findings,
+    )
 
-TASK: Write the "Data Sources and Quality" section for a {model_type} model documentation package.
 
-EXAMPLES FROM PAST DOCUMENTATION:
-{context}
+_DATA_SOURCES_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
 
-CURRENT MODEL DATA:
-{data_details}
+ROLE FOR THIS SECTION: You are a data governance specialist and senior actuary documenting data sources for an insurance model. You excel at clearly organizing complex data lineage information for regulatory review.
+
+TASK: Write the "Data Sources and Quality" section for an insurance model documentation package. The model type, current model data details, and examples from past documentation are given at the end of this prompt.
 
 REQUIRED STRUCTURE AND CONTENT:
 
@@ -246,38 +464,57 @@ FORMATTING REQUIREMENTS:
 
 LENGTH: 600-800 words
 
-IMPORTANT: Write only the section content. Do not include the section heading "Data Sources and Quality" as it will be added separately. Focus on clear organization and structured presentation.
+Focus on clear organization and structured presentation.
 
-Write the Data Sources and Quality section now:"""
+""" + _FOOTER + """
 
-    return prompt
+MODEL TYPE: """,
+    """
 
-def build_variable_selection_prompt(model_type: str, variable_details: str, context: str) -> str:
+EXAMPLES FROM PAST DOCUMENTATION:
+""",
     """
-    Build specialized prompt for Variable Selection section.
+
+CURRENT MODEL DATA:
+""",
+    """
+
+Write the Data Sources and Quality section now:""",
+))
+
+
+def build_data_sources_prompt(model_type: str, data_details: str, context: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build specialized prompt for Data Sources section.
     
-    This section requires justification and reasoning for why specific
-    variables were included, emphasizing statistical significance and
-    business rationale.
+    This section requires structured presentation with clear categorization
+    of data by type, source, and quality attributes.
     
     Args:
         model_type: Type of model (e.g., "frequency", "severity")
-        variable_details: Details about variables and selection process
-        context: RAG-retrieved examples from past variable selection sections
+        data_details: Details about data sources used
+        context: RAG-retrieved examples from past data sources sections
+        max_context_tokens: If set, trim context to about this many tokens
     
     Returns:
-        Complete prompt for variable selection generation
+        Content blocks for data sources generation (static prefix cached)
     """
     
-    prompt = f"""You are a senior statistical modeler and actuary explaining variable selection methodology for regulatory review. You excel at presenting clear statistical reasoning combined with practical business justification.
+    return build_prompt(
+        "data_sources",
+        max_context_tokens,
+        model_type=model_type,
+        context=context,
+        data_details=data_details,
+    )
 
-TASK: Write the "Variable Selection and Justification" section for a {model_type} model documentation package.
 
-EXAMPLES FROM PAST DOCUMENTATION:
-{context}
+_VARIABLE_SELECTION_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
 
-CURRENT MODEL VARIABLES:
-{variable_details}
+ROLE FOR THIS SECTION: You are a senior statistical modeler and actuary explaining variable selection methodology for regulatory review. You excel at presenting clear statistical reasoning combined with practical business justification.
+
+TASK: Write the "Variable Selection and Justification" section for an insurance model documentation package. The model type, current model variable details, and examples from past documentation are given at the end of this prompt.
 
 REQUIRED STRUCTURE AND CONTENT:
 
@@ -318,21 +555,56 @@ TONE AND STYLE:
 
 LENGTH: 700-900 words
 
-IMPORTANT: Write only the section content. Do not include the section heading as it will be added separately. Focus on clear reasoning and justification for each decision.
+Focus on clear reasoning and justification for each decision.
 
-Write the Variable Selection and Justification section now:"""
+""" + _FOOTER + """
 
-    return prompt
+MODEL TYPE: """,
+    """
 
-def build_model_results_prompt(slide_content: str, rag_results: str) -> str:
+EXAMPLES FROM PAST DOCUMENTATION:
+""",
     """
-    Build prompt for Model Results section - metrics and performance data.
+
+CURRENT MODEL VARIABLES:
+""",
+    """
+
+Write the Variable Selection and Justification section now:""",
+))
+
+
+def build_variable_selection_prompt(model_type: str, variable_details: str, context: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build specialized prompt for Variable Selection section.
     
-    Focus: Quantitative results, structured presentation, statistical evidence.
-    Style: Data-driven, objective, precise with metrics and tables.
+    This section requires justification and reasoning for why specific
+    variables were included, emphasizing statistical significance and
+    business rationale.
+    
+    Args:
+        model_type: Type of model (e.g., "frequency", "severity")
+        variable_details: Details about variables and selection process
+        context: RAG-retrieved examples from past variable selection sections
+        max_context_tokens: If set, trim context to about this many tokens
+    
+    Returns:
+        Content blocks for variable selection generation (static prefix cached)
     """
     
-    prompt = f"""You are a quantitative analyst and technical writer creating the Model Results section for actuarial model documentation.
+    return build_prompt(
+        "variable_selection",
+        max_context_tokens,
+        model_type=model_type,
+        context=context,
+        variable_details=variable_details,
+    )
+
+
+_MODEL_RESULTS_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+ROLE FOR THIS SECTION: You are a quantitative analyst and technical writer creating the Model Results section for actuarial model documentation.
 
 AUDIENCE: Regulatory reviewers and actuarial leadership who need evidence of model performance.
 
@@ -382,32 +654,45 @@ TONE REQUIREMENTS:
 - Clear about what metrics measure
 - Acknowledge limitations when relevant
 
-DO NOT:
-- Present metrics without context or interpretation
-- Use vague language ("pretty good", "acceptable")
-- Overwhelm with too many decimal places
-- Hide or downplay poor results
-- Make claims not supported by the metrics shown
+DO NOT: present metrics without context or interpretation; use vague language ("pretty good", "acceptable"); overwhelm with too many decimal places; hide or downplay poor results; make claims not supported by the metrics shown.
+
+""" + _FOOTER + """
 
 SLIDE CONTENT TO ANALYZE:
-{slide_content}
+""",
+    """
 
 REFERENCE EXAMPLES FROM PAST DOCUMENTATION:
-{rag_results if rag_results else "No reference examples available - use your expertise in statistical reporting and actuarial documentation standards."}
+""",
+    """
 
-Write the Model Results section now. Focus on presenting clear, quantitative evidence of model performance with proper structure and interpretation."""
+Write the Model Results section now. Focus on presenting clear, quantitative evidence of model performance with proper structure and interpretation.""",
+))
+_MODEL_RESULTS_NO_EXAMPLES = "No reference examples available - use your expertise in statistical reporting and actuarial documentation standards."
 
-    return prompt
 
-def build_model_development_prompt(slide_content: str, rag_results: str) -> str:
+def build_model_results_prompt(slide_content: str, rag_results: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    Build prompt for Model Development section - iterative process narrative.
+    Build prompt for Model Results section - metrics and performance data.
     
-    Focus: Process documentation, iterations, decision-making journey.
-    Style: Chronological narrative showing how model evolved from initial to final.
+    Focus: Quantitative results, structured presentation, statistical evidence.
+    Style: Data-driven, objective, precise with metrics and tables.
+    
+    If max_context_tokens is set, rag_results is trimmed to about that many tokens.
     """
     
-    prompt = f"""You are a senior actuary and model developer documenting the model development process for regulatory review and knowledge transfer.
+    return build_prompt(
+        "model_results",
+        max_context_tokens,
+        slide_content=slide_content,
+        rag_results=rag_results,
+    )
+
+
+_MODEL_DEVELOPMENT_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+ROLE FOR THIS SECTION: You are a senior actuary and model developer documenting the model development process for regulatory review and knowledge transfer.
 
 AUDIENCE: Actuaries, auditors, and future model developers who need to understand the development journey, not just the final model.
 
@@ -447,7 +732,7 @@ REQUIRED COMPONENTS:
 
 NARRATIVE STYLE REQUIREMENTS:
 - Use chronological/iterative flow: "Initially... then... subsequently... finally..."
-- Show progression: "Version 1.0 → Version 1.1 → Version 2.0 → Final"
+- Show progression: "Version 1.0 -> Version 1.1 -> Version 2.0 -> Final"
 - Explain causation: "Because X showed Y, we decided to Z"
 - Balance detail with readability
 - Make the development process transparent and logical
@@ -459,32 +744,45 @@ TONE REQUIREMENTS:
 - Show thoughtful decision-making
 - Professional but narrative (telling a story)
 
-DO NOT:
-- Just list changes without explaining why
-- Hide failed attempts or challenges
-- Make it read like a timeline (use narrative prose)
-- Focus only on final model without the journey
-- Include excessive technical jargon without context
+DO NOT: just list changes without explaining why; hide failed attempts or challenges; make it read like a timeline (use narrative prose); focus only on final model without the journey; include excessive technical jargon without context.
+
+""" + _FOOTER + """
 
 SLIDE CONTENT TO ANALYZE:
-{slide_content}
+""",
+    """
 
 REFERENCE EXAMPLES FROM PAST DOCUMENTATION:
-{rag_results if rag_results else "No reference examples available - use your expertise in model development documentation and actuarial standards."}
+""",
+    """
 
-Write the Model Development section now. Focus on telling the clear, logical story of how the model evolved through iterations to reach its final form."""
+Write the Model Development section now. Focus on telling the clear, logical story of how the model evolved through iterations to reach its final form.""",
+))
+_MODEL_DEVELOPMENT_NO_EXAMPLES = "No reference examples available - use your expertise in model development documentation and actuarial standards."
 
-    return prompt
 
-def build_validation_prompt(slide_content: str, rag_results: str) -> str:
+def build_model_development_prompt(slide_content: str, rag_results: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    Build prompt for Validation section - testing procedures and evidence.
+    Build prompt for Model Development section - iterative process narrative.
     
-    Focus: Systematic testing, evidence presentation, audit trail.
-    Style: Structured procedures with quantitative results and pass/fail evidence.
+    Focus: Process documentation, iterations, decision-making journey.
+    Style: Chronological narrative showing how model evolved from initial to final.
+    
+    If max_context_tokens is set, rag_results is trimmed to about that many tokens.
     """
     
-    prompt = f"""You are a senior model validator and quality assurance specialist documenting validation testing for regulatory review and audit purposes.
+    return build_prompt(
+        "model_development",
+        max_context_tokens,
+        slide_content=slide_content,
+        rag_results=rag_results,
+    )
+
+
+_VALIDATION_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+ROLE FOR THIS SECTION: You are a senior model validator and quality assurance specialist documenting validation testing for regulatory review and audit purposes.
 
 AUDIENCE: Regulatory auditors, compliance teams, and validation specialists who need to verify the model was properly tested and meets quality standards.
 
@@ -551,32 +849,45 @@ TONE REQUIREMENTS:
 - Confident in conclusions when evidence supports them
 - Professional validation terminology
 
-DO NOT:
-- Skip documenting any major validation test
-- Present opinions without supporting evidence
-- Hide or minimize validation failures
-- Use vague language like "the model seems fine"
-- Make validation claims without showing the test results
+DO NOT: skip documenting any major validation test; present opinions without supporting evidence; hide or minimize validation failures; use vague language like "the model seems fine"; make validation claims without showing the test results.
+
+""" + _FOOTER + """
 
 SLIDE CONTENT TO ANALYZE:
-{slide_content}
+""",
+    """
 
 REFERENCE EXAMPLES FROM PAST DOCUMENTATION:
-{rag_results if rag_results else "No reference examples available - use your expertise in model validation standards and actuarial documentation requirements."}
+""",
+    """
 
-Write the Validation section now. Focus on creating a clear audit trail with systematic testing procedures and quantitative evidence of model reliability."""
+Write the Validation section now. Focus on creating a clear audit trail with systematic testing procedures and quantitative evidence of model reliability.""",
+))
+_VALIDATION_NO_EXAMPLES = "No reference examples available - use your expertise in model validation standards and actuarial documentation requirements."
 
-    return prompt
 
-def build_business_context_prompt(slide_content: str, rag_results: str) -> str:
+def build_validation_prompt(slide_content: str, rag_results: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    Build prompt for Business Context section - strategic overview and background.
+    Build prompt for Validation section - testing procedures and evidence.
     
-    Focus: Strategic rationale, organizational context, business drivers.
-    Style: High-level business narrative for leadership and stakeholders.
+    Focus: Systematic testing, evidence presentation, audit trail.
+    Style: Structured procedures with quantitative results and pass/fail evidence.
+    
+    If max_context_tokens is set, rag_results is trimmed to about that many tokens.
     """
     
-    prompt = f"""You are a senior business strategist and actuarial leader documenting the business context and strategic rationale for a model development initiative.
+    return build_prompt(
+        "validation",
+        max_context_tokens,
+        slide_content=slide_content,
+        rag_results=rag_results,
+    )
+
+
+_BUSINESS_CONTEXT_PROMPT_PARTS = _compact((
+    _PREAMBLE + """
+
+ROLE FOR THIS SECTION: You are a senior business strategist and actuarial leader documenting the business context and strategic rationale for a model development initiative.
 
 AUDIENCE: Executive leadership, business stakeholders, and future readers who need to understand the strategic business context and organizational drivers behind the model.
 
@@ -636,19 +947,220 @@ STYLE REQUIREMENTS:
 - Show alignment with organizational priorities
 - Emphasize practical business impact
 
-DO NOT:
-- Include technical modeling details (save for other sections)
-- Use excessive actuarial jargon
-- Focus on statistical methods
-- Make it read like methodology documentation
-- Lose sight of the business perspective
+DO NOT: include technical modeling details (save for other sections); use excessive actuarial jargon; focus on statistical methods; make it read like methodology documentation; lose sight of the business perspective.
+
+""" + _FOOTER + """
 
 SLIDE CONTENT TO ANALYZE:
-{slide_content}
+""",
+    """
 
 REFERENCE EXAMPLES FROM PAST DOCUMENTATION:
-{rag_results if rag_results else "No reference examples available - use your expertise in business documentation and strategic communication."}
+""",
+    """
+
+Write the Business Context section now. Focus on providing clear strategic framing that helps readers understand the business rationale and organizational context for the model.""",
+))
+_BUSINESS_CONTEXT_NO_EXAMPLES = "No reference examples available - use your expertise in business documentation and strategic communication."
 
-Write the Business Context section now. Focus on providing clear strategic framing that helps readers understand the business rationale and organizational context for the model."""
 
-    return prompt
\ No newline at end of file
+def build_business_context_prompt(slide_content: str, rag_results: str, max_context_tokens: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Build prompt for Business Context section - strategic overview and background.
+    
+    Focus: Strategic rationale, organizational context, business drivers.
+    Style: High-level business narrative for leadership and stakeholders.
+    
+    If max_context_tokens is set, rag_results is trimmed to about that many tokens.
+    """
+    
+    return build_prompt(
+        "business_context",
+        max_context_tokens,
+        slide_content=slide_content,
+        rag_results=rag_results,
+    )
+
+
+# ============================================================================
+# SPECIALIZED PROMPTS
+# The section builders above differ only in data, so each is a PromptSpec
+# entry and a single build_prompt assembles any of them
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class PromptSpec:
+    """A compiled prompt template: static prefix, then fragments around fields."""
+    prefix: str  # Static instructions (the cached block)
+    fields: Tuple[str, ...]  # Argument names, in the order they are spliced in
+    parts: Tuple[str, ...]  # Fragment that follows each field
+    clip: str = "context"  # Field trimmed by max_context_tokens
+    fallback: str = ""  # Replaces the clip field when it is empty
+
+
+PROMPT_SPECS: Dict[str, PromptSpec] = {
+    "executive_summary": PromptSpec(
+        prefix=_EXECUTIVE_SUMMARY_PROMPT_PARTS[0],
+        fields=("slide_content", "rag_results"),
+        parts=_EXECUTIVE_SUMMARY_PROMPT_PARTS[1:],
+        clip="rag_results",
+        fallback=_EXECUTIVE_SUMMARY_NO_EXAMPLES,
+    ),
+    "methodology": PromptSpec(
+        prefix=_METHODOLOGY_PROMPT_PARTS[0],
+        fields=("model_type", "context", "key_findings"),
+        parts=_METHODOLOGY_PROMPT_PARTS[1:],
+    ),
+    "data_sources": PromptSpec(
+        prefix=_DATA_SOURCES_PROMPT_PARTS[0],
+        fields=("model_type", "context", "data_details"),
+        parts=_DATA_SOURCES_PROMPT_PARTS[1:],
+    ),
+    "variable_selection": PromptSpec(
+        prefix=_VARIABLE_SELECTION_PROMPT_PARTS[0],
+        fields=("model_type", "context", "variable_details"),
+        parts=_VARIABLE_SELECTION_PROMPT_PARTS[1:],
+    ),
+    "model_results": PromptSpec(
+        prefix=_MODEL_RESULTS_PROMPT_PARTS[0],
+        fields=("slide_content", "rag_results"),
+        parts=_MODEL_RESULTS_PROMPT_PARTS[1:],
+        clip="rag_results",
+        fallback=_MODEL_RESULTS_NO_EXAMPLES,
+    ),
+    "model_development": PromptSpec(
+        prefix=_MODEL_DEVELOPMENT_PROMPT_PARTS[0],
+        fields=("slide_content", "rag_results"),
+        parts=_MODEL_DEVELOPMENT_PROMPT_PARTS[1:],
+        clip="rag_results",
+        fallback=_MODEL_DEVELOPMENT_NO_EXAMPLES,
+    ),
+    "validation": PromptSpec(
+        prefix=_VALIDATION_PROMPT_PARTS[0],
+        fields=("slide_content", "rag_results"),
+        parts=_VALIDATION_PROMPT_PARTS[1:],
+        clip="rag_results",
+        fallback=_VALIDATION_NO_EXAMPLES,
+    ),
+    "business_context": PromptSpec(
+        prefix=_BUSINESS_CONTEXT_PROMPT_PARTS[0],
+        fields=("slide_content", "rag_results"),
+        parts=_BUSINESS_CONTEXT_PROMPT_PARTS[1:],
+        clip="rag_results",
+        fallback=_BUSINESS_CONTEXT_NO_EXAMPLES,
+    ),
+}
+
+
+def build_prompt(template: str, max_context_tokens: Optional[int] = None, **fields: str) -> List[Dict[str, Any]]:
+    """
+    Build a specialized section prompt from its PromptSpec.
+    
+    Args:
+        template: Key in PROMPT_SPECS (e.g., "methodology")
+        max_context_tokens: If set, trim the spec's clip field to about this many tokens
+        **fields: Values for every name in the spec's fields
+    
+    Returns:
+        Content blocks for the Claude API user message (static prefix cached)
+    """
+    spec = PROMPT_SPECS[template]
+    values = tuple(
+        (_clip(fields[name], max_context_tokens) or spec.fallback) if name == spec.clip else fields[name]
+        for name in spec.fields
+    )
+    return _blocks(spec.prefix, _render(values, spec.parts))
+
+# ============================================================================
+# LOCAL INFERENCE
+# For backends that take token ids directly (vLLM, llama.cpp), the static
+# prefix of each template is tokenized once per tokenizer and reused
+# ============================================================================
+
+@lru_cache(maxsize=64)
+def _encode_prefix(prefix: str, encode: Callable[[str], List[int]]) -> Tuple[int, ...]:
+    return tuple(encode(prefix))
+
+
+def encode_prompt(content: List[Dict[str, Any]], encode: Callable[[str], List[int]]) -> List[int]:
+    """
+    Token ids for builder output, reusing the ids of its cached prefix blocks.
+    
+    Blocks marked cache_control (the static template prefix) are tokenized
+    once per tokenizer; only the call-specific blocks are encoded per call.
+    Encoding blocks separately can differ from encoding the joined text by
+    a merge at a block boundary; prefixes end on a line break or ": " so
+    this is harmless in practice.
+    
+    Args:
+        content: Content blocks from a build_* function
+        encode: The backend tokenizer's encode function (must be hashable,
+            e.g. a bound method of a long-lived tokenizer)
+    
+    Returns:
+        Token ids for the whole prompt
+    """
+    ids: List[int] = []
+    for block in content:
+        if "cache_control" in block:
+            ids.extend(_encode_prefix(block["text"], encode))
+        else:
+            ids.extend(encode(block["text"]))
+    return ids
+
+# ============================================================================
+# DISPATCH
+# Section titles come from a small fixed vocabulary, so they are interned:
+# lookups with an interned title compare by identity before falling back to
+# character comparison
+# ============================================================================
+
+SECTION_TITLES: Dict[str, str] = {
+    sys.intern(template): sys.intern(title)
+    for template, title in (
+        ("executive_summary", "Executive Summary"),
+        ("methodology", "Methodology"),
+        ("data_sources", "Data Sources and Quality"),
+        ("variable_selection", "Variable Selection and Justification"),
+        ("model_results", "Model Results"),
+        ("model_development", "Model Development"),
+        ("validation", "Validation"),
+        ("business_context", "Business Context"),
+    )
+}
+
+# Template name -> specialized builder (signatures differ per builder)
+PROMPT_BUILDERS: Dict[str, Callable[..., List[Dict[str, Any]]]] = {
+    "executive_summary": build_executive_summary_prompt,
+    "methodology": build_methodology_prompt,
+    "data_sources": build_data_sources_prompt,
+    "variable_selection": build_variable_selection_prompt,
+    "model_results": build_model_results_prompt,
+    "model_development": build_model_development_prompt,
+    "validation": build_validation_prompt,
+    "business_context": build_business_context_prompt,
+}
+
+
+# Normalized template name or section title -> template name
+_TEMPLATE_KEYS = {
+    sys.intern(name.lower().replace(" ", "_")): template
+    for template, title in SECTION_TITLES.items()
+    for name in (template, title)
+}
+
+
+def get_prompt_builder(template: str) -> Optional[Callable[..., List[Dict[str, Any]]]]:
+    """
+    Look up the specialized builder for a template name or section title.
+    
+    Args:
+        template: Template name (e.g., "methodology") or section title
+            (e.g., "Data Sources and Quality"); case-insensitive
+    
+    Returns:
+        The builder, or None if the section has no specialized prompt
+        (use build_section_prompt)
+    """
+    key = _TEMPLATE_KEYS.get(template.strip().lower().replace(" ", "_"))
+    return PROMPT_BUILDERS.get(key) if key else None
@@ -18,11 +18,21 @@ Usage:
 """
 
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Hashable, Optional
+import asyncio
+import heapq
+import json
 import logging
-from dataclasses import dataclass, field
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from operator import attrgetter
+
+import numpy as np
 
 from rag.retrieval import DocumentRetriever, RetrievalResult
+from agents._sim_kernel import best_match
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +41,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# DocumentRetriever shared by agents created without one (lazy loading)
+_SHARED_RETRIEVER: Optional[DocumentRetriever] = None
+_SHARED_RETRIEVER_LOCK = threading.Lock()
+
+
+def _get_retriever() -> DocumentRetriever:
+    """Lazily initialize the shared document retriever (thread-safe)."""
+    global _SHARED_RETRIEVER
+    if _SHARED_RETRIEVER is None:
+        with _SHARED_RETRIEVER_LOCK:
+            if _SHARED_RETRIEVER is None:
+                logger.info("ResearchAgent: Initializing DocumentRetriever")
+                _SHARED_RETRIEVER = DocumentRetriever()
+    return _SHARED_RETRIEVER
+
 
 @dataclass
 class ResearchFindings:
@@ -47,11 +72,21 @@ class ResearchFindings:
     def __post_init__(self):
         """Calculate confidence score based on result similarities."""
         if self.findings:
-            avg_similarity = sum(r.similarity for r in self.findings) / len(self.findings)
-            self.confidence = avg_similarity
+            similarities = np.fromiter(
+                (r.similarity for r in self.findings),
+                dtype=np.float64,
+                count=len(self.findings)
+            )
+            self.confidence = float(similarities.mean())
 
     def format_summary(self) -> str:
-        """Format research findings as a readable summary."""
+        """Format research findings as a readable summary (cached per summary text)."""
+        # Cached as a plain instance attribute (not a field), so it stays out
+        # of asdict/eq/repr and is not carried over by dataclasses.replace
+        cached = self.__dict__.get("_formatted")
+        if cached is not None and cached[0] is self.summary:
+            return cached[1]
+
         lines = [
             f"Research Query: {self.query}",
             f"Confidence: {self.confidence:.2%}",
@@ -62,13 +97,150 @@ class ResearchFindings:
 
         for i, result in enumerate(self.findings[:3], 1):
             lines.append(f"\n{i}. {result.format_citation()} (relevance: {result.similarity:.2%})")
-            lines.append(f"   {result.text[:200]}...")
+            lines.append(f"   {result.preview[:200]}...")
 
         if self.summary:
             lines.append("\n\nSummary:")
             lines.append(self.summary)
 
-        return "\n".join(lines)
+        formatted = "\n".join(lines)
+        self._formatted = (self.summary, formatted)
+        return formatted
+
+
+class SemanticResearchCache:
+    """
+    Research findings cache matched by query-embedding similarity.
+
+    Catches near-duplicate queries that an exact-key cache misses (e.g.
+    different phrasings of the same topic). Lookups only match entries
+    from the same namespace (e.g. identical filters), so findings
+    retrieved under different settings are never reused. Embeddings are
+    kept in a preallocated matrix that grows geometrically up to max_size;
+    once full, the least recently used row is overwritten in place.
+    Entries expire after ttl_seconds (None keeps them indefinitely).
+    """
+
+    # Namespace id of empty (expired) rows; never matches a lookup
+    _EXPIRED = -1
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_size: int = 512,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Unit-norm embeddings in the first len(self._findings) rows, with
+        # namespace id, store time and last-use time per row
+        self._matrix: Optional[np.ndarray] = None
+        self._namespaces: Optional[np.ndarray] = None
+        self._stored_at: Optional[np.ndarray] = None
+        self._last_used: Optional[np.ndarray] = None
+        self._namespace_ids: Dict[Hashable, int] = {}
+        self._findings: List[Optional[ResearchFindings]] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, namespace: Hashable, embedding) -> Optional[ResearchFindings]:
+        """Return findings for the most similar cached query, if close enough."""
+        if embedding is None:
+            return None
+
+        query = self._normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            size = len(self._findings)
+            namespace_id = self._namespace_ids.get(namespace)
+            if namespace_id is None or not size:
+                self.misses += 1
+                return None
+
+            self._expire(now, size)
+            row, similarity = best_match(
+                query,
+                self._matrix[:size],
+                self._namespaces[:size],
+                namespace_id
+            )
+            if similarity < self.threshold:
+                self.misses += 1
+                return None
+
+            self._last_used[row] = now
+            self.hits += 1
+            return self._findings[row]
+
+    def put(self, namespace: Hashable, embedding, findings: ResearchFindings) -> None:
+        """Add an entry, overwriting the least recently used one if full."""
+        if embedding is None or self.max_size <= 0:
+            return
+
+        vector = self._normalize(embedding)
+        now = time.monotonic()
+        with self._lock:
+            namespace_id = self._namespace_ids.setdefault(namespace, len(self._namespace_ids))
+            size = len(self._findings)
+
+            if size >= self.max_size:
+                # Expired rows have last-use -inf, so they are reused first
+                self._expire(now, size)
+                row = int(np.argmin(self._last_used[:size]))
+                self._findings[row] = findings
+            else:
+                if self._matrix is None or size == len(self._matrix):
+                    self._grow(size, vector.shape[0])
+                row = size
+                self._findings.append(findings)
+
+            self._matrix[row] = vector
+            self._namespaces[row] = namespace_id
+            self._stored_at[row] = now
+            self._last_used[row] = now
+
+    def _grow(self, size: int, dim: int) -> None:
+        """Reallocate the row buffers with doubled capacity (capped at max_size)."""
+        capacity = min(max(64, 2 * size), self.max_size)
+        matrix = np.empty((capacity, dim), dtype=np.float32)
+        namespaces = np.full(capacity, self._EXPIRED, dtype=np.int64)
+        stored_at = np.empty(capacity, dtype=np.float64)
+        last_used = np.empty(capacity, dtype=np.float64)
+        if size:
+            matrix[:size] = self._matrix[:size]
+            namespaces[:size] = self._namespaces[:size]
+            stored_at[:size] = self._stored_at[:size]
+            last_used[:size] = self._last_used[:size]
+        self._matrix = matrix
+        self._namespaces = namespaces
+        self._stored_at = stored_at
+        self._last_used = last_used
+
+    def _expire(self, now: float, size: int) -> None:
+        """Mark rows older than ttl_seconds as empty."""
+        if self.ttl_seconds is None:
+            return
+        expired = (now - self._stored_at[:size]) > self.ttl_seconds
+        if expired.any():
+            self._namespaces[:size][expired] = self._EXPIRED
+            self._last_used[:size][expired] = -np.inf
+            for row in np.flatnonzero(expired):
+                self._findings[row] = None
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            size = len(self._findings)
+            live = 0 if not size else int((self._namespaces[:size] != self._EXPIRED).sum())
+            return {"hits": self.hits, "misses": self.misses, "size": live}
 
 
 class ResearchAgent:
@@ -87,23 +259,35 @@ class ResearchAgent:
         self,
         retriever: Optional[DocumentRetriever] = None,
         default_n_results: int = 5,
-        min_similarity: float = 0.3
+        min_similarity: float = 0.3,
+        sem_cache_tau: float = 0.95,
+        sem_cache_size: int = 512,
+        sem_cache_ttl: Optional[float] = None
     ):
         """
         Initialize the research agent.
 
         Args:
-            retriever: DocumentRetriever instance (creates new if None)
+            retriever: DocumentRetriever instance (uses the shared one if None)
             default_n_results: Default number of results to retrieve
             min_similarity: Minimum similarity threshold for results
+            sem_cache_tau: Cosine similarity above which a previous topic's
+                findings are reused instead of querying the vector store
+            sem_cache_size: Maximum cached topics (0 disables the cache)
+            sem_cache_ttl: Seconds cached findings stay valid (None: no expiry)
         """
         self.default_n_results = default_n_results
         self.min_similarity = min_similarity
+        self.semantic_cache = SemanticResearchCache(
+            threshold=sem_cache_tau,
+            max_size=sem_cache_size,
+            ttl_seconds=sem_cache_ttl
+        )
 
-        # Initialize retriever
+        # Initialize retriever (the embedding model and Chroma client are
+        # loaded once per process, not once per agent)
         if retriever is None:
-            logger.info("ResearchAgent: Initializing DocumentRetriever")
-            self.retriever = DocumentRetriever()
+            self.retriever = _get_retriever()
         else:
             self.retriever = retriever
 
@@ -114,7 +298,8 @@ class ResearchAgent:
         topic: str,
         n_results: Optional[int] = None,
         filters: Optional[Dict] = None,
-        include_summary: bool = False
+        include_summary: bool = False,
+        embedding: Optional[np.ndarray] = None
     ) -> ResearchFindings:
         """
         Research a specific topic in the knowledge base.
@@ -124,51 +309,162 @@ class ResearchAgent:
             n_results: Number of results to retrieve
             filters: Metadata filters for targeted search
             include_summary: Whether to generate a summary (requires LLM)
+            embedding: Topic embedding from embed_topics, if already computed
 
         Returns:
             ResearchFindings object with structured results
         """
         logger.info(f"Researching topic: '{topic}'")
 
+        return self._research(
+            topic,
+            n_results=n_results,
+            filters=filters,
+            include_summary=include_summary,
+            embedding=self._embed(topic) if embedding is None else embedding
+        )
+
+    def _research(
+        self,
+        topic: str,
+        n_results: Optional[int],
+        filters: Optional[Dict],
+        include_summary: bool,
+        embedding: Optional[np.ndarray]
+    ) -> ResearchFindings:
+        """research_topic with the topic embedding already computed."""
         if n_results is None:
             n_results = self.default_n_results
 
+        # Near-duplicate topics under the same filters reuse findings
+        findings = self.cached_findings(topic, embedding, n_results, filters)
+        if findings is not None:
+            if include_summary:
+                findings.summary = self._generate_summary(findings)
+            return findings
+
         # Retrieve relevant documents
         results = self.retriever.retrieve(
             query=topic,
             n_results=n_results,
             filters=filters,
-            min_similarity=self.min_similarity
+            min_similarity=self.min_similarity,
+            query_embedding=None if embedding is None else embedding.tolist()
         )
 
         if not results:
             logger.warning(f"No results found for topic: '{topic}'")
 
-        # Build context
-        context = self.retriever.build_context(
+        findings = self.findings_from_results(topic, results)
+        self.cache_findings(findings, embedding, n_results, filters)
+
+        # Generate summary if requested (placeholder - would use LLM in production)
+        if include_summary:
+            findings.summary = self._generate_summary(findings)
+
+        logger.info(f"Research complete: {len(results)} findings, confidence {findings.confidence:.2%}")
+        return findings
+
+    def _embed(self, topic: str) -> Optional[np.ndarray]:
+        """Embed a topic as a unit vector (None if unavailable)."""
+        embeddings = self.embed_topics([topic])
+        return None if embeddings is None else embeddings[0]
+
+    def embed_topics(self, topics: List[str]) -> Optional[np.ndarray]:
+        """
+        Embed topics in one encoder call as unit rows of a (T, d) matrix.
+
+        The embeddings feed both the semantic cache and the vector store
+        query, so each topic is encoded once. Returns None if the embedding
+        function is unavailable; retrieval then embeds the text itself.
+        """
+        try:
+            matrix = np.asarray(self.retriever.embed_queries(topics), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Could not embed topics: {e}")
+            return None
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    @staticmethod
+    def _cache_key(n_results: int, filters: Optional[Dict]) -> tuple:
+        """Semantic cache namespace: findings are only reused under identical settings."""
+        # Filters may hold operator dicts ({"year": {"$in": [...]}}), so
+        # serialize them rather than hashing their items
+        return (n_results, json.dumps(filters or {}, sort_keys=True, default=str))
+
+    def cached_findings(
+        self,
+        topic: str,
+        embedding: Optional[np.ndarray],
+        n_results: Optional[int] = None,
+        filters: Optional[Dict] = None
+    ) -> Optional[ResearchFindings]:
+        """
+        Return findings cached for a near-duplicate topic, if any.
+
+        Args:
+            topic: Topic being researched (becomes the findings' query)
+            embedding: Topic embedding (see embed_topics); None skips the cache
+            n_results: Number of results the findings must have been retrieved with
+            filters: Metadata filters the findings must have been retrieved under
+
+        Returns:
+            Copy of the cached findings for this topic, or None on a miss
+        """
+        if n_results is None:
+            n_results = self.default_n_results
+        cached = self.semantic_cache.get(self._cache_key(n_results, filters), embedding)
+        if cached is None:
+            return None
+        logger.info(f"Semantic cache hit for topic: '{topic}' (matched '{cached.query}')")
+        return replace(cached, query=topic)
+
+    def cache_findings(
+        self,
+        findings: ResearchFindings,
+        embedding: Optional[np.ndarray],
+        n_results: Optional[int] = None,
+        filters: Optional[Dict] = None
+    ) -> None:
+        """Store findings in the semantic cache under the settings they were retrieved with."""
+        if n_results is None:
+            n_results = self.default_n_results
+        self.semantic_cache.put(self._cache_key(n_results, filters), embedding, findings)
+
+    def findings_from_results(
+        self,
+        topic: str,
+        results: List[RetrievalResult]
+    ) -> ResearchFindings:
+        """
+        Build ResearchFindings from already-retrieved results.
+
+        Used by research_topic and by callers that retrieve several topics
+        in one batch (DocumentRetriever.retrieve_batch).
+
+        Args:
+            topic: Topic or question the results answer
+            results: Retrieved results for the topic
+
+        Returns:
+            ResearchFindings object with context and sources
+        """
+        # Build context and collect sources in one pass over the results
+        context, sources = self.retriever.build_context_and_sources(
             results=results,
             max_tokens=4000,
             include_citations=True
         )
 
-        # Get sources
-        sources = self.retriever.get_relevant_sources(results)
-
         # Create research findings
-        findings = ResearchFindings(
+        return ResearchFindings(
             query=topic,
             findings=results,
             context=context,
             sources=sources
         )
 
-        # Generate summary if requested (placeholder - would use LLM in production)
-        if include_summary:
-            findings.summary = self._generate_summary(findings)
-
-        logger.info(f"Research complete: {len(results)} findings, confidence {findings.confidence:.2%}")
-        return findings
-
     def research_multi_topic(
         self,
         topics: List[str],
@@ -186,13 +482,72 @@ class ResearchAgent:
         """
         logger.info(f"Researching {len(topics)} topics")
 
-        all_findings = []
-        for topic in topics:
-            findings = self.research_topic(topic, n_results=n_results_per_topic)
-            all_findings.append(findings)
+        embeddings = self.embed_topics(topics) if topics else None
+
+        all_findings: List[Optional[ResearchFindings]] = [None] * len(topics)
+        misses = []
+        for i, topic in enumerate(topics):
+            embedding = None if embeddings is None else embeddings[i]
+            cached = self.cached_findings(topic, embedding, n_results_per_topic)
+            if cached is not None:
+                all_findings[i] = cached
+            else:
+                misses.append(i)
+
+        # All uncached topics are searched in a single vector store query
+        batch_results = self.retriever.retrieve_batch(
+            [topics[i] for i in misses],
+            n_results=n_results_per_topic,
+            min_similarity=self.min_similarity,
+            query_embeddings=None if embeddings is None else embeddings[misses].tolist()
+        )
+        for i, results in zip(misses, batch_results):
+            findings = self.findings_from_results(topics[i], results)
+            self.cache_findings(findings, None if embeddings is None else embeddings[i], n_results_per_topic)
+            all_findings[i] = findings
 
         return all_findings
 
+    async def research_topic_async(
+        self,
+        topic: str,
+        n_results: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        include_summary: bool = False
+    ) -> ResearchFindings:
+        """
+        Async variant of research_topic.
+
+        The vector store is an embedded (PersistentClient) Chroma with a
+        blocking API, so the research runs in a worker thread and the event
+        loop stays free. Arguments and return value match research_topic.
+        """
+        return await asyncio.to_thread(
+            self.research_topic,
+            topic,
+            n_results=n_results,
+            filters=filters,
+            include_summary=include_summary
+        )
+
+    async def research_multi_topic_async(
+        self,
+        topics: List[str],
+        n_results_per_topic: int = 3
+    ) -> List[ResearchFindings]:
+        """
+        Async variant of research_multi_topic.
+
+        All topics still go to the vector store as one batched query, which
+        beats gathering one request per topic; the batch runs in a worker
+        thread. Arguments and return value match research_multi_topic.
+        """
+        return await asyncio.to_thread(
+            self.research_multi_topic,
+            topics,
+            n_results_per_topic=n_results_per_topic
+        )
+
     def research_by_document_type(
         self,
         topic: str,
@@ -293,19 +648,75 @@ class ResearchAgent:
             Dictionary mapping year to ResearchFindings
         """
         logger.info(f"Comparing {model_type} models across years {years} for aspect: {aspect}")
+        if not years:
+            return {}
 
-        comparison = {}
-        for year in years:
-            query = f"{model_type} model {aspect}"
-            findings = self.research_model_documentation(
-                topic=query,
-                model_type=model_type,
-                year=year,
-                n_results=3
+        # Every year shares the query text, so it is embedded once
+        query = f"{model_type} model {aspect}"
+        embedding = self._embed(query)
+
+        base_filters = {"document_type": "model_doc"}
+        if model_type:
+            base_filters["model_type"] = model_type
+
+        def year_filters(year: int) -> Dict:
+            filters = dict(base_filters)
+            if year:
+                filters["year"] = year
+            return filters
+
+        def research_year(year: int) -> ResearchFindings:
+            return self._research(
+                query,
+                n_results=3,
+                filters=year_filters(year),
+                include_summary=False,
+                embedding=embedding
             )
-            comparison[year] = findings
 
-        return comparison
+        comparison: Dict[int, ResearchFindings] = {}
+        pending = []
+        for year in years:
+            cached = self.cached_findings(query, embedding, 3, year_filters(year))
+            if cached is not None:
+                comparison[year] = cached
+            else:
+                pending.append(year)
+
+        # One $in query fetches candidates for every remaining year; the
+        # results are partitioned client-side by their year metadata
+        if len(pending) > 1 and all(pending):
+            results = self.retriever.retrieve_batch(
+                [query],
+                n_results=3 * len(pending),
+                filters={**base_filters, "year": {"$in": pending}},
+                min_similarity=self.min_similarity,
+                query_embeddings=None if embedding is None else [embedding.tolist()]
+            )[0]
+
+            by_year: Dict[int, List[RetrievalResult]] = {year: [] for year in pending}
+            for result in results:
+                partition = by_year.get(result.metadata.get("year"))
+                if partition is not None and len(partition) < 3:
+                    result.rank = len(partition) + 1
+                    partition.append(result)
+
+            # A short partition may only mean other years crowded this one
+            # out of the shared top-k, so it is retried with its own query
+            for year, partition in by_year.items():
+                if len(partition) == 3:
+                    findings = self.findings_from_results(query, partition)
+                    self.cache_findings(findings, embedding, 3, year_filters(year))
+                    comparison[year] = findings
+            pending = [year for year in pending if year not in comparison]
+
+        # Years the shared query did not cover get their own filtered query
+        # (with retrieve's filter fallback); those run concurrently
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(len(pending), 8)) as executor:
+                comparison.update(zip(pending, executor.map(research_year, pending)))
+
+        return {year: comparison[year] for year in years}
 
     def find_similar_sections(
         self,
@@ -360,7 +771,7 @@ class ResearchAgent:
         if findings.findings:
             top_result = findings.findings[0]
             summary_parts.append(f"\nMost relevant finding ({top_result.similarity:.2%} match):")
-            summary_parts.append(f"{top_result.text[:300]}...")
+            summary_parts.append(f"{top_result.preview}...")
 
         return "\n".join(summary_parts)
 
@@ -385,18 +796,17 @@ class ResearchAgent:
 
         # If document types specified, search each and merge
         if document_types:
-            all_results = []
-            for doc_type in document_types:
-                results = self.retriever.retrieve(
+            per_type = [
+                self.retriever.retrieve(
                     query=section_topic,
                     n_results=3,
                     filters={"document_type": doc_type}
                 )
-                all_results.extend(results)
+                for doc_type in document_types
+            ]
 
-            # Sort by similarity
-            all_results.sort(key=lambda r: r.similarity, reverse=True)
-            results = all_results
+            # Each list is already ranked, so merge instead of re-sorting
+            results = list(heapq.merge(*per_type, key=attrgetter("similarity"), reverse=True))
         else:
             results = self.retriever.retrieve(
                 query=section_topic,
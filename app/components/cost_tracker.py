@@ -8,21 +8,41 @@ FIXES:
 - Model-specific cost calculation
 """
 
+import sys
+import threading
 import time
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional
 
-@dataclass
+# Streamlit is only needed for display_cost_dashboard; the tracker itself
+# is also used headlessly by the agents
+try:
+    import streamlit as st
+except ImportError:
+    st = None
+
+@lru_cache(maxsize=256)
+def _pricing_tier(model: str) -> str:
+    """Pricing tier for a model string: Sonnet strings get Sonnet pricing, everything else Haiku."""
+    return "sonnet" if "sonnet" in model.lower() else "haiku"
+
+
+@dataclass(slots=True)
 class APICall:
     """Single API call record"""
-    timestamp: datetime
+    timestamp: float  # Unix time (time.time())
     agent: str
     operation: str
     model: str  # NEW: Track which model was used
     input_tokens: int
     output_tokens: int
     cost_usd: float
+    cache_creation_input_tokens: int = 0  # Prompt-cache writes
+    cache_read_input_tokens: int = 0  # Prompt-cache reads
     
 class CostTracker:
     """
@@ -44,44 +64,86 @@ class CostTracker:
     SONNET_INPUT_COST = 3.00 / 1_000_000   # $3.00 per 1M tokens (NEW)
     SONNET_OUTPUT_COST = 15.00 / 1_000_000 # $15.00 per 1M tokens (NEW)
     
+    # Prompt caching: cache writes and reads are billed relative to the
+    # model's base input price
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
+    
+    # Pricing tier -> (input cost, output cost) per token
+    PRICING = {
+        "haiku": (HAIKU_INPUT_COST, HAIKU_OUTPUT_COST),
+        "sonnet": (SONNET_INPUT_COST, SONNET_OUTPUT_COST),
+    }
+    
+    # Model identifier -> pricing, for the names the agents pass; other
+    # names are matched to a tier by _pricing_tier (bounded cache)
+    _MODEL_PRICING = {
+        "haiku": PRICING["haiku"],
+        "sonnet": PRICING["sonnet"],
+        "claude-haiku-4-5-20251001": PRICING["haiku"],
+        "claude-sonnet-4-20250514": PRICING["sonnet"],
+    }
+    
+    # Number of latest calls kept for get_recent_calls
+    RECENT_CALLS = 64
+    
     def __init__(self):
         """Initialize cost tracker"""
         self.calls: List[APICall] = []
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        # Latest calls for the activity log; old entries drop off in O(1)
+        self._recent: deque = deque(maxlen=self.RECENT_CALLS)
+        # Monotonic perf_counter_ns() readings, immune to wall-clock jumps
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
+        
+        # Running totals, updated in record_usage so reads are O(1)
+        self._lock = threading.Lock()
+        self._total_cost = 0.0
+        self._total_in = 0
+        self._total_out = 0
+        self._cost_by_agent: defaultdict = defaultdict(float)
+        self._cost_by_model: defaultdict = defaultdict(float)
         
     def start_tracking(self):
         """Start timing the generation"""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         
     def stop_tracking(self):
         """Stop timing the generation"""
-        self.end_time = time.time()
+        self.end_ns = time.perf_counter_ns()
         
-    def _calculate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+    def _calculate_cost(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0
+    ) -> float:
         """
         Calculate cost based on model type.
         
         Args:
             model: Model identifier (haiku, sonnet, or full model string)
-            input_tokens: Number of input tokens
+            input_tokens: Number of uncached input tokens
             output_tokens: Number of output tokens
+            cache_creation_input_tokens: Input tokens written to the prompt cache
+            cache_read_input_tokens: Input tokens read from the prompt cache
             
         Returns:
             Cost in USD
         """
-        model_lower = model.lower()
+        pricing = self._MODEL_PRICING.get(model)
+        if pricing is None:
+            pricing = self.PRICING[_pricing_tier(model)]
+        input_cost, output_cost = pricing
         
-        # Determine pricing based on model
-        if 'sonnet' in model_lower:
-            input_cost = self.SONNET_INPUT_COST
-            output_cost = self.SONNET_OUTPUT_COST
-        else:
-            # Default to Haiku pricing
-            input_cost = self.HAIKU_INPUT_COST
-            output_cost = self.HAIKU_OUTPUT_COST
-        
-        return (input_tokens * input_cost) + (output_tokens * output_cost)
+        billed_input = (
+            input_tokens
+            + cache_creation_input_tokens * self.CACHE_WRITE_MULTIPLIER
+            + cache_read_input_tokens * self.CACHE_READ_MULTIPLIER
+        )
+        return (billed_input * input_cost) + (output_tokens * output_cost)
     
     def record_usage(
         self,
@@ -89,7 +151,9 @@ class CostTracker:
         operation: str,
         input_tokens: int,
         output_tokens: int,
-        model: str = "haiku"  # NEW: Default to Haiku for backward compatibility
+        model: str = "haiku",  # NEW: Default to Haiku for backward compatibility
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0
     ):
         """
         Record an API call.
@@ -100,20 +164,42 @@ class CostTracker:
             input_tokens: Number of input tokens
             output_tokens: Number of output tokens
             model: Model used (haiku, sonnet, or full model string)
+            cache_creation_input_tokens: Input tokens written to the prompt
+                cache (billed at 1.25x the input price)
+            cache_read_input_tokens: Input tokens read from the prompt cache
+                (billed at 0.1x the input price)
         """
-        cost_usd = self._calculate_cost(model, input_tokens, output_tokens)
+        # Few distinct names repeat across every call: share one string each
+        agent = sys.intern(agent)
+        model = sys.intern(model)
+        cost_usd = self._calculate_cost(
+            model,
+            input_tokens,
+            output_tokens,
+            cache_creation_input_tokens,
+            cache_read_input_tokens
+        )
         
         call = APICall(
-            timestamp=datetime.now(),
+            timestamp=time.time(),
             agent=agent,
             operation=operation,
             model=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            cost_usd=cost_usd
+            cost_usd=cost_usd,
+            cache_creation_input_tokens=cache_creation_input_tokens,
+            cache_read_input_tokens=cache_read_input_tokens
         )
         
-        self.calls.append(call)
+        with self._lock:
+            self.calls.append(call)
+            self._recent.append(call)
+            self._total_cost += cost_usd
+            self._total_in += input_tokens
+            self._total_out += output_tokens
+            self._cost_by_agent[agent] += cost_usd
+            self._cost_by_model[model] += cost_usd
         
     @property
     def total_calls(self) -> int:
@@ -123,12 +209,12 @@ class CostTracker:
     @property
     def total_input_tokens(self) -> int:
         """Total input tokens across all calls"""
-        return sum(call.input_tokens for call in self.calls)
+        return self._total_in
         
     @property
     def total_output_tokens(self) -> int:
         """Total output tokens across all calls"""
-        return sum(call.output_tokens for call in self.calls)
+        return self._total_out
         
     @property
     def total_tokens(self) -> int:
@@ -138,13 +224,13 @@ class CostTracker:
     @property
     def total_cost_usd(self) -> float:
         """Total cost in USD"""
-        return sum(call.cost_usd for call in self.calls)
+        return self._total_cost
         
     @property
     def generation_time_seconds(self) -> Optional[float]:
         """Total generation time in seconds"""
-        if self.start_time and self.end_time:
-            return self.end_time - self.start_time
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1e9
         return None
         
     @property
@@ -163,31 +249,29 @@ class CostTracker:
             
     def get_cost_by_agent(self) -> dict:
         """Get cost breakdown by agent"""
-        agent_costs = {}
-        for call in self.calls:
-            if call.agent not in agent_costs:
-                agent_costs[call.agent] = 0.0
-            agent_costs[call.agent] += call.cost_usd
-        return agent_costs
+        return dict(self._cost_by_agent)
     
     def get_cost_by_model(self) -> dict:
         """Get cost breakdown by model (NEW)"""
-        model_costs = {}
-        for call in self.calls:
-            if call.model not in model_costs:
-                model_costs[call.model] = 0.0
-            model_costs[call.model] += call.cost_usd
-        return model_costs
+        return dict(self._cost_by_model)
         
     def get_recent_calls(self, n: int = 5) -> List[APICall]:
-        """Get n most recent API calls"""
-        return self.calls[-n:] if self.calls else []
+        """Get n most recent API calls (at most RECENT_CALLS), oldest first"""
+        recent = self._recent
+        return list(islice(recent, max(len(recent) - n, 0), None))
         
     def reset(self):
         """Reset all tracking data"""
-        self.calls = []
-        self.start_time = None
-        self.end_time = None
+        with self._lock:
+            self.calls = []
+            self._recent.clear()
+            self._total_cost = 0.0
+            self._total_in = 0
+            self._total_out = 0
+            self._cost_by_agent.clear()
+            self._cost_by_model.clear()
+        self.start_ns = None
+        self.end_ns = None
 
 
 def display_cost_dashboard(tracker: CostTracker):
@@ -197,7 +281,9 @@ def display_cost_dashboard(tracker: CostTracker):
     Args:
         tracker: CostTracker instance
     """
-    import streamlit as st
+    metric = st.metric
+    write = st.write
+    total_cost = tracker.total_cost_usd
     
     st.success(f"✅ Tracking {tracker.total_calls} API calls with real cost data")
     
@@ -207,20 +293,20 @@ def display_cost_dashboard(tracker: CostTracker):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Cost", f"${tracker.total_cost_usd:.4f}")
+        metric("Total Cost", f"${total_cost:.4f}")
     
     with col2:
-        st.metric("Total Tokens", f"{tracker.total_tokens:,}")
+        metric("Total Tokens", f"{tracker.total_tokens:,}")
     
     with col3:
-        st.metric("API Calls", tracker.total_calls)
+        metric("API Calls", tracker.total_calls)
     
     with col4:
         # Show generation time instead of avg cost/call
         if tracker.generation_time_seconds:
-            st.metric("Generation Time", tracker.generation_time_formatted)
+            metric("Generation Time", tracker.generation_time_formatted)
         else:
-            st.metric("Generation Time", "In progress...")
+            metric("Generation Time", "In progress...")
     
     # Cost breakdown by agent
     st.subheader("Cost by Agent")
@@ -228,8 +314,8 @@ def display_cost_dashboard(tracker: CostTracker):
     
     if agent_costs:
         for agent, cost in agent_costs.items():
-            percentage = (cost / tracker.total_cost_usd * 100) if tracker.total_cost_usd > 0 else 0
-            st.write(f"**{agent}:** ${cost:.4f} ({percentage:.1f}%)")
+            percentage = (cost / total_cost * 100) if total_cost > 0 else 0
+            write(f"**{agent}:** ${cost:.4f} ({percentage:.1f}%)")
     else:
         st.info("No API calls recorded yet")
     
@@ -239,8 +325,8 @@ def display_cost_dashboard(tracker: CostTracker):
     
     if model_costs:
         for model, cost in model_costs.items():
-            percentage = (cost / tracker.total_cost_usd * 100) if tracker.total_cost_usd > 0 else 0
-            st.write(f"**{model}:** ${cost:.4f} ({percentage:.1f}%)")
+            percentage = (cost / total_cost * 100) if total_cost > 0 else 0
+            write(f"**{model}:** ${cost:.4f} ({percentage:.1f}%)")
     
     # Recent activity
     st.subheader("Recent Activity (Last 5)")
@@ -248,7 +334,7 @@ def display_cost_dashboard(tracker: CostTracker):
     
     if recent_calls:
         for call in reversed(recent_calls):  # Show most recent first
-            time_str = call.timestamp.strftime("%H:%M:%S")
-            st.write(f"▸ {time_str} - {call.agent} ({call.model}) - ${call.cost_usd:.4f}")
+            time_str = datetime.fromtimestamp(call.timestamp).strftime("%H:%M:%S")
+            write(f"▸ {time_str} - {call.agent} ({call.model}) - ${call.cost_usd:.4f}")
     else:
         st.info("No recent activity")
@@ -12,10 +12,24 @@ Usage in Streamlit:
 """
 
 import streamlit as st
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 from dataclasses import dataclass
 import json
 
+# Optional fast serializer for the JSON export
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Review outcome (passed / failed / not reviewed) -> table cell
+_CHECK_MARKS = {True: "✅", False: "❌", None: "-"}
+
+# Rules for the plain-text audit summary
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+
 
 def display_execution_trace(
     audit_log: Any,
@@ -67,6 +81,9 @@ def display_execution_trace(
     
     st.markdown("---")
     
+    # Fetched once and shared by the decision list, summary and narrative
+    decisions = audit_log.get_decision_points()
+    
     # Execution path visualization
     st.markdown("**Execution Path:**")
     path_str = audit_log.get_path_summary()
@@ -74,8 +91,6 @@ def display_execution_trace(
     
     # Decision points (key for auditors)
     with st.expander("🎯 Decision Points (Routing Decisions)", expanded=expanded):
-        decisions = audit_log.get_decision_points()
-        
         if decisions:
             for decision in decisions:
                 passed = decision.get("passed")
@@ -103,7 +118,10 @@ def display_execution_trace(
     
     # Copyable audit summary for reports
     with st.expander("📄 Audit Summary (Copyable)", expanded=False):
-        summary = generate_audit_summary(audit_log)
+        summary = _session_cached(
+            "audit_summary", audit_log,
+            lambda: generate_audit_summary(audit_log, decisions)
+        )
         st.text_area(
             "Copy this summary for audit documentation:",
             value=summary,
@@ -113,15 +131,47 @@ def display_execution_trace(
         
         # JSON export option
         if st.button("📥 Export as JSON"):
-            json_data = audit_log.to_dict()
             st.download_button(
                 label="Download JSON",
-                data=json.dumps(json_data, indent=2, default=str),
+                data=export_audit_json(audit_log),
                 file_name=f"audit_log_{audit_log.thread_id}.json",
                 mime="application/json"
             )
 
 
+def _session_cached(kind: str, audit_log: Any, build: Callable[[], str]) -> str:
+    """
+    Build a text rendering of an audit log once per session.
+    
+    Audit logs do not change after a run, so Streamlit reruns (expander
+    toggles, button clicks) reuse the stored text. Keyed by thread ID and
+    end time so a new run on the same thread is rendered afresh.
+    """
+    key = f"_{kind}_{audit_log.thread_id}_{audit_log.end_time}"
+    text = st.session_state.get(key)
+    if text is None:
+        text = st.session_state[key] = build()
+    return text
+
+
+def export_audit_json(audit_log: Any) -> bytes:
+    """
+    Serialize an audit log as indented UTF-8 JSON for download.
+    
+    Uses orjson when installed, which encodes straight to bytes.
+    
+    Args:
+        audit_log: ExecutionAuditLog object
+        
+    Returns:
+        JSON document as bytes
+    """
+    json_data = audit_log.to_dict()
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(json_data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(json_data, indent=2, default=str).encode("utf-8")
+
+
 def display_state_history_table(state_history: List[Any]) -> None:
     """
     Display state history as a table.
@@ -134,19 +184,19 @@ def display_state_history_table(state_history: List[Any]) -> None:
         return
     
     # Convert to display format
-    data = []
-    for entry in state_history:
-        row = {
+    data = [
+        {
             "Step": entry.step,
-            "Node": entry.node,
+            "Node": entry.node_name,
             "Portfolio": entry.portfolio or "-",
             "Iteration": entry.iteration if entry.iteration is not None else "-",
             "Phase": entry.phase or "-",
             "Quality": f"{entry.quality_score:.1f}" if entry.quality_score else "-",
-            "Compliance": "✅" if entry.compliance_passed else ("❌" if entry.compliance_passed is False else "-"),
-            "Editorial": "✅" if entry.editorial_passed else ("❌" if entry.editorial_passed is False else "-"),
+            "Compliance": _CHECK_MARKS.get(entry.compliance_passed, "-"),
+            "Editorial": _CHECK_MARKS.get(entry.editorial_passed, "-"),
         }
-        data.append(row)
+        for entry in state_history
+    ]
     
     # Display as dataframe
     st.dataframe(
@@ -156,20 +206,24 @@ def display_state_history_table(state_history: List[Any]) -> None:
     )
 
 
-def generate_audit_summary(audit_log: Any) -> str:
+def generate_audit_summary(
+    audit_log: Any,
+    decisions: Optional[List[Dict[str, Any]]] = None
+) -> str:
     """
     Generate a text summary suitable for audit documentation.
     
     Args:
         audit_log: ExecutionAuditLog object
+        decisions: audit_log.get_decision_points(), if already fetched
         
     Returns:
         Formatted text summary
     """
     summary_lines = [
-        "=" * 60,
+        _SEP_EQ,
         "AUTODOC AI - EXECUTION AUDIT SUMMARY",
-        "=" * 60,
+        _SEP_EQ,
         "",
         f"Thread ID:        {audit_log.thread_id}",
         f"Document Title:   {audit_log.document_title}",
@@ -182,50 +236,54 @@ def generate_audit_summary(audit_log: Any) -> str:
         f"Final Quality:    {audit_log.final_quality_score:.1f}/10",
         f"Total Iterations: {audit_log.total_iterations}",
         "",
-        "-" * 60,
+        _SEP_DASH,
         "EXECUTION PATH",
-        "-" * 60,
+        _SEP_DASH,
         audit_log.get_path_summary(),
         "",
-        "-" * 60,
+        _SEP_DASH,
         "DECISION POINTS",
-        "-" * 60,
+        _SEP_DASH,
     ]
     
-    decisions = audit_log.get_decision_points()
-    for decision in decisions:
-        passed_str = "PASSED" if decision["passed"] else "FAILED"
-        summary_lines.append(
-            f"Step {decision['step']}: {decision['node']} -> {passed_str} -> {decision['routed_to']}"
-        )
+    if decisions is None:
+        decisions = audit_log.get_decision_points()
+    summary_lines.extend([
+        f"Step {d['step']}: {d['node']} -> {'PASSED' if d['passed'] else 'FAILED'} -> {d['routed_to']}"
+        for d in decisions
+    ])
     
     summary_lines.extend([
         "",
-        "-" * 60,
+        _SEP_DASH,
         "NARRATIVE SUMMARY",
-        "-" * 60,
+        _SEP_DASH,
     ])
     
     # Generate narrative
-    narrative = generate_narrative(audit_log)
+    narrative = generate_narrative(audit_log, decisions)
     summary_lines.append(narrative)
     
     summary_lines.extend([
         "",
-        "=" * 60,
+        _SEP_EQ,
         "This audit trail was automatically generated by LangGraph.",
-        "=" * 60,
+        _SEP_EQ,
     ])
     
     return "\n".join(summary_lines)
 
 
-def generate_narrative(audit_log: Any) -> str:
+def generate_narrative(
+    audit_log: Any,
+    decisions: Optional[List[Dict[str, Any]]] = None
+) -> str:
     """
     Generate a human-readable narrative of the execution.
     
     Args:
         audit_log: ExecutionAuditLog object
+        decisions: audit_log.get_decision_points(), if already fetched
         
     Returns:
         Narrative string
@@ -235,11 +293,16 @@ def generate_narrative(audit_log: Any) -> str:
     quality = audit_log.final_quality_score
     success = audit_log.generation_successful
     
-    decisions = audit_log.get_decision_points()
+    if decisions is None:
+        decisions = audit_log.get_decision_points()
     
-    # Count failures
-    compliance_failures = sum(1 for d in decisions if d["node"] == "compliance" and not d["passed"])
-    editorial_failures = sum(1 for d in decisions if d["node"] == "editorial" and not d["passed"])
+    # Count failures (one pass over the decisions)
+    compliance_failures = editorial_failures = 0
+    for d in decisions:
+        if d.get("compliance_passed") is False:
+            compliance_failures += 1
+        if d.get("editorial_passed") is False:
+            editorial_failures += 1
     
     # Build narrative
     parts = []
@@ -304,6 +367,10 @@ def display_execution_summary_sidebar(execution_summary: Dict[str, Any]) -> None
 # MERMAID DIAGRAM GENERATION (for enhanced visualization)
 # =============================================================================
 
+# Nodes whose outgoing edge is labelled with the routing decision (the
+# parallel reviews are joined and routed at merge_reviews)
+_BRANCHING_NODES = frozenset({"merge_reviews"})
+
 def generate_execution_mermaid(audit_log: Any) -> str:
     """
     Generate a Mermaid diagram showing the actual execution path.
@@ -318,15 +385,15 @@ def generate_execution_mermaid(audit_log: Any) -> str:
     
     # Track which transitions happened
     path = audit_log.execution_path
+    step_to_decision = {d["step"]: d for d in audit_log.get_decision_points()}
     
     for i, node in enumerate(path[:-1]):
         next_node = path[i + 1]
         
         # Style based on node type
-        if node in ["compliance", "editorial"]:
+        if node in _BRANCHING_NODES:
             # Check if this was a pass or fail
-            decisions = audit_log.get_decision_points()
-            decision = next((d for d in decisions if d["step"] == i), None)
+            decision = step_to_decision.get(i)
             
             if decision:
                 if decision["passed"]:
@@ -355,5 +422,8 @@ def display_execution_mermaid(audit_log: Any) -> None:
     Args:
         audit_log: ExecutionAuditLog object
     """
-    mermaid_code = generate_execution_mermaid(audit_log)
+    mermaid_code = _session_cached(
+        "audit_mermaid", audit_log,
+        lambda: generate_execution_mermaid(audit_log)
+    )
     st.markdown(mermaid_code)
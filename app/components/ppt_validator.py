@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from pptx import Presentation
 from pptx.exc import PackageNotFoundError
 import io
+import re
 
 
 @dataclass
@@ -49,11 +50,27 @@ class PPTValidator:
         "Implementation",
         "Monitoring"
     ]
+    _RECOMMENDED_LOWER = [(s, s.lower()) for s in RECOMMENDED_SECTIONS]
 
     # Minimum requirements
     MIN_SLIDES = 10
     MAX_SLIDES = 30
 
+    # Model-specific keywords looked for in slide text
+    MODEL_KEYWORDS = frozenset({
+        "glm", "frequency", "severity", "model", "regression",
+        "xgboost", "gradient boosting", "neural network",
+        "auc", "gini", "r-squared", "rmse", "validation",
+        "territory", "rating", "premium", "loss ratio",
+        "claim", "exposure", "coverage", "risk"
+    })
+
+    # All keywords in one pattern, longest first. The lookahead matches at
+    # every position, so overlapping keywords are found like substring tests.
+    _KEYWORD_RE = re.compile(
+        "(?=(" + "|".join(re.escape(k) for k in sorted(MODEL_KEYWORDS, key=len, reverse=True)) + "))"
+    )
+
     def __init__(self):
         """Initialize PPT validator."""
         pass
@@ -94,8 +111,10 @@ class PPTValidator:
             result.is_valid = False
             return result
 
+        # Read titles, keywords and tables in one walk over the slides
+        detected_sections, model_keywords, table_count, slide_count = self._scan_presentation(prs)
+
         # Validate slide count
-        slide_count = len(prs.slides)
         result.slide_count = slide_count
 
         if slide_count < self.MIN_SLIDES:
@@ -111,7 +130,6 @@ class PPTValidator:
             result.info.append(f"Slide count: {slide_count} (✓ within recommended range)")
 
         # Detect sections from slide titles
-        detected_sections = self._extract_slide_titles(prs)
         result.detected_sections = detected_sections
 
         # Check for recommended sections
@@ -124,7 +142,6 @@ class PPTValidator:
             result.info.append("✓ All recommended sections detected")
 
         # Check for model-specific keywords
-        model_keywords = self._check_model_keywords(prs)
         if model_keywords:
             result.info.append(
                 f"Detected model keywords: {', '.join(model_keywords[:5])}"
@@ -135,7 +152,6 @@ class PPTValidator:
             )
 
         # Check for tables (important for model results)
-        table_count = self._count_tables(prs)
         if table_count > 0:
             result.info.append(f"✓ Found {table_count} tables (likely model results)")
         else:
@@ -143,66 +159,49 @@ class PPTValidator:
 
         return result
 
-    def _extract_slide_titles(self, prs: Presentation) -> List[str]:
-        """Extract titles from all slides."""
-        titles = []
-        for slide in prs.slides:
-            if slide.shapes.title and slide.shapes.title.text:
-                titles.append(slide.shapes.title.text.strip())
-        return titles
-
     def _check_sections(self, detected_titles: List[str]) -> List[str]:
         """
         Check which recommended sections are missing.
 
         Returns list of missing section names.
         """
-        # Convert to lowercase for fuzzy matching
-        detected_lower = [t.lower() for t in detected_titles]
-
-        missing = []
-        for section in self.RECOMMENDED_SECTIONS:
-            # Check if any slide title contains the section name (fuzzy match)
-            found = any(section.lower() in title for title in detected_lower)
-            if not found:
-                missing.append(section)
+        # Lowercased titles joined into one string for fuzzy matching; the
+        # newlines keep a section name from matching across two titles
+        titles_lower = "\n".join(detected_titles).lower()
 
-        return missing
+        # A section is found if any slide title contains its name
+        return [
+            section for section, section_lower in self._RECOMMENDED_LOWER
+            if section_lower not in titles_lower
+        ]
 
-    def _check_model_keywords(self, prs: Presentation) -> List[str]:
+    def _scan_presentation(self, prs: Presentation) -> Tuple[List[str], List[str], int, int]:
         """
-        Check for model-specific keywords in the presentation.
+        Collect everything validate_file needs in a single pass over the slides.
 
-        Returns list of detected keywords.
+        Returns:
+            Tuple of (slide titles, detected model keywords (sorted),
+            table count, slide count)
         """
-        keywords = {
-            "glm", "frequency", "severity", "model", "regression",
-            "xgboost", "gradient boosting", "neural network",
-            "auc", "gini", "r-squared", "rmse", "validation",
-            "territory", "rating", "premium", "loss ratio",
-            "claim", "exposure", "coverage", "risk"
-        }
-
+        titles = []
         detected = set()
+        table_count = 0
+        slide_count = 0
 
         for slide in prs.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    text_lower = shape.text.lower()
-                    for keyword in keywords:
-                        if keyword in text_lower:
-                            detected.add(keyword)
-
-        return sorted(list(detected))
+            slide_count += 1
+            shapes = slide.shapes
+            title = shapes.title
+            if title and title.text:
+                titles.append(title.text.strip())
 
-    def _count_tables(self, prs: Presentation) -> int:
-        """Count tables in the presentation."""
-        table_count = 0
-        for slide in prs.slides:
-            for shape in slide.shapes:
+            for shape in shapes:
                 if shape.shape_type == 19:  # Table shape type
                     table_count += 1
-        return table_count
+                if hasattr(shape, "text"):
+                    detected.update(self._KEYWORD_RE.findall(shape.text.lower()))
+
+        return titles, sorted(detected), table_count, slide_count
 
     def display_validation_results(self, result: ValidationResult):
         """
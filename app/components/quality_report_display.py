@@ -33,17 +33,13 @@ def display_quality_report(quality_report, show_details=True):
         # Overall score
         score = quality_report.overall_score
         if score >= 8.0:
-            st.success(f"**{score:.1f}/10.0**")
-            st.success("✓ EXCELLENT")
+            st.success(f"**{score:.1f}/10.0**\n\n✓ EXCELLENT")
         elif score >= 7.0:
-            st.success(f"**{score:.1f}/10.0**")
-            st.success("✓ READY")
+            st.success(f"**{score:.1f}/10.0**\n\n✓ READY")
         elif score >= 5.0:
-            st.warning(f"**{score:.1f}/10.0**")
-            st.warning("⚠ NEEDS WORK")
+            st.warning(f"**{score:.1f}/10.0**\n\n⚠ NEEDS WORK")
         else:
-            st.error(f"**{score:.1f}/10.0**")
-            st.error("✗ POOR QUALITY")
+            st.error(f"**{score:.1f}/10.0**\n\n✗ POOR QUALITY")
     
     with col2:
         if quality_report.ready_for_submission:
@@ -127,14 +123,14 @@ def display_quality_report(quality_report, show_details=True):
         # Critical Issues
         if quality_report.critical_issues:
             st.subheader("🚨 Critical Issues (MUST FIX)")
-            for issue in quality_report.critical_issues:
-                st.error(f"✗ {issue}")
+            st.error("\n".join(f"- ✗ {issue}" for issue in quality_report.critical_issues))
         
         # Recommended Improvements
         if quality_report.recommended_improvements:
             st.subheader("💡 Recommended Improvements")
-            for improvement in quality_report.recommended_improvements[:5]:  # Show top 5
-                st.info(f"→ {improvement}")
+            st.info("\n".join(  # Show top 5
+                f"- → {improvement}" for improvement in quality_report.recommended_improvements[:5]
+            ))
         
         # Sections to revise
         if quality_report.sections_to_revise:
@@ -171,10 +167,8 @@ def display_iteration_history(workflow_state):
         
         history_data.append(row)
     
-    # Display as dataframe
-    import pandas as pd
-    df = pd.DataFrame(history_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    # Display as dataframe (Streamlit takes the rows directly)
+    st.dataframe(history_data, use_container_width=True, hide_index=True)
     
     # Show improvement
     if len(workflow_state.iteration_history) > 1:
@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
 from dataclasses import dataclass
+from functools import cached_property
 
 from rag.vector_store import VectorStore
 
@@ -64,6 +65,11 @@ class RetrievalResult:
         """Get the section title."""
         return self.metadata.get('section', 'Unknown')
 
+    @cached_property
+    def preview(self) -> str:
+        """First 300 characters of the text, for summaries (computed once)."""
+        return self.text[:300]
+
     def format_citation(self) -> str:
         """Format as a citation string."""
         return f"[{self.source_file}:{self.section}]"
@@ -124,7 +130,9 @@ class DocumentRetriever:
         ChromaDB v1.1+ requires filters to use operators like $eq, $and, etc.
 
         Args:
-            filters: Plain dict like {"model_type": "frequency", "year": 2024}
+            filters: Plain dict like {"model_type": "frequency", "year": 2024};
+                values that are already operator dicts (e.g. {"$in": [2023, 2024]})
+                are passed through unchanged
 
         Returns:
             ChromaDB operator format like:
@@ -137,12 +145,12 @@ class DocumentRetriever:
         # Single filter
         if len(filters) == 1:
             key, value = list(filters.items())[0]
-            return {key: {"$eq": value}}
+            return {key: value if isinstance(value, dict) else {"$eq": value}}
 
         # Multiple filters - use $and
         filter_list = []
         for key, value in filters.items():
-            filter_list.append({key: {"$eq": value}})
+            filter_list.append({key: value if isinstance(value, dict) else {"$eq": value}})
 
         return {"$and": filter_list}
 
@@ -151,7 +159,8 @@ class DocumentRetriever:
         query: str,
         n_results: Optional[int] = None,
         filters: Optional[Dict] = None,
-        min_similarity: float = 0.0
+        min_similarity: float = 0.0,
+        query_embedding: Optional[List[float]] = None
     ) -> List[RetrievalResult]:
         """
         Retrieve relevant documents for a query.
@@ -165,6 +174,8 @@ class DocumentRetriever:
             n_results: Number of results to return (uses default if None)
             filters: Metadata filters (e.g., {"document_type": "model_doc", "year": 2023})
             min_similarity: Minimum similarity threshold (0-1)
+            query_embedding: Precomputed embedding of query (see embed_queries);
+                skips embedding the query again
 
         Returns:
             List of RetrievalResult objects, sorted by relevance
@@ -182,10 +193,11 @@ class DocumentRetriever:
 
         try:
             # Query ChromaDB with operator-formatted filters
-            query_params = {
-                "query_texts": [query],
-                "n_results": n_results
-            }
+            query_params = {"n_results": n_results}
+            if query_embedding is not None:
+                query_params["query_embeddings"] = [query_embedding]
+            else:
+                query_params["query_texts"] = [query]
 
             # Only add where clause if filters exist
             if chroma_filters:
@@ -194,19 +206,7 @@ class DocumentRetriever:
             raw_results = self.collection.query(**query_params)
 
             # Parse results
-            results = []
-            for i in range(len(raw_results['ids'][0])):
-                result = RetrievalResult(
-                    chunk_id=raw_results['ids'][0][i],
-                    text=raw_results['documents'][0][i],
-                    metadata=raw_results['metadatas'][0][i],
-                    distance=raw_results['distances'][0][i],
-                    rank=i + 1
-                )
-
-                # Apply similarity threshold
-                if result.similarity >= min_similarity:
-                    results.append(result)
+            results = self._parse_results(raw_results, 0, min_similarity)
 
             logger.info(f"Retrieved {len(results)} results (after filtering)")
             
@@ -222,7 +222,8 @@ class DocumentRetriever:
                         query=query,
                         n_results=n_results,
                         filters=fallback_filters,
-                        min_similarity=min_similarity
+                        min_similarity=min_similarity,
+                        query_embedding=query_embedding
                     )
                 
                 # Try 2: No filters at all (last resort)
@@ -231,7 +232,8 @@ class DocumentRetriever:
                     query=query,
                     n_results=n_results,
                     filters=None,
-                    min_similarity=min_similarity
+                    min_similarity=min_similarity,
+                    query_embedding=query_embedding
                 )
             
             return results
@@ -240,6 +242,78 @@ class DocumentRetriever:
             logger.error(f"Error retrieving documents: {e}")
             raise
 
+    def _parse_results(
+        self,
+        raw_results: Dict,
+        query_index: int,
+        min_similarity: float
+    ) -> List[RetrievalResult]:
+        """Convert one query's rows of a ChromaDB response into RetrievalResults."""
+        results = []
+        for i in range(len(raw_results['ids'][query_index])):
+            result = RetrievalResult(
+                chunk_id=raw_results['ids'][query_index][i],
+                text=raw_results['documents'][query_index][i],
+                metadata=raw_results['metadatas'][query_index][i],
+                distance=raw_results['distances'][query_index][i],
+                rank=i + 1
+            )
+
+            # Apply similarity threshold
+            if result.similarity >= min_similarity:
+                results.append(result)
+
+        return results
+
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        n_results: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        min_similarity: float = 0.0,
+        query_embeddings: Optional[List[List[float]]] = None
+    ) -> List[List[RetrievalResult]]:
+        """
+        Retrieve results for several queries sharing the same filters.
+
+        All queries are embedded and searched in a single ChromaDB call
+        instead of one round-trip per query. Unlike retrieve(), there is no
+        filter fallback; callers should retry empty results with retrieve().
+
+        Args:
+            queries: Query strings
+            n_results: Number of results per query (uses default if None)
+            filters: Metadata filters applied to every query
+            min_similarity: Minimum similarity threshold (0-1)
+            query_embeddings: Precomputed embeddings of queries, one per
+                query (see embed_queries)
+
+        Returns:
+            One list of RetrievalResult objects per query, in query order
+        """
+        if not queries:
+            return []
+        if n_results is None:
+            n_results = self.default_n_results
+
+        logger.info(f"Batch retrieving {len(queries)} queries, filters: {filters}")
+
+        query_params = {"n_results": n_results}
+        if query_embeddings is not None:
+            query_params["query_embeddings"] = query_embeddings
+        else:
+            query_params["query_texts"] = queries
+        chroma_filters = self._build_chroma_filter(filters)
+        if chroma_filters:
+            query_params["where"] = chroma_filters
+
+        raw_results = self.collection.query(**query_params)
+
+        return [
+            self._parse_results(raw_results, i, min_similarity)
+            for i in range(len(queries))
+        ]
+
     def retrieve_by_document_type(
         self,
         query: str,
@@ -401,6 +475,61 @@ class DocumentRetriever:
 
         return context
 
+    def build_context_and_sources(
+        self,
+        results: List[RetrievalResult],
+        max_tokens: int = 4000,
+        include_citations: bool = True,
+        separator: str = "\n\n---\n\n"
+    ) -> Tuple[str, List[str]]:
+        """
+        Build the prompt context and the deduplicated source list in one pass.
+
+        Equivalent to build_context() followed by get_relevant_sources(),
+        without walking the results twice.
+
+        Args:
+            results: List of RetrievalResult objects
+            max_tokens: Maximum context length in tokens (approximate)
+            include_citations: Whether to include source citations
+            separator: Separator between chunks
+
+        Returns:
+            Tuple of (formatted context string, source filenames in first-seen order)
+        """
+        # Approximate: 1 token ≈ 4 characters
+        max_chars = max_tokens * 4
+
+        context_parts = []
+        current_length = 0
+        sources = {}
+        full = False
+
+        for result in results:
+            # Sources cover every result, even those past the context limit
+            sources[result.source_file] = None
+            if full:
+                continue
+
+            if include_citations:
+                chunk_text = f"{result.format_citation()}\n{result.text}"
+            else:
+                chunk_text = result.text
+
+            chunk_length = len(chunk_text) + len(separator)
+            if current_length + chunk_length > max_chars:
+                logger.info(f"Context limit reached. Including {len(context_parts)}/{len(results)} chunks")
+                full = True
+                continue
+
+            context_parts.append(chunk_text)
+            current_length += chunk_length
+
+        context = separator.join(context_parts)
+        logger.info(f"Built context: {len(context)} chars (~{len(context)//4} tokens) from {len(context_parts)} chunks")
+
+        return context, list(sources)
+
     def get_relevant_sources(
         self,
         results: List[RetrievalResult],
@@ -425,6 +554,42 @@ class DocumentRetriever:
 
         return sources
 
+    def embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query with the collection's own embedding function.
+
+        This is the same embedding ChromaDB computes for query_texts, so
+        callers can compare queries without a second embedding model.
+
+        Args:
+            query: Query string
+
+        Returns:
+            Embedding vector
+        """
+        return self.embed_queries([query])[0]
+
+    def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed several queries in one call to the collection's embedding function.
+
+        The result can be passed to retrieve()/retrieve_batch() so the
+        queries are not embedded a second time.
+
+        Args:
+            queries: Query strings
+
+        Returns:
+            One embedding vector per query, in query order
+        """
+        # ChromaDB does not expose the function publicly; fall back to its
+        # default (the one collections use when none is configured).
+        embedding_function = getattr(self.collection, "_embedding_function", None)
+        if embedding_function is None:
+            from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+            embedding_function = DefaultEmbeddingFunction()
+        return [list(embedding) for embedding in embedding_function(queries)]
+
     def get_collection_stats(self) -> Dict:
         """
         Get statistics about the collection.